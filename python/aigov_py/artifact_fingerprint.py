@@ -0,0 +1,323 @@
+"""
+Model artifact fingerprints (``aigov.artifact_fingerprint.v1``).
+
+SHA-256 of large model files via ``mmap`` (hashlib releases the GIL, so a thread pool
+hashes several files at once, one file per worker), cached by file identity, plus cheap
+header facts (tensor count, dtypes) for safetensors and ONNX without loading weights.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+FINGERPRINT_SCHEMA = "aigov.artifact_fingerprint.v1"
+FINGERPRINT_CACHE_SCHEMA = "aigov.artifact_fingerprint_cache.v1"
+
+# Relative to the scanned root, next to the discovery cache.
+DEFAULT_FINGERPRINT_CACHE_RELPATH = Path(".govai") / "artifact-fingerprints.json"
+
+# Safetensors headers are JSON; refuse absurd lengths instead of reading them.
+_MAX_SAFETENSORS_HEADER = 100 * 1024 * 1024
+
+# onnx.TensorProto.DataType
+_ONNX_DTYPES = {
+    1: "float32",
+    2: "uint8",
+    3: "int8",
+    4: "uint16",
+    5: "int16",
+    6: "int32",
+    7: "int64",
+    8: "string",
+    9: "bool",
+    10: "float16",
+    11: "float64",
+    12: "uint32",
+    13: "uint64",
+    14: "complex64",
+    15: "complex128",
+    16: "bfloat16",
+    17: "float8e4m3fn",
+    18: "float8e4m3fnuz",
+    19: "float8e5m2",
+    20: "float8e5m2fnuz",
+    21: "uint4",
+    22: "int4",
+}
+
+
+def default_fingerprint_cache_path(root: Path) -> Path:
+    return root.resolve() / DEFAULT_FINGERPRINT_CACHE_RELPATH
+
+
+def sha256_path(path: Path) -> str:
+    """SHA-256 hex of a file, hashed from an mmap (no Python-level chunk loop)."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file (cannot be mapped)
+            return h.hexdigest()
+        except OSError:
+            for chunk in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                h.update(chunk)
+            return h.hexdigest()
+        with mm:
+            h.update(mm)
+    return h.hexdigest()
+
+
+def _tensor_summary(dtypes: Iterable[str], count: int, parameters: int | None) -> dict[str, Any]:
+    counts: dict[str, int] = {}
+    for dt in dtypes:
+        counts[dt] = counts.get(dt, 0) + 1
+    out: dict[str, Any] = {"tensor_count": count, "dtypes": dict(sorted(counts.items()))}
+    if parameters is not None:
+        out["parameter_count"] = parameters
+    return out
+
+
+def _safetensors_header(path: Path) -> dict[str, Any] | None:
+    with path.open("rb") as f:
+        raw_len = f.read(8)
+        if len(raw_len) != 8:
+            return None
+        (n,) = struct.unpack("<Q", raw_len)
+        if n > _MAX_SAFETENSORS_HEADER:
+            return None
+        header = json.loads(f.read(n).decode("utf-8"))
+    if not isinstance(header, dict):
+        return None
+    tensors = [v for k, v in header.items() if k != "__metadata__" and isinstance(v, dict)]
+    parameters = 0
+    for t in tensors:
+        n_elems = 1
+        for d in t.get("shape") or []:
+            n_elems *= int(d)
+        parameters += n_elems
+    return {"format": "safetensors", **_tensor_summary((str(t.get("dtype")) for t in tensors), len(tensors), parameters)}
+
+
+def _varint(buf: memoryview | bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift > 63:
+            raise ValueError("malformed varint")
+
+
+def _proto_fields(buf: memoryview, start: int, end: int) -> Iterable[tuple[int, int, Any]]:
+    """
+    Minimal protobuf wire reader: yields (field, wire_type, value) where value is an int
+    for varints and a (start, end) span for length-delimited fields (never copied).
+    """
+    pos = start
+    while pos < end:
+        key, pos = _varint(buf, pos)
+        field, wire = key >> 3, key & 7
+        if wire == 0:
+            value, pos = _varint(buf, pos)
+            yield field, wire, value
+        elif wire == 2:
+            n, pos = _varint(buf, pos)
+            if pos + n > end:
+                raise ValueError("truncated length-delimited field")
+            yield field, wire, (pos, pos + n)
+            pos += n
+        elif wire == 1:
+            pos += 8
+        elif wire == 5:
+            pos += 4
+        else:
+            raise ValueError(f"unsupported wire type {wire}")
+
+
+def _onnx_header(path: Path) -> dict[str, Any] | None:
+    """
+    Initializer count/dtypes from ModelProto.graph (7) -> GraphProto.initializer (5)
+    -> TensorProto dims (1) / data_type (2). raw_data spans are skipped, not read.
+    """
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+    with mm:
+        buf = memoryview(mm)
+        try:
+            dtypes: list[str] = []
+            parameters = 0
+            for field, wire, val in _proto_fields(buf, 0, len(buf)):
+                if field != 7 or wire != 2:
+                    continue
+                for g_field, g_wire, g_val in _proto_fields(buf, *val):
+                    if g_field != 5 or g_wire != 2:
+                        continue
+                    data_type = 0
+                    n_elems = 1
+                    for t_field, t_wire, t_val in _proto_fields(buf, *g_val):
+                        if t_field == 2 and t_wire == 0:
+                            data_type = t_val
+                        elif t_field == 1 and t_wire == 0:
+                            n_elems *= t_val
+                        elif t_field == 1 and t_wire == 2:
+                            pos, end = t_val
+                            while pos < end:
+                                d, pos = _varint(buf, pos)
+                                n_elems *= d
+                    dtypes.append(_ONNX_DTYPES.get(data_type, f"onnx_dtype_{data_type}"))
+                    parameters += n_elems
+            return {"format": "onnx", **_tensor_summary(dtypes, len(dtypes), parameters)}
+        finally:
+            buf.release()
+
+
+def artifact_header(path: Path) -> dict[str, Any]:
+    """Format facts readable without loading weights; never raises."""
+    name = path.name.lower()
+    try:
+        if name.endswith(".safetensors"):
+            return _safetensors_header(path) or {"format": "safetensors", "header_error": "unreadable header"}
+        if name.endswith(".onnx"):
+            return _onnx_header(path) or {"format": "onnx", "header_error": "unreadable header"}
+        with path.open("rb") as f:
+            magic = f.read(4)
+        # torch.save >= 1.6 writes a zip container; older files are raw pickle.
+        return {"format": "torch_zip" if magic.startswith(b"PK\x03\x04") else "torch_pickle"}
+    except Exception as e:
+        return {"format": path.suffix.lower().lstrip(".") or "unknown", "header_error": str(e)}
+
+
+class FingerprintCache:
+    """
+    Fingerprints keyed by file identity (st_dev, st_ino, st_size, st_mtime_ns), so a
+    re-run only hashes artifacts that were replaced or rewritten. Best-effort like
+    `DiscoveryCache`: unreadable caches start empty, failed saves are ignored.
+    """
+
+    def __init__(self, path: Path | None, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = entries or {}
+        self._seen: set[str] = set()
+
+    @staticmethod
+    def key(st: os.stat_result) -> str:
+        return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    @classmethod
+    def load(cls, path: Path) -> FingerprintCache:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(doc, dict) or doc.get("schema_version") != FINGERPRINT_CACHE_SCHEMA:
+            return cls(path)
+        entries = doc.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else None)
+
+    def get(self, st: os.stat_result) -> dict[str, Any] | None:
+        key = self.key(st)
+        hit = self._entries.get(key)
+        if not isinstance(hit, dict):
+            return None
+        self._seen.add(key)
+        return dict(hit)
+
+    def put(self, st: os.stat_result, fingerprint: dict[str, Any]) -> None:
+        key = self.key(st)
+        self._entries[key] = fingerprint
+        self._seen.add(key)
+
+    def save(self) -> None:
+        """Persist the entries used in this run (rewritten or deleted artifacts drop out)."""
+        if self.path is None:
+            return
+        entries = {k: v for k, v in self._entries.items() if k in self._seen}
+        doc = {"schema_version": FINGERPRINT_CACHE_SCHEMA, "entries": entries}
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def fingerprint_artifact(path: Path, *, cache: FingerprintCache | None = None) -> dict[str, Any]:
+    """`{"schema", "sha256", "size_bytes", "format", ...header facts}` or `{"error": ...}`."""
+    try:
+        st = path.stat()
+    except OSError as e:
+        return {"schema": FINGERPRINT_SCHEMA, "error": str(e)}
+    if cache is not None:
+        hit = cache.get(st)
+        if hit is not None:
+            return hit
+    try:
+        digest = sha256_path(path)
+    except OSError as e:
+        return {"schema": FINGERPRINT_SCHEMA, "error": str(e)}
+    fp = {"schema": FINGERPRINT_SCHEMA, "sha256": digest, "size_bytes": st.st_size, **artifact_header(path)}
+    if cache is not None:
+        cache.put(st, fp)
+    return fp
+
+
+def fingerprint_artifacts(
+    paths: Iterable[Path],
+    *,
+    cache: FingerprintCache | None = None,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Fingerprint files in parallel (one file per worker); results follow input order."""
+    items = list(paths)
+    if not items:
+        return []
+    workers = max(1, min(len(items), max_workers or os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        out = list(pool.map(lambda p: fingerprint_artifact(p, cache=cache), items))
+    if cache is not None:
+        cache.save()
+    return out
+
+
+def attach_artifact_fingerprints(
+    scan: dict[str, Any],
+    root: Path,
+    *,
+    cache_path: Path | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Discovery stage: add an `artifact` fingerprint to every `model_artifact` finding of a
+    `scan_repo` document (in place; returns `scan`).
+    """
+    root = root.resolve()
+    findings = [
+        f
+        for f in scan.get("findings") or ()
+        if isinstance(f, dict) and f.get("detected_ai_usage") == "model_artifact"
+    ]
+    rels = sorted({str(f.get("file_path")) for f in findings})
+    cache = FingerprintCache.load(cache_path) if cache_path is not None else None
+    fps = dict(zip(rels, fingerprint_artifacts((root / r for r in rels), cache=cache, max_workers=max_workers)))
+    for f in findings:
+        f["artifact"] = fps[str(f.get("file_path"))]
+    return scan
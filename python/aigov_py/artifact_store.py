@@ -0,0 +1,312 @@
+"""
+Content-addressed artifact store for per-run artifacts.
+
+Objects live under ``<repo>/.govai/cas/objects/sha256/<aa>/<hex>`` and are keyed by the
+SHA-256 of their bytes, so identical evidence, reports, audit JSON and pack files are
+stored once. Per-run paths under ``docs/`` become hardlinks to their object:
+
+- the hardlink count is the reference count: `gc` removes objects nothing links to
+- checking a ref against an expected hash is a lookup (`holds`): same inode as the
+  object, and the object's pinned mtime is intact (any in-place write bumps it), so the
+  file is not read
+
+Objects are read-only copies made by the store. Code that rewrites a ref path must
+replace it (temp file + rename, also in shell recipes) or call `break_link` first: a ref
+shares its object's inode, so writing it in place (which root can do despite mode 0444)
+would modify the shared object. When the
+store and ``docs/`` are on different filesystems linking fails and refs stay plain
+copies (still verified by hashing).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Relative to the repo root, next to the other local state.
+DEFAULT_STORE_RELPATH = Path(".govai") / "cas"
+
+# Per-run artifact directories whose files are refs into the store.
+REF_DIRS = ("docs/evidence", "docs/reports", "docs/audit", "docs/packs")
+
+# Objects are not collected until they have been unreferenced this long (seconds), so a
+# concurrent put-then-link is never raced by gc.
+DEFAULT_GC_MIN_AGE = 3600.0
+
+_CHUNK = 1024 * 1024
+# Pinned object mtime (1980-01-01, like pack entries); an in-place write changes it.
+_OBJECT_MTIME_NS = 315532800 * 1_000_000_000
+_OBJECT_MODE = 0o444
+
+
+def break_link(path: Path) -> None:
+    """Unlink `path` if it shares its inode (e.g. with a store object) before an in-place write."""
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except OSError:
+        pass
+
+
+def _copy_hashing(src: Path, dst: Path) -> str:
+    h = hashlib.sha256()
+    with src.open("rb") as f, dst.open("wb") as out:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+            out.write(chunk)
+    return h.hexdigest()
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ArtifactStore:
+    """SHA-256 keyed object store with hardlinked refs. See module docstring."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.objects = path / "objects" / "sha256"
+        self._tmp = path / "tmp"
+
+    @classmethod
+    def open(cls, repo_root: Path, *, create: bool = False) -> Optional[ArtifactStore]:
+        """Store of `repo_root`, or None if it has not been created (and `create` is False)."""
+        path = repo_root / DEFAULT_STORE_RELPATH
+        if not path.is_dir():
+            if not create:
+                return None
+            path.mkdir(parents=True, exist_ok=True)
+        return cls(path)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects / sha256[:2] / sha256
+
+    def has(self, sha256: str) -> bool:
+        return self.object_path(sha256).is_file()
+
+    def holds(self, path: Path, sha256: str) -> bool:
+        """True if `path` is a hardlink to the intact object `sha256` (no file content read)."""
+        try:
+            st = path.stat()
+            ost = self.object_path(sha256).stat()
+        except OSError:
+            return False
+        return (
+            (st.st_dev, st.st_ino) == (ost.st_dev, ost.st_ino)
+            and ost.st_mtime_ns == _OBJECT_MTIME_NS
+            and not ost.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+        )
+
+    def verify(self, path: Path, sha256: str) -> str:
+        """`"linked"` (hash lookup), `"hashed"` (content read and matched) or `"mismatch"`."""
+        if self.holds(path, sha256):
+            return "linked"
+        try:
+            return "hashed" if _sha256_file(path) == sha256 else "mismatch"
+        except OSError:
+            return "mismatch"
+
+    def _tmp_path(self, name: str) -> Path:
+        self._tmp.mkdir(parents=True, exist_ok=True)
+        return self._tmp / f"{name}.{os.getpid()}.{time.monotonic_ns()}"
+
+    def _seal(self, tmp: Path, sha256: str) -> bool:
+        """Move a complete temp object into place; False if the object already existed."""
+        os.chmod(tmp, _OBJECT_MODE)
+        os.utime(tmp, ns=(_OBJECT_MTIME_NS, _OBJECT_MTIME_NS))
+        obj = self.object_path(sha256)
+        if obj.exists():
+            tmp.unlink()
+            return False
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, obj)
+        return True
+
+    def put_bytes(self, data: bytes) -> str:
+        sha256 = hashlib.sha256(data).hexdigest()
+        if not self.has(sha256):
+            tmp = self._tmp_path("put")
+            tmp.write_bytes(data)
+            self._seal(tmp, sha256)
+        return sha256
+
+    def put_file(self, src: Path) -> str:
+        """Copy `src` into the store (one read: hashed while copied); returns its sha256."""
+        tmp = self._tmp_path("put")
+        try:
+            sha256 = _copy_hashing(src, tmp)
+            self._seal(tmp, sha256)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return sha256
+
+    def link(self, sha256: str, dest: Path) -> bool:
+        """
+        Make `dest` a hardlink to object `sha256` (atomic replace). Falls back to a copy when
+        linking is not possible; returns whether `dest` is a link.
+        """
+        obj = self.object_path(sha256)
+        try:
+            if os.path.samefile(obj, dest):
+                # rename() onto another link of the same inode is a no-op; nothing to do.
+                return True
+        except OSError:
+            pass
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.lnk")
+        break_link(tmp)
+        if tmp.exists():
+            tmp.unlink()
+        try:
+            os.link(obj, tmp)
+            linked = True
+        except OSError:
+            shutil.copyfile(obj, tmp)
+            linked = False
+        os.replace(tmp, dest)
+        return linked
+
+    def ingest(self, path: Path, sha256: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Copy `path` into the store and turn it into a ref. `sha256`, the file's hash when the
+        caller already knows it, is trusted (no re-hash): an existing object is linked without
+        reading the file, a new one is sealed from a single hashing copy. Returns
+        `{"sha256", "stored", "linked"}` (`stored`: a new object was created; otherwise the
+        file was deduplicated).
+        """
+        if sha256 is not None:
+            if self.holds(path, sha256):
+                return {"sha256": sha256, "stored": False, "linked": True}
+            try:
+                if self.object_path(sha256).stat().st_size != path.stat().st_size:
+                    sha256 = None
+            except OSError:
+                pass
+        if sha256 is None:
+            sha256 = _sha256_file(path)
+            if self.holds(path, sha256):
+                return {"sha256": sha256, "stored": False, "linked": True}
+        stored = False
+        if not self.has(sha256):
+            # The object is always the store's own copy, never the caller's inode, so a
+            # writer still holding `path` open cannot reach it.
+            tmp = self._tmp_path("ingest")
+            try:
+                sha256 = _copy_hashing(path, tmp)
+                stored = self._seal(tmp, sha256)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+        return {"sha256": sha256, "stored": stored, "linked": self.link(sha256, path)}
+
+    def iter_objects(self) -> Iterator[Path]:
+        if not self.objects.is_dir():
+            return
+        for sub in sorted(self.objects.iterdir()):
+            if sub.is_dir():
+                yield from sorted(p for p in sub.iterdir() if p.is_file())
+
+    def fsck(self) -> List[str]:
+        """Re-hash every object; returns the names of objects whose bytes no longer match."""
+        return [p.name for p in self.iter_objects() if _sha256_file(p) != p.name]
+
+    def gc(self, *, min_age: float = DEFAULT_GC_MIN_AGE, dry_run: bool = False) -> Dict[str, Any]:
+        """Remove objects no ref links to (link count 1) for at least `min_age` seconds."""
+        cutoff = time.time() - min_age
+        objects = removed = freed = 0
+        for p in self.iter_objects():
+            objects += 1
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            if st.st_nlink > 1 or st.st_ctime > cutoff:
+                continue
+            removed += 1
+            freed += st.st_size
+            if not dry_run:
+                os.chmod(p, 0o644)
+                p.unlink()
+        if not dry_run and self._tmp.is_dir():
+            for p in self._tmp.iterdir():
+                try:
+                    if p.stat().st_mtime <= cutoff:
+                        p.unlink()
+                except OSError:
+                    pass
+        return {"objects": objects, "removed": removed, "bytes_freed": freed, "dry_run": dry_run}
+
+
+def iter_ref_paths(repo_root: Path) -> Iterator[Path]:
+    """Files under `REF_DIRS` (one level of subdirectories, e.g. pack staging dirs)."""
+    for rel in REF_DIRS:
+        base = repo_root / rel
+        if not base.is_dir():
+            continue
+        for p in sorted(base.iterdir()):
+            if p.is_dir():
+                yield from sorted(c for c in p.iterdir() if c.is_file() and not c.name.startswith("."))
+            elif p.is_file() and not p.name.startswith(".") and not p.name.endswith(".tmp"):
+                yield p
+
+
+def ingest_refs(store: ArtifactStore, repo_root: Path) -> Dict[str, Any]:
+    """Ingest every ref path of `repo_root`; returns counts and the bytes deduplicated."""
+    files = stored = linked = deduped = 0
+    for p in iter_ref_paths(repo_root):
+        r = store.ingest(p)
+        files += 1
+        stored += int(r["stored"])
+        linked += int(r["linked"])
+        if not r["stored"]:
+            deduped += p.stat().st_size
+    return {"files": files, "stored": stored, "linked": linked, "deduplicated_bytes": deduped}
+
+
+def verify_runs(store: ArtifactStore, repo_root: Path, run_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Check each run's evidence, report and pack against the hashes recorded in its audit JSON
+    and pack digest sidecar. Refs still linked to their object are checked by lookup only.
+    """
+    from aigov_py.pack_writer import digest_sidecar_path
+
+    audit_dir = repo_root / "docs" / "audit"
+    if run_ids is None:
+        run_ids = sorted(p.stem for p in audit_dir.glob("*.json")) if audit_dir.is_dir() else []
+    out: List[Dict[str, Any]] = []
+    for run_id in run_ids:
+        checks: Dict[str, str] = {}
+        try:
+            audit = json.loads((audit_dir / f"{run_id}.json").read_text(encoding="utf-8"))
+            hashes = audit.get("hashes") if isinstance(audit, dict) else None
+        except (OSError, ValueError):
+            hashes = None
+        if not isinstance(hashes, dict):
+            out.append({"run_id": run_id, "ok": False, "error": "audit JSON without hashes"})
+            continue
+        targets = [
+            ("evidence", repo_root / "docs" / "evidence" / f"{run_id}.json", hashes.get("evidence_sha256")),
+            ("report", repo_root / "docs" / "reports" / f"{run_id}.md", hashes.get("report_sha256")),
+        ]
+        zip_path = repo_root / "docs" / "packs" / f"{run_id}.zip"
+        try:
+            side = json.loads(digest_sidecar_path(zip_path).read_text(encoding="utf-8"))
+            targets.append(("pack", zip_path, side.get("sha256")))
+        except (OSError, ValueError, AttributeError):
+            pass
+        for name, path, sha256 in targets:
+            checks[name] = store.verify(path, sha256) if isinstance(sha256, str) else "mismatch"
+        out.append({"run_id": run_id, "ok": "mismatch" not in checks.values(), "checks": checks})
+    return out
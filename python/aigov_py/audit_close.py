@@ -6,6 +6,8 @@ import sys
 from pathlib import Path
 from typing import Dict
 
+from aigov_py.artifact_store import break_link
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -55,6 +57,7 @@ def main(argv: list[str]) -> None:
         "audit_sha256": audit_sha256,
     }
 
+    break_link(audit_out)
     audit_out.write_text(json.dumps(audit_payload, indent=2), encoding="utf-8")
     print(f"saved {audit_out}")
 
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+from aigov_py.artifact_fingerprint import sha256_path
+from aigov_py.artifact_store import break_link
 from aigov_py.canonical_json import canonical_bytes
 
 
@@ -86,7 +88,7 @@ def main() -> None:
     if isinstance(artifact_path, str) and artifact_path.strip():
         artifact_fs_path = repo_root / artifact_path
         if artifact_fs_path.exists():
-            model_artifact_sha256 = _sha256_hex(_read_bytes(artifact_fs_path))
+            model_artifact_sha256 = sha256_path(artifact_fs_path)
         else:
             # keep None, but do not fail hard
             model_artifact_sha256 = None
@@ -110,6 +112,7 @@ def main() -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     out_path = out_dir / f"{run_id}.json"
+    break_link(out_path)
     out_path.write_bytes(canonical_bytes(ao.to_dict()))
 
     print(f"saved {out_path}")
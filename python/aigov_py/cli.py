@@ -25,15 +25,30 @@ from govai import (
 
 from aigov_py import cli_config
 from aigov_py import cli_exit
+from aigov_py import artifact_store
+from aigov_py import pack_verify
 from aigov_py import evidence_artifact_gate as eag
 from aigov_py.client import GovaiClient
-from aigov_py.discovery_scan import scan_repo
+from aigov_py.artifact_fingerprint import (
+    FingerprintCache,
+    attach_artifact_fingerprints,
+    default_fingerprint_cache_path,
+    fingerprint_artifact,
+)
+from aigov_py.discovery_cache import default_cache_path
+from aigov_py.discovery_scan import iter_scan, merge_scans, scan_repo
+from aigov_py.discovery_watch import DEFAULT_POLL_INTERVAL, iter_watch
 from aigov_py.discovery_policy_mapping import (
     coerce_discovery_signals,
     discovery_required_evidence_additions,
     triggered_by_discovery,
 )
-from aigov_py.policy_loader import load_policy_module, policy_identity, required_evidence_from_policy
+from aigov_py.policy_loader import (
+    default_policy_cache_dir,
+    load_policy_module,
+    policy_identity,
+    required_evidence_from_policy,
+)
 from aigov_py import export_bundle as export_bundle_mod
 from aigov_py import fetch_bundle_from_govai
 from aigov_py.prototype_domain import (
@@ -200,6 +215,26 @@ def _signal_from_scan(scan_result: Any, key: str) -> bool:
     return bool(getattr(scan_result, key, False))
 
 
+def _parse_shard(raw: str) -> tuple[int, int]:
+    index, sep, count = str(raw).strip().partition("/")
+    try:
+        if not sep:
+            raise ValueError
+        i, n = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"--shard must look like i/N (e.g. 1/4), got {raw!r}") from None
+    if n < 1 or not 1 <= i <= n:
+        raise ValueError(f"--shard {raw}: expected 1 <= i <= N")
+    return i, n
+
+
+def _discovery_cache_kwargs(ns: argparse.Namespace, scan_path: Path) -> dict[str, Any]:
+    if bool(getattr(ns, "no_cache", False)):
+        return {}
+    ref = (getattr(ns, "changed_since", None) or "").strip() or None
+    return {"cache_path": default_cache_path(scan_path), "changed_since": ref}
+
+
 def _demo_event_id(kind: str, run_id: str) -> str:
     return f"demo_{kind}_{run_id}"
 
@@ -1446,6 +1481,18 @@ def build_parser() -> GovaiArgumentParser:
     s_verify = sub.add_parser("verify", help="Verify local docs/* artifacts and governance hash chain.")
     s_verify.add_argument("--run-id", default=None, help="Run UUID (fallback: env GOVAI_RUN_ID or RUN_ID).")
     s_verify.add_argument("--json", action="store_true", help="Machine-readable output on stdout.")
+    s_verify.add_argument(
+        "--all",
+        action="store_true",
+        help="Verify every run with docs/evidence/<run_id>.json (one JSON document; one /verify-log call).",
+    )
+    s_verify.add_argument(
+        "--run-ids-file",
+        type=Path,
+        default=None,
+        help="Verify the run ids listed in this file, one per line (one JSON document; one /verify-log call).",
+    )
+    s_verify.add_argument("--workers", type=int, default=None, help="Threads reading artifacts in bulk mode.")
 
     s_fetch = sub.add_parser("fetch-bundle", help="GET /bundle + /bundle-hash → docs/evidence/<run_id>.json")
     s_fetch.add_argument("--run-id", default=None, help="Run UUID (fallback: env GOVAI_RUN_ID or RUN_ID).")
@@ -1532,6 +1579,17 @@ def build_parser() -> GovaiArgumentParser:
     s_discover.add_argument("--openai", default=None, help="Override scan result: true|false")
     s_discover.add_argument("--transformers", default=None, help="Override scan result: true|false")
     s_discover.add_argument("--model-artifacts", default=None, help="Override scan result: true|false")
+    s_discover.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the incremental discovery cache (<path>/.govai/discovery-cache.json).",
+    )
+    s_discover.add_argument(
+        "--changed-since",
+        default=None,
+        metavar="GIT_REF",
+        help="Reuse cached results computed at GIT_REF without re-checking files git reports unchanged since it.",
+    )
     s_discover.add_argument(
         "--event-id",
         default=None,
@@ -1562,11 +1620,36 @@ def build_parser() -> GovaiArgumentParser:
         action="store_true",
         help="Disable git history/change summary enrichment.",
     )
+    s_discovery_scan.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the incremental discovery cache (<path>/.govai/discovery-cache.json).",
+    )
+    s_discovery_scan.add_argument(
+        "--changed-since",
+        default=None,
+        metavar="GIT_REF",
+        help="Reuse cached results computed at GIT_REF without re-checking files git reports unchanged since it.",
+    )
+    s_discovery_scan.add_argument(
+        "--fingerprint-artifacts",
+        action="store_true",
+        help="Add sha256 + header facts (format, tensor count, dtypes) to model_artifact findings "
+        "(hashed in parallel; cached in <path>/.govai/artifact-fingerprints.json unless --no-cache).",
+    )
+    s_discovery_scan.add_argument(
+        "--shard",
+        default=None,
+        metavar="i/N",
+        help="Scan only shard i of N (files partitioned by a stable hash of their path); "
+        "combine outputs with `govai discovery merge`.",
+    )
     s_discovery_scan.add_argument(
         "--format",
         default="json",
-        choices=["json", "text"],
-        help="Output format (default: json).",
+        choices=["json", "text", "ndjson"],
+        help="Output format (default: json). `ndjson` streams one compact JSON record per finding "
+        'as files are scanned, then a final {"record": "summary", ...} with the aggregate flags.',
     )
     s_discovery_scan.add_argument(
         "--submit",
@@ -1590,17 +1673,195 @@ def build_parser() -> GovaiArgumentParser:
         help="Evidence system label (default: env AIGOV_SYSTEM or govai_cli).",
     )
 
+    s_discovery_merge = s_discovery_sub.add_parser(
+        "merge",
+        help="Merge `discovery scan --shard i/N` outputs into the full-scan document (optionally submit it).",
+    )
+    s_discovery_merge.add_argument(
+        "shard_files",
+        nargs="+",
+        type=Path,
+        metavar="SHARD_JSON",
+        help="JSON output of each `govai discovery scan --shard i/N` run (all N shards).",
+    )
+    s_discovery_merge.add_argument(
+        "--format",
+        default="json",
+        choices=["json", "text"],
+        help="Output format (default: json).",
+    )
+    s_discovery_merge.add_argument(
+        "--submit",
+        action="store_true",
+        help="Submit `ai_discovery_reported` evidence event for the merged scan to hosted backend.",
+    )
+    s_discovery_merge.add_argument("--run-id", default=None, help="Run UUID (required with --submit).")
+    s_discovery_merge.add_argument(
+        "--event-id",
+        default=None,
+        help="Optional event_id override (default: ai_discovery_reported_<run_id>).",
+    )
+    s_discovery_merge.add_argument(
+        "--actor",
+        default=os.environ.get("AIGOV_ACTOR") or "govai_cli",
+        help="Evidence actor label (default: env AIGOV_ACTOR or govai_cli).",
+    )
+    s_discovery_merge.add_argument(
+        "--system",
+        default=os.environ.get("AIGOV_SYSTEM") or "govai_cli",
+        help="Evidence system label (default: env AIGOV_SYSTEM or govai_cli).",
+    )
+
+    s_discovery_watch = s_discovery_sub.add_parser(
+        "watch",
+        help="Watch a repository and print discovery signal changes as files are edited (local dev loop).",
+    )
+    s_discovery_watch.add_argument("--path", default=".", help="Path to watch (default: current directory).")
+    s_discovery_watch.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll file stats instead of using inotify (inotify is used on Linux when available).",
+    )
+    s_discovery_watch.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Polling interval in seconds (default: {DEFAULT_POLL_INTERVAL}).",
+    )
+    s_discovery_watch.add_argument(
+        "--format",
+        default="text",
+        choices=["text", "ndjson"],
+        help="Output format (default: text). `ndjson` prints one compact JSON record per change.",
+    )
+
+    s_discovery_pii = s_discovery_sub.add_parser(
+        "pii",
+        help="Profile CSV/Parquet files for PII by sampling rows (per-file, per-column results).",
+    )
+    s_discovery_pii.add_argument("--path", default=".", help="File or directory to profile (default: current directory).")
+    s_discovery_pii.add_argument(
+        "--sample-rows",
+        type=int,
+        default=None,
+        help="Maximum rows sampled per file (default: the profiler's DEFAULT_SAMPLE_ROWS).",
+    )
+    s_discovery_pii.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Sampling time budget per file in seconds (default: the profiler's DEFAULT_TIME_BUDGET).",
+    )
+    s_discovery_pii.add_argument(
+        "--min-ratio",
+        type=float,
+        default=None,
+        help="Share of sampled values that must match for a column to be flagged "
+        "(default: the profiler's DEFAULT_MIN_RATIO).",
+    )
+    s_discovery_pii.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    s_discovery_pii.add_argument(
+        "--format",
+        default="json",
+        choices=["json", "text"],
+        help="Output format (default: json).",
+    )
+
+    s_dataset = sub.add_parser("dataset", help="Dataset governance helpers.")
+    s_dataset_sub = s_dataset.add_subparsers(dest="dataset_cmd", required=True)
+    s_dataset_fp = s_dataset_sub.add_parser(
+        "fingerprint",
+        help="Fingerprint a CSV / .npy / Parquet dataset for `data_registered` evidence.",
+    )
+    s_dataset_fp.add_argument("path", type=Path, help="Dataset file (.csv, .npy, .parquet).")
+    s_dataset_fp.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Order-insensitive fingerprint (re-shuffled copies of the same rows match).",
+    )
+    s_dataset_fp.add_argument("--workers", type=int, default=None, help="Hashing threads (default: CPU count).")
+
+    s_store = sub.add_parser(
+        "store",
+        help="Content-addressed artifact store (.govai/cas): docs/ run artifacts as deduplicated hardlinks.",
+    )
+    s_store_sub = s_store.add_subparsers(dest="store_cmd", required=True)
+    s_store_ingest = s_store_sub.add_parser(
+        "ingest",
+        help="Create the store if needed and turn docs/{evidence,reports,audit,packs} files into store refs.",
+    )
+    s_store_verify = s_store_sub.add_parser(
+        "verify",
+        help="Check run artifacts against audit/pack hashes (hash lookup for linked refs).",
+    )
+    s_store_verify.add_argument("--run-id", action="append", default=None, help="Run to check (repeatable; default: all).")
+    s_store_verify.add_argument("--objects", action="store_true", help="Also re-hash every stored object.")
+    s_store_gc = s_store_sub.add_parser("gc", help="Remove stored objects no docs/ file links to.")
+    s_store_gc.add_argument(
+        "--min-age",
+        type=float,
+        default=3600.0,
+        help="Only remove objects unreferenced for at least this many seconds (default: 3600).",
+    )
+    s_store_gc.add_argument("--dry-run", action="store_true", help="Report what would be removed.")
+    for sp in (s_store_ingest, s_store_verify, s_store_gc):
+        sp.add_argument("--root", type=Path, default=Path("."), help="Repository root (default: current directory).")
+
+    s_pack = sub.add_parser("pack", help="Evidence pack utilities (docs/packs/<run_id>.zip or staging directories).")
+    s_pack_sub = s_pack.add_subparsers(dest="pack_cmd", required=True)
+    s_pack_verify = s_pack_sub.add_parser(
+        "verify",
+        help="Check each pack's manifest.json sha256 and byte counts (zip members are hashed in place).",
+    )
+    s_pack_verify.add_argument("path", type=Path, help="A pack zip, a pack directory, or a directory of packs.")
+    s_pack_verify.add_argument("--workers", type=int, default=None, help="Hashing threads (default: CPU count + 4).")
+
     s_explain = sub.add_parser(
         "explain",
         help="Explain verdict + requirements + blocked reasons (CI-friendly).",
     )
     s_explain.add_argument("--run-id", default=None, help="Run UUID (fallback: env GOVAI_RUN_ID or RUN_ID).")
 
-    s_report = sub.add_parser("report", help="Render docs/reports/<run_id>.md from evidence JSON.")
+    s_report = sub.add_parser("report", help="Render docs/reports/<run_id>.md from evidence JSON (or many runs).")
     s_report.add_argument("--run-id", default=None, help="Run UUID (fallback: env GOVAI_RUN_ID or RUN_ID).")
+    s_report.add_argument(
+        "--all",
+        action="store_true",
+        help="Render a report for every docs/evidence/<run_id>.json (parallel).",
+    )
+    s_report.add_argument(
+        "--run-ids-file",
+        type=Path,
+        default=None,
+        help="Render reports for the run ids listed in this file, one per line (parallel).",
+    )
+    s_report.add_argument("--workers", type=int, default=None, help="Worker processes for bulk rendering (default: CPU count).")
+    s_report.add_argument(
+        "--force",
+        action="store_true",
+        help="Bulk mode: re-render reports that already embed the current bundle_sha256 (e.g. after a template change).",
+    )
 
-    s_export = sub.add_parser("export-bundle", help="Write docs/audit + docs/packs zip for a run.")
+    s_export = sub.add_parser("export-bundle", help="Write docs/audit + docs/packs zip for a run (or many runs).")
     s_export.add_argument("--run-id", default=None, help="Run UUID (fallback: env GOVAI_RUN_ID or RUN_ID).")
+    s_export.add_argument(
+        "--all",
+        action="store_true",
+        help="Export every run with docs/evidence/<run_id>.json (parallel; writes docs/packs/index.json).",
+    )
+    s_export.add_argument(
+        "--run-ids-file",
+        type=Path,
+        default=None,
+        help="Export the run ids listed in this file, one per line (parallel; writes docs/packs/index.json).",
+    )
+    s_export.add_argument("--workers", type=int, default=None, help="Worker processes for bulk export (default: CPU count).")
+    s_export.add_argument(
+        "--max-in-flight-mb",
+        type=int,
+        default=512,
+        help="Bulk export: cap on evidence + report MB being processed at once (default: 512).",
+    )
 
     s_export_run = sub.add_parser(
         "export-run",
@@ -1751,6 +2012,45 @@ def build_parser() -> GovaiArgumentParser:
         action="store_true",
         help="Print machine-readable JSON (policy identity + required_evidence).",
     )
+    s_policy_compile.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the compiled policy cache (~/.cache/govai/policy-cache or GOVAI_POLICY_CACHE_DIR).",
+    )
+
+    s_policy_eval = s_policy_sub.add_parser(
+        "evaluate",
+        help="Evaluate a policy module against many local runs: per-requirement failure counts and affected runs.",
+    )
+    s_policy_eval.add_argument("--path", required=True, help="Path to policy module YAML.")
+    s_policy_eval.add_argument(
+        "--all", action="store_true", help="Evaluate every run with <root>/docs/evidence/<run_id>.json."
+    )
+    s_policy_eval.add_argument(
+        "--run-ids-file", type=Path, default=None, help="Evaluate the run ids listed in this file, one per line."
+    )
+    s_policy_eval.add_argument("--root", type=Path, default=Path("."), help="Repository root (default: current directory).")
+    s_policy_eval.add_argument("--workers", type=int, default=None, help="Threads reading evidence bundles.")
+    s_policy_eval.add_argument(
+        "--max-listed", type=int, default=None, help="List at most this many run ids per requirement (counts are exact)."
+    )
+
+    s_policy_impact = s_policy_sub.add_parser(
+        "impact",
+        help="Runs in an audit ledger whose verdict changes between two policies (server policy JSON or module YAML).",
+    )
+    s_policy_impact.add_argument("--old", type=Path, required=True, help="Current policy (rust/policy.*.json or module YAML).")
+    s_policy_impact.add_argument("--new", type=Path, required=True, help="Candidate policy (rust/policy.*.json or module YAML).")
+    s_policy_impact.add_argument("--ledger", type=Path, required=True, help="Audit ledger JSONL (e.g. audit_log.jsonl).")
+    s_policy_impact.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Per-run ledger index to reuse and update (default: one file per ledger under $XDG_CACHE_HOME/govai/ledger-index/).",
+    )
+    s_policy_impact.add_argument("--no-index", action="store_true", help="Scan the whole ledger; do not read or write an index.")
+    s_policy_impact.add_argument("--workers", type=int, default=None, help="Processes scanning the ledger (default: CPU count).")
+    s_policy_impact.add_argument("--max-listed", type=int, default=None, help="List at most this many changed runs.")
 
     return p
 
@@ -1773,7 +2073,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             print("error: --path is required", file=sys.stderr)
             return cli_exit.EX_USAGE
         try:
-            pol = load_policy_module(raw_path)
+            cache_dir = None if args.no_cache else default_policy_cache_dir()
+            pol = load_policy_module(raw_path, cache_dir=cache_dir)
             req = sorted(required_evidence_from_policy(pol))
         except ValueError as e:
             print(f"error: invalid policy module: {e}", file=sys.stderr)
@@ -1795,6 +2096,58 @@ def main(argv: Sequence[str] | None = None) -> int:
                 print(item)
         return cli_exit.EX_OK
 
+    if args.cmd == "policy" and getattr(args, "policy_cmd", None) == "evaluate":
+        from aigov_py import policy_batch_eval
+
+        if args.all == (args.run_ids_file is not None):
+            print("pass exactly one of --all or --run-ids-file", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        eval_root = Path(args.root).expanduser()
+        try:
+            pol = load_policy_module(args.path, cache_dir=default_policy_cache_dir())
+            ids = (
+                export_bundle_mod.list_run_ids(eval_root)
+                if args.all
+                else export_bundle_mod.read_run_ids_file(args.run_ids_file)
+            )
+        except ValueError as e:
+            print(f"error: invalid policy module: {e}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        except OSError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        run_ids, evidence, errors = policy_batch_eval.load_run_evidence(eval_root, ids, max_workers=args.workers)
+        result = policy_batch_eval.evaluate_runs(pol, run_ids, evidence)
+        _print_json({**result.summary(max_listed=args.max_listed), "errors": errors}, compact=args.compact_json)
+        return cli_exit.EX_OK
+
+    if args.cmd == "policy" and getattr(args, "policy_cmd", None) == "impact":
+        from aigov_py import policy_impact
+
+        for label, pth in (("--old", args.old), ("--new", args.new), ("--ledger", args.ledger)):
+            if not Path(pth).is_file():
+                print(f"error: {label} file not found: {pth}", file=sys.stderr)
+                return cli_exit.EX_USAGE
+        index_path = None if args.no_index else (args.index or policy_impact.default_ledger_index_path(args.ledger))
+        try:
+            out = policy_impact.policy_impact(
+                args.old,
+                args.new,
+                args.ledger,
+                index_path=index_path,
+                max_workers=args.workers,
+                max_listed=args.max_listed,
+                cache_dir=default_policy_cache_dir(),
+            )
+        except ValueError as e:
+            print(f"error: invalid policy: {e}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        except OSError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return cli_exit.EX_ERR
+        _print_json(out, compact=args.compact_json)
+        return cli_exit.EX_OK
+
     if args.cmd == "experiment":
         from aigov_py.experiments import aggregate as exp_aggregate
         from aigov_py.experiments import artifact_bound_enforcement as exp_abe
@@ -1998,8 +2351,18 @@ def main(argv: Sequence[str] | None = None) -> int:
         summary_verdict = "ERROR"
         summary_codes: list[str] = ["INTEGRATION_ERROR"]
         summary_next_action = "Fix the reported issue, then rerun the same command."
-        run_id = _resolve_run_id(args)
-        if not run_id:
+        bulk = args.all or args.run_ids_file is not None
+        if bulk:
+            if args.all and args.run_ids_file is not None:
+                print("use either --all or --run-ids-file", file=sys.stderr)
+                return cli_exit.EX_USAGE
+            try:
+                ids = export_bundle_mod.list_run_ids() if args.all else export_bundle_mod.read_run_ids_file(args.run_ids_file)
+            except OSError as e:
+                print(f"cannot read run ids: {e}", file=sys.stderr)
+                return cli_exit.EX_USAGE
+        run_id = "" if bulk else _resolve_run_id(args)
+        if not bulk and not run_id:
             print("run id required: pass --run-id or set GOVAI_RUN_ID (or RUN_ID)", file=sys.stderr)
             _print_final_summary(
                 verdict="ERROR",
@@ -2013,7 +2376,12 @@ def main(argv: Sequence[str] | None = None) -> int:
         try:
             os.environ["AIGOV_AUDIT_URL"] = audit_url
             os.environ["AIGOV_AUDIT_ENDPOINT"] = audit_url
-            rc = verify_mod.verify(run_id, as_json=args.json)
+            if bulk:
+                doc = verify_mod.verify_many(ids, max_workers=args.workers)
+                _print_json(doc, compact=args.compact_json)
+                rc = cli_exit.EX_OK if doc["verdict"] == "VALID" else cli_exit.EX_INVALID
+            else:
+                rc = verify_mod.verify(run_id, as_json=args.json)
             if rc == cli_exit.EX_OK:
                 summary_verdict = "VALID"
                 summary_codes = []
@@ -2311,7 +2679,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             return cli_exit.EX_USAGE
 
         try:
-            scan = scan_repo(scan_path, include_history=True)
+            scan = scan_repo(scan_path, include_history=True, **_discovery_cache_kwargs(args, scan_path))
             openai_override = _parse_bool_override(getattr(args, "openai", None), name="--openai")
             transformers_override = _parse_bool_override(getattr(args, "transformers", None), name="--transformers")
             model_artifacts_override = _parse_bool_override(
@@ -2403,21 +2771,224 @@ def main(argv: Sequence[str] | None = None) -> int:
         _print_json(out, compact=True)
         return cli_exit.EX_OK
 
-    if args.cmd == "discovery" and getattr(args, "discovery_cmd", None) == "scan":
-        scan_path = Path(getattr(args, "path", ".")).expanduser()
-        if not scan_path.exists():
-            print(f"scan path does not exist: {scan_path}", file=sys.stderr)
-            return cli_exit.EX_USAGE
+    if args.cmd == "dataset" and getattr(args, "dataset_cmd", None) == "fingerprint":
+        # numpy-backed; imported on use to keep CLI startup light
+        from aigov_py.dataset_fingerprint import data_registered_fields, fingerprint_dataset
 
-        include_history = not bool(getattr(args, "no_history", False))
         try:
-            scan = scan_repo(scan_path, include_history=include_history)
-        except Exception as e:
+            fp = fingerprint_dataset(args.path, order_insensitive=bool(args.unordered), max_workers=args.workers)
+        except ValueError as e:
             print(str(e), file=sys.stderr)
+            return cli_exit.EX_USAGE
+        except Exception as e:
+            print(f"cannot fingerprint {args.path}: {e}", file=sys.stderr)
             return cli_exit.EX_ERR
+        _print_json(
+            {"ok": True, "fingerprint": fp, "data_registered": data_registered_fields(fp)},
+            compact=args.compact_json,
+        )
+        return cli_exit.EX_OK
+
+    if args.cmd == "store":
+        store_root = Path(args.root).expanduser().resolve()
+        store = artifact_store.ArtifactStore.open(store_root, create=args.store_cmd == "ingest")
+        if store is None:
+            print(f"no artifact store under {store_root} (run `govai store ingest` first)", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        if args.store_cmd == "ingest":
+            _print_json({"ok": True, **artifact_store.ingest_refs(store, store_root)}, compact=args.compact_json)
+            return cli_exit.EX_OK
+        if args.store_cmd == "gc":
+            if args.min_age < 0:
+                print("--min-age must be >= 0", file=sys.stderr)
+                return cli_exit.EX_USAGE
+            _print_json({"ok": True, **store.gc(min_age=args.min_age, dry_run=args.dry_run)}, compact=args.compact_json)
+            return cli_exit.EX_OK
+        runs = artifact_store.verify_runs(store, store_root, args.run_id)
+        out: dict[str, Any] = {"ok": all(r["ok"] for r in runs), "runs": runs}
+        if args.objects:
+            out["corrupt_objects"] = store.fsck()
+            out["ok"] = out["ok"] and not out["corrupt_objects"]
+        _print_json(out, compact=args.compact_json)
+        return cli_exit.EX_OK if out["ok"] else cli_exit.EX_ERR
+
+    if args.cmd == "pack":
+        pack_path = Path(args.path).expanduser()
+        if not pack_path.exists():
+            print(f"path does not exist: {pack_path}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        summary = pack_verify.verify_packs(pack_path, max_workers=args.workers)
+        _print_json(summary, compact=args.compact_json)
+        return cli_exit.EX_OK if summary["ok"] else cli_exit.EX_ERR
+
+    if args.cmd == "discovery" and getattr(args, "discovery_cmd", None) == "pii":
+        # numpy-backed; imported on use to keep CLI startup light
+        from aigov_py.pii_profiler import (
+            DEFAULT_MIN_RATIO,
+            DEFAULT_SAMPLE_ROWS,
+            DEFAULT_TIME_BUDGET,
+            PII_PROFILE_SCHEMA,
+            profile_paths,
+        )
+
+        sample_rows = DEFAULT_SAMPLE_ROWS if args.sample_rows is None else args.sample_rows
+        time_budget = DEFAULT_TIME_BUDGET if args.time_budget is None else args.time_budget
+        min_ratio = DEFAULT_MIN_RATIO if args.min_ratio is None else args.min_ratio
+        pii_path = Path(getattr(args, "path", ".")).expanduser()
+        if not pii_path.exists():
+            print(f"path does not exist: {pii_path}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        if sample_rows < 1 or time_budget <= 0 or not 0 < min_ratio <= 1:
+            print("--sample-rows must be >= 1, --time-budget > 0 and --min-ratio in (0, 1]", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        files = profile_paths(
+            pii_path,
+            sample_rows=sample_rows,
+            time_budget=time_budget,
+            min_ratio=min_ratio,
+            max_workers=args.workers,
+        )
+        if args.format == "text":
+            flagged = [f for f in files if f.get("pii_possible")]
+            print(f"PII profile: path={pii_path.resolve()} files={len(files)} flagged={len(flagged)}", file=sys.stderr)
+            for f in files:
+                if "error" in f:
+                    print(f"! {f['file_path']}: {f['error']}", file=sys.stderr)
+                    continue
+                for c in f["columns"]:
+                    if c["pii_possible"]:
+                        kinds = ",".join(c["pii_types"] + (["header"] if c["header_match"] else []))
+                        print(f"- {f['file_path']} column={c['name']} pii={kinds}", file=sys.stderr)
+        else:
+            _print_json(
+                {"ok": True, "pii_profile": {"schema": PII_PROFILE_SCHEMA, "root": str(pii_path.resolve()), "files": files}},
+                compact=args.compact_json,
+            )
+        return cli_exit.EX_OK
+
+    if args.cmd == "discovery" and getattr(args, "discovery_cmd", None) == "watch":
+        watch_path = Path(getattr(args, "path", ".")).expanduser()
+        if not watch_path.is_dir():
+            print(f"watch path is not a directory: {watch_path}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        if args.interval <= 0:
+            print("--interval must be positive", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        ndjson = args.format == "ndjson"
+        try:
+            for rec in iter_watch(watch_path, poll=bool(args.poll), interval=args.interval):
+                if ndjson:
+                    print(json.dumps(rec, ensure_ascii=False, separators=(",", ":")), flush=True)
+                elif rec["record"] == "summary":
+                    print(
+                        f"watching {rec['root']} ({rec['source']}): ai_detected={rec['ai_detected']} "
+                        f"llm_used={rec['llm_used']} findings={rec['findings_count']}",
+                        flush=True,
+                    )
+                else:
+                    for key, change in rec["changes"].items():
+                        print(f"{key}: {change['from']} -> {change['to']}", flush=True)
+                    print(f"  ({len(rec['files'])} file(s) rescanned in {rec['elapsed_ms']} ms)", flush=True)
+        except KeyboardInterrupt:
+            return cli_exit.EX_OK
+        return cli_exit.EX_OK
 
+    if args.cmd == "discovery" and getattr(args, "discovery_cmd", None) in ("scan", "merge"):
         fmt = (getattr(args, "format", "json") or "json").strip().lower()
-        if fmt == "text":
+        if args.discovery_cmd == "merge":
+            docs: list[dict[str, Any]] = []
+            for shard_file in getattr(args, "shard_files", []):
+                try:
+                    doc = json.loads(Path(shard_file).read_text(encoding="utf-8"))
+                except (OSError, ValueError) as e:
+                    print(f"cannot read shard output {shard_file}: {e}", file=sys.stderr)
+                    return cli_exit.EX_USAGE
+                # Accept the `discovery scan` JSON envelope or a bare scan document.
+                docs.append(doc.get("scan") if isinstance(doc, dict) and "scan" in doc else doc)
+            try:
+                scan = merge_scans(docs)
+            except ValueError as e:
+                print(f"error: cannot merge discovery shards: {e}", file=sys.stderr)
+                return cli_exit.EX_USAGE
+            scan_path = Path(str(scan.get("root") or "."))
+        else:
+            scan_path = Path(getattr(args, "path", ".")).expanduser()
+            if not scan_path.exists():
+                print(f"scan path does not exist: {scan_path}", file=sys.stderr)
+                return cli_exit.EX_USAGE
+
+            shard: tuple[int, int] | None = None
+            if getattr(args, "shard", None):
+                if bool(getattr(args, "submit", False)):
+                    print("--submit cannot be used with --shard: merge the shards, then submit", file=sys.stderr)
+                    return cli_exit.EX_USAGE
+                try:
+                    shard = _parse_shard(args.shard)
+                except ValueError as e:
+                    print(str(e), file=sys.stderr)
+                    return cli_exit.EX_USAGE
+
+            include_history = not bool(getattr(args, "no_history", False))
+            if fmt == "ndjson":
+                fp_cache_obj: FingerprintCache | None = None
+                if bool(getattr(args, "fingerprint_artifacts", False)):
+                    if bool(getattr(args, "no_cache", False)):
+                        fp_cache_obj = FingerprintCache(None)
+                    else:
+                        fp_cache_obj = FingerprintCache.load(default_fingerprint_cache_path(scan_path))
+                # Findings are only kept in memory when they have to be submitted afterwards.
+                keep = bool(getattr(args, "submit", False))
+                kept: list[dict[str, Any]] = []
+                summary: dict[str, Any] = {}
+                try:
+                    for rec in iter_scan(
+                        scan_path,
+                        include_history=include_history,
+                        shard=shard,
+                        **_discovery_cache_kwargs(args, scan_path),
+                    ):
+                        if rec["record"] == "finding":
+                            if fp_cache_obj is not None and rec.get("detected_ai_usage") == "model_artifact":
+                                rec["artifact"] = fingerprint_artifact(
+                                    scan_path.resolve() / str(rec.get("file_path")), cache=fp_cache_obj
+                                )
+                            if keep:
+                                kept.append({k: v for k, v in rec.items() if k != "record"})
+                        else:
+                            summary = rec
+                        sys.stdout.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+                        sys.stdout.flush()
+                except ValueError as e:
+                    print(str(e), file=sys.stderr)
+                    return cli_exit.EX_USAGE
+                except Exception as e:
+                    print(str(e), file=sys.stderr)
+                    return cli_exit.EX_ERR
+                if fp_cache_obj is not None:
+                    fp_cache_obj.save()
+                scan = {**summary, "findings": kept}
+            else:
+                try:
+                    scan = scan_repo(
+                        scan_path,
+                        include_history=include_history,
+                        shard=shard,
+                        **_discovery_cache_kwargs(args, scan_path),
+                    )
+                except ValueError as e:
+                    print(str(e), file=sys.stderr)
+                    return cli_exit.EX_USAGE
+                except Exception as e:
+                    print(str(e), file=sys.stderr)
+                    return cli_exit.EX_ERR
+
+                if bool(getattr(args, "fingerprint_artifacts", False)):
+                    fp_cache = None if bool(getattr(args, "no_cache", False)) else default_fingerprint_cache_path(scan_path)
+                    attach_artifact_fingerprints(scan, scan_path, cache_path=fp_cache)
+
+        if fmt == "ndjson":
+            pass  # records were already streamed while scanning
+        elif fmt == "text":
             findings = scan.get("findings") if isinstance(scan, dict) else None
             print(f"AI discovery: path={scan_path.resolve()}", file=sys.stderr)
             if isinstance(findings, list) and findings:
@@ -2555,6 +3126,19 @@ def main(argv: Sequence[str] | None = None) -> int:
 
         return cli_exit.EX_OK
 
+    if args.cmd == "report" and (args.all or args.run_ids_file is not None):
+        if args.all and args.run_ids_file is not None:
+            print("use either --all or --run-ids-file", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        try:
+            ids = export_bundle_mod.list_run_ids() if args.all else export_bundle_mod.read_run_ids_file(args.run_ids_file)
+        except OSError as e:
+            print(f"cannot read run ids: {e}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        summary = report_mod.render_reports(ids, max_workers=args.workers, force=args.force)
+        _print_json({"ok": not summary["failed"], **summary}, compact=args.compact_json)
+        return cli_exit.EX_ERR if summary["failed"] else cli_exit.EX_OK
+
     if args.cmd == "report":
         run_id = _resolve_run_id(args)
         if not run_id:
@@ -2576,6 +3160,26 @@ def main(argv: Sequence[str] | None = None) -> int:
                 os.environ["RUN_ID"] = prev
         return cli_exit.EX_OK
 
+    if args.cmd == "export-bundle" and (args.all or args.run_ids_file is not None):
+        if args.all and args.run_ids_file is not None:
+            print("use either --all or --run-ids-file", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        if args.max_in_flight_mb < 1:
+            print("--max-in-flight-mb must be >= 1", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        try:
+            ids = export_bundle_mod.list_run_ids() if args.all else export_bundle_mod.read_run_ids_file(args.run_ids_file)
+        except OSError as e:
+            print(f"cannot read run ids: {e}", file=sys.stderr)
+            return cli_exit.EX_USAGE
+        summary = export_bundle_mod.export_bundles(
+            ids,
+            max_workers=args.workers,
+            max_in_flight_bytes=args.max_in_flight_mb * 1024 * 1024,
+        )
+        _print_json({"ok": not summary["failed"], **summary}, compact=args.compact_json)
+        return cli_exit.EX_ERR if summary["failed"] else cli_exit.EX_OK
+
     if args.cmd == "export-bundle":
         run_id = _resolve_run_id(args)
         if not run_id:
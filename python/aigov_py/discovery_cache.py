@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+CACHE_SCHEMA_VERSION = "aigov.discovery_cache.v1"
+
+# Relative to the scanned root; `.govai/` is excluded from discovery scans.
+DEFAULT_CACHE_RELPATH = Path(".govai") / "discovery-cache.json"
+
+
+def default_cache_path(root: Path) -> Path:
+    return root.resolve() / DEFAULT_CACHE_RELPATH
+
+
+def _sha256_file(path: Path) -> str | None:
+    h = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+class DiscoveryCache:
+    """
+    Per-file discovery results keyed by relative path, validated by (size, mtime_ns)
+    with a content sha256 fallback (e.g. after a fresh checkout resets mtimes).
+
+    An entry may record the git commit whose version of the file it was computed from
+    (the file was clean at HEAD when scanned); `--changed-since` trusts only entries
+    recorded at that ref.
+
+    The whole cache is discarded when its schema or the detector ruleset differs, so a
+    rule change never serves stale results. Best-effort: an unreadable cache starts
+    empty and a failed save is ignored.
+    """
+
+    def __init__(self, path: Path, *, ruleset: str, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.ruleset = ruleset
+        self._old: dict[str, dict[str, Any]] = entries or {}
+        self._new: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path, *, ruleset: str) -> DiscoveryCache:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, ruleset=ruleset)
+        if (
+            not isinstance(doc, dict)
+            or doc.get("schema_version") != CACHE_SCHEMA_VERSION
+            or doc.get("ruleset") != ruleset
+            or not isinstance(doc.get("files"), dict)
+        ):
+            return cls(path, ruleset=ruleset)
+        return cls(path, ruleset=ruleset, entries=doc["files"])
+
+    def entry_commit(self, rel: str) -> str | None:
+        entry = self._old.get(rel)
+        commit = entry.get("commit") if isinstance(entry, dict) else None
+        return commit if isinstance(commit, str) else None
+
+    def lookup(
+        self,
+        rel: str,
+        path: Path,
+        st: os.stat_result,
+        *,
+        trust: bool = False,
+        commit: str | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Cached result for `rel`, or None if the file must be rescanned.
+        `trust=True` skips validation (caller knows the file matches the entry's commit).
+        `commit`, if the file is clean at that commit now, is recorded on the entry.
+        """
+        entry = self._old.get(rel)
+        if not isinstance(entry, dict) or not isinstance(entry.get("result"), dict):
+            self.misses += 1
+            return None
+        if not trust and (entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns):
+            sha = entry.get("sha256")
+            if entry.get("size") != st.st_size or not sha or _sha256_file(path) != sha:
+                self.misses += 1
+                return None
+            entry = {**entry, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if commit is not None:
+            entry = {**entry, "commit": commit}
+        self._new[rel] = entry
+        self.hits += 1
+        return entry["result"]
+
+    def store(
+        self,
+        rel: str,
+        st: os.stat_result,
+        sha256: str | None,
+        result: dict[str, Any],
+        *,
+        commit: str | None = None,
+    ) -> None:
+        self._new[rel] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": sha256,
+            "result": result,
+            "commit": commit,
+        }
+
+    def save(self, *, prune: bool = True) -> None:
+        """
+        Write entries seen in this scan. With `prune`, entries not seen (deleted files) are
+        dropped; without it (partial scans such as shards) they are kept.
+        """
+        files = self._new if prune else {**self._old, **self._new}
+        doc = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "ruleset": self.ruleset,
+            "files": files,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
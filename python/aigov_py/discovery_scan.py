@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import codecs
 import csv
+import hashlib
 import json
 import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from aigov_py.discovery_cache import DiscoveryCache
+from aigov_py.discovery_signatures import SignatureMatcher, SignatureRule
 
 # directories we NEVER scan
 IGNORED_DIRS = {
@@ -19,11 +24,20 @@ IGNORED_DIRS = {
     "dist",
     "build",
     ".next",
+    # GovAI local state (config, discovery cache)
+    ".govai",
 }
 
-# file size cap (1MB)
+# file size cap (1MB) for whole-file reads
 MAX_FILE_SIZE = 1_000_000
 
+# Text files above MAX_FILE_SIZE are scanned in windows of this size (bounded memory);
+# files above MAX_STREAMED_FILE_SIZE are still skipped.
+SCAN_WINDOW_SIZE = 1_000_000
+MAX_STREAMED_FILE_SIZE = 256_000_000
+# A NUL byte in the first bytes marks a large file as binary (not scanned).
+_BINARY_SNIFF_BYTES = 8192
+
 
 _PII_COLUMN_TOKENS = frozenset(
     {
@@ -119,6 +133,42 @@ _CLASSIFIER_SIGS = (
 )
 
 
+# Bump when detector rules change in a way that can alter scan output.
+DISCOVERY_RULESET_VERSION = "aigov.discovery_rules.v2"
+
+# Code-signature rules for the per-file text scan. Every rule is matched in one pass over
+# the file (see `SignatureMatcher`); add new SDK signatures here rather than new checks.
+DETECTOR_RULES: tuple[SignatureRule, ...] = (
+    SignatureRule(
+        "openai_sdk",
+        ("OpenAI(", ".chat.completions", ".responses.create", "import openai", "from openai"),
+        case_sensitive=True,
+    ),
+    SignatureRule(
+        "anthropic_sdk",
+        ("import anthropic", "from anthropic", "anthropic(", "client.messages.create"),
+    ),
+    SignatureRule(
+        "transformers",
+        ("from transformers", "import transformers", "pipeline(", "AutoModel", "AutoTokenizer"),
+        case_sensitive=True,
+    ),
+    SignatureRule("user_facing", _USER_FACING_SIGS),
+    SignatureRule("embedding", _EMBEDDING_SIGS),
+    SignatureRule("classifier", _CLASSIFIER_SIGS),
+    # Imports of external AI deps (catches deps not declared in manifests).
+    *(
+        SignatureRule(
+            f"ext_dep:{dep}",
+            (f"import {dep.replace('-', '_')}", f"from {dep.replace('-', '_')}"),
+        )
+        for dep in _EXT_AI_DEPS
+    ),
+)
+
+_MATCHER = SignatureMatcher(DETECTOR_RULES)
+
+
 def _is_text_file(path: Path) -> bool:
     try:
         return path.is_file() and path.stat().st_size <= MAX_FILE_SIZE
@@ -126,6 +176,39 @@ def _is_text_file(path: Path) -> bool:
         return False
 
 
+def _scan_large_text_file(path: Path) -> tuple[set[str], str] | None:
+    """
+    Windowed signature scan for text files between MAX_FILE_SIZE and MAX_STREAMED_FILE_SIZE.
+
+    Reads SCAN_WINDOW_SIZE bytes at a time (incremental UTF-8 decode, overlap handled by
+    `SignatureMatcher.match_chunks`) and hashes the same bytes for the discovery cache.
+    Returns None for files out of range, binary files (NUL in the first bytes) and read errors.
+    """
+    try:
+        size = path.stat().st_size
+        if size <= MAX_FILE_SIZE or size > MAX_STREAMED_FILE_SIZE:
+            return None
+        with path.open("rb") as f:
+            head = f.read(_BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return None
+            h = hashlib.sha256()
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+            def windows() -> Iterator[str]:
+                data = head
+                while data:
+                    h.update(data)
+                    yield decoder.decode(data)
+                    data = f.read(SCAN_WINDOW_SIZE)
+                yield decoder.decode(b"", final=True)
+
+            hits = _MATCHER.match_chunks(windows())
+        return hits, h.hexdigest()
+    except Exception:
+        return None
+
+
 def _relpath(path: Path, root: Path) -> str:
     try:
         return str(path.resolve().relative_to(root.resolve()))
@@ -133,6 +216,10 @@ def _relpath(path: Path, root: Path) -> str:
         return str(path)
 
 
+# `\x1e` (record separator) is prepended in batch mode to split commits in `-z` output.
+_GIT_LOG_FORMAT = "%H|%ad|%s"
+
+
 def _git_available(root: Path) -> bool:
     try:
         subprocess.run(
@@ -148,6 +235,20 @@ def _git_available(root: Path) -> bool:
         return False
 
 
+def _summary_from_log_header(line: str) -> dict[str, Any]:
+    line = line.strip()
+    if not line:
+        return {"commits": 0}
+    parts = line.split("|", 2)
+    if len(parts) != 3:
+        return {"commits": 1}
+    commit, ts, subject = parts
+    return {
+        "commits": 1,
+        "last_commit": {"sha": commit, "ts": ts, "subject": subject},
+    }
+
+
 def _git_change_summary(root: Path, rel_file: str) -> dict[str, Any] | None:
     """
     Best-effort, deterministic-ish summary that works in CI.
@@ -157,28 +258,120 @@ def _git_change_summary(root: Path, rel_file: str) -> dict[str, Any] | None:
         return None
     try:
         cp = subprocess.run(
-            ["git", "log", "-n", "1", "--pretty=format:%H|%ad|%s", "--date=iso-strict", "--", rel_file],
+            ["git", "log", "-n", "1", f"--pretty=format:{_GIT_LOG_FORMAT}", "--date=iso-strict", "--", rel_file],
             cwd=str(root),
             check=False,
             capture_output=True,
             text=True,
             timeout=2,
         )
-        line = (cp.stdout or "").strip()
-        if not line:
-            return {"commits": 0}
-        parts = line.split("|", 2)
-        if len(parts) != 3:
-            return {"commits": 1}
-        commit, ts, subject = parts
-        return {
-            "commits": 1,
-            "last_commit": {"sha": commit, "ts": ts, "subject": subject},
-        }
+        return _summary_from_log_header(cp.stdout or "")
     except Exception:
         return None
 
 
+class _GitLastCommitIndex:
+    """
+    Newest commit header per file from one streamed `git log --name-only` process.
+
+    The log is read lazily: `get` only advances as far as needed to reach the asked-for
+    file, so recently touched files cost only the newest part of the history.
+    Raises OSError if the log cannot be started or read.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._proc = subprocess.Popen(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--name-only",
+                "--relative",
+                "-z",
+                f"--pretty=format:\x1e{_GIT_LOG_FORMAT}",
+                "--date=iso-strict",
+            ],
+            cwd=str(root),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # posix path -> raw header of the newest commit touching it
+        self._seen: dict[str, bytes] = {}
+        self._buf = b""
+        self._eof = False
+
+    def _consume(self, record: bytes) -> None:
+        header, _, names = record.partition(b"\n")
+        for raw in names.split(b"\0"):
+            if raw:
+                self._seen.setdefault(os.fsdecode(raw), header)
+
+    def get(self, rel: str) -> dict[str, Any]:
+        key = Path(rel).as_posix()
+        stdout = self._proc.stdout
+        assert stdout is not None
+        while key not in self._seen and not self._eof:
+            chunk = stdout.read(1 << 16)
+            if not chunk:
+                self._consume(self._buf)
+                self._buf = b""
+                self._eof = True
+                break
+            self._buf += chunk
+            *complete, self._buf = self._buf.split(b"\x1e")
+            for record in complete:
+                self._consume(record)
+        header = self._seen.get(key)
+        if header is None:
+            return {"commits": 0}
+        return _summary_from_log_header(header.decode("utf-8", errors="replace"))
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.kill()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+        self._proc.wait()
+
+
+class _ChangeSummaries:
+    """
+    Same per-file result as `_git_change_summary`, with one `git rev-parse` and one
+    `git log` for the whole scan instead of two processes per finding. Falls back to
+    per-file lookups if the shared log fails.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._available: bool | None = None
+        self._index: _GitLastCommitIndex | None = None
+        self._failed = False
+
+    def get(self, rel: str) -> dict[str, Any] | None:
+        if self._available is None:
+            self._available = _git_available(self._root)
+        if not self._available:
+            return None
+        if not self._failed:
+            try:
+                if self._index is None:
+                    self._index = _GitLastCommitIndex(self._root)
+                return self._index.get(rel)
+            except Exception:
+                self._failed = True
+                self.close()
+        return _git_change_summary(self._root, rel)
+
+    def close(self) -> None:
+        if self._index is not None:
+            try:
+                self._index.close()
+            except Exception:
+                pass
+            self._index = None
+
+
 def _scan_requirements(path: Path) -> set[str]:
     packages: set[str] = set()
     try:
@@ -268,252 +461,245 @@ def _parquet_pii_possible(path: Path) -> bool:
         return False
 
 
-def scan_repo(
-    root: Path,
-    *,
-    include_history: bool = True,
-) -> dict[str, Any]:
-    root = root.resolve()
+def _dependency_findings(rel: str, pkgs: set[str], *, detector_type: str, reason: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "detected_ai_usage": pkg,
+            "file_path": rel,
+            "detector_type": detector_type,
+            "confidence": 0.9,
+            "evidence": {"reason": reason, "package": pkg},
+            "change_summary": None,
+        }
+        for pkg in ("openai", "transformers", "anthropic")
+        if pkg in pkgs
+    ]
 
-    openai = False
-    transformers = False
-    model_artifacts = False
-    anthropic = False
-    embeddings = False
-    classifier = False
-    user_facing = False
-    pii_possible = False
 
-    external_dependencies: set[str] = set()
+def _code_finding(rel: str, usage: str, signature: str) -> dict[str, Any]:
+    return {
+        "detected_ai_usage": usage,
+        "file_path": rel,
+        "detector_type": "code_signature",
+        "confidence": 0.75,
+        "evidence": {"reason": "code", "signature": signature},
+        "change_summary": None,
+    }
 
+
+def scan_file(path: Path, rel: str) -> tuple[dict[str, Any], str | None]:
+    """
+    Signals contributed by a single file, independent of every other file.
+
+    Returns `(result, sha256)` where `result` is JSON-serializable:
+    - `signals`: sorted names of boolean scan signals this file sets
+    - `external_dependencies`: sorted dependency names
+    - `findings`: findings in scan order (`change_summary` left as None)
+    `sha256` is the digest of the bytes read for the text scan (None if not read).
+    """
+    signals: set[str] = set()
+    deps: set[str] = set()
     findings: list[dict[str, Any]] = []
+    digest: str | None = None
 
-    for path in sorted(root.rglob("*")):
-        if any(part in IGNORED_DIRS for part in path.parts):
-            continue
+    def result() -> tuple[dict[str, Any], str | None]:
+        return (
+            {"signals": sorted(signals), "external_dependencies": sorted(deps), "findings": findings},
+            digest,
+        )
 
-        rel = _relpath(path, root)
-
-        # --- model artifacts (filename only)
-        if path.is_file():
-            name = path.name.lower()
-
-            if name.endswith((".pt", ".pth", ".onnx", ".safetensors")):
-                model_artifacts = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "model_artifact",
-                        "file_path": rel,
-                        "detector_type": "artifact_extension",
-                        "confidence": 0.95,
-                        "evidence": {"reason": "extension", "ext": path.suffix.lower()},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-                continue
+    name = path.name.lower()
+
+    # --- model artifacts (filename only)
+    if name.endswith((".pt", ".pth", ".onnx", ".safetensors")):
+        signals.add("model_artifacts")
+        findings.append(
+            {
+                "detected_ai_usage": "model_artifact",
+                "file_path": rel,
+                "detector_type": "artifact_extension",
+                "confidence": 0.95,
+                "evidence": {"reason": "extension", "ext": path.suffix.lower()},
+                "change_summary": None,
+            }
+        )
+        return result()
+
+    if name == "pytorch_model.bin":
+        signals.add("model_artifacts")
+        findings.append(
+            {
+                "detected_ai_usage": "model_artifact",
+                "file_path": rel,
+                "detector_type": "artifact_filename",
+                "confidence": 0.98,
+                "evidence": {"reason": "pytorch_model.bin"},
+                "change_summary": None,
+            }
+        )
+        return result()
+
+    # --- PII scan (data files, deterministic + lightweight)
+    if name.endswith(".csv") and _csv_pii_possible(path):
+        signals.add("pii_possible")
+    if name.endswith(".parquet") and _parquet_pii_possible(path):
+        signals.add("pii_possible")
+
+    # --- requirements.txt
+    if path.name.startswith("requirements") and path.suffix == ".txt":
+        pkgs = _scan_requirements(path)
+        deps.update(dep for dep in _EXT_AI_DEPS if dep in pkgs)
+        dep_findings = _dependency_findings(
+            rel, pkgs, detector_type="dependency_requirements_txt", reason="requirements"
+        )
+        signals.update(f["detected_ai_usage"] for f in dep_findings)
+        findings.extend(dep_findings)
+
+    # --- package.json
+    if path.name == "package.json":
+        pkgs = _scan_package_json(path)
+        deps.update(dep for dep in _EXT_AI_DEPS if dep in pkgs)
+        dep_findings = _dependency_findings(rel, pkgs, detector_type="dependency_package_json", reason="package_json")
+        signals.update(f["detected_ai_usage"] for f in dep_findings)
+        findings.extend(dep_findings)
+
+    # --- text scan (code); files above MAX_FILE_SIZE are streamed in windows
+    if _is_text_file(path):
+        try:
+            data = path.read_bytes()
+        except Exception:
+            return result()
+        digest = hashlib.sha256(data).hexdigest()
+        hits = _MATCHER.match(data.decode("utf-8", errors="ignore"))
+    else:
+        streamed = _scan_large_text_file(path)
+        if streamed is None:
+            return result()
+        hits, digest = streamed
+
+    if "openai_sdk" in hits:
+        signals.add("openai")
+        findings.append(_code_finding(rel, "openai", "openai_sdk"))
+
+    if "anthropic_sdk" in hits:
+        signals.add("anthropic")
+        deps.add("anthropic")
+        findings.append(_code_finding(rel, "anthropic", "anthropic_sdk"))
+
+    if "transformers" in hits:
+        signals.add("transformers")
+        findings.append(_code_finding(rel, "transformers", "transformers"))
+
+    for sig, signal in (("user_facing", "user_facing"), ("embedding", "embeddings"), ("classifier", "classifier")):
+        if sig in hits:
+            signals.add(signal)
+
+    # If we didn't catch deps from manifests, infer from imports.
+    for hit in hits:
+        if hit.startswith("ext_dep:"):
+            deps.add(hit[len("ext_dep:") :])
+
+    return result()
+
+
+def ruleset_fingerprint() -> str:
+    """
+    Identity of everything that decides per-file scan results.
+    Changing any rule, token list or size cap yields a new value (invalidates caches).
+    """
+    material = json.dumps(
+        {
+            "rules": [[r.id, list(r.literals), r.case_sensitive] for r in DETECTOR_RULES],
+            "ext_ai_deps": list(_EXT_AI_DEPS),
+            "pii_column_tokens": sorted(_PII_COLUMN_TOKENS),
+            "max_file_size": MAX_FILE_SIZE,
+            "max_streamed_file_size": MAX_STREAMED_FILE_SIZE,
+        },
+        sort_keys=True,
+    )
+    return f"{DISCOVERY_RULESET_VERSION}+{hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _git_lines(root: Path, argv: list[str], ref: str) -> set[str]:
+    try:
+        cp = subprocess.run(argv, cwd=str(root), capture_output=True, check=False, timeout=60)
+    except Exception as e:
+        raise ValueError(f"--changed-since: git unavailable: {e}") from e
+    if cp.returncode != 0:
+        err = cp.stderr.decode("utf-8", errors="replace").strip()
+        raise ValueError(f"--changed-since {ref}: {err or 'git failed'}")
+    return {str(Path(os.fsdecode(raw))) for raw in cp.stdout.split(b"\0") if raw}
 
-            if name == "pytorch_model.bin":
-                model_artifacts = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "model_artifact",
-                        "file_path": rel,
-                        "detector_type": "artifact_filename",
-                        "confidence": 0.98,
-                        "evidence": {"reason": "pytorch_model.bin"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-                continue
 
-            # --- PII scan (data files, deterministic + lightweight)
-            if not pii_possible and name.endswith(".csv"):
-                if _csv_pii_possible(path):
-                    pii_possible = True
-            if not pii_possible and name.endswith(".parquet"):
-                if _parquet_pii_possible(path):
-                    pii_possible = True
-
-        # --- requirements.txt
-        if path.name.startswith("requirements") and path.suffix == ".txt":
-            pkgs = _scan_requirements(path)
-            for dep in _EXT_AI_DEPS:
-                if dep in pkgs:
-                    external_dependencies.add(dep)
-
-            if "openai" in pkgs:
-                openai = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "openai",
-                        "file_path": rel,
-                        "detector_type": "dependency_requirements_txt",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "requirements", "package": "openai"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if "transformers" in pkgs:
-                transformers = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "transformers",
-                        "file_path": rel,
-                        "detector_type": "dependency_requirements_txt",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "requirements", "package": "transformers"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if "anthropic" in pkgs:
-                anthropic = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "anthropic",
-                        "file_path": rel,
-                        "detector_type": "dependency_requirements_txt",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "requirements", "package": "anthropic"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-        # --- package.json
-        if path.name == "package.json":
-            deps = _scan_package_json(path)
-            for dep in _EXT_AI_DEPS:
-                if dep in deps:
-                    external_dependencies.add(dep)
-
-            if "openai" in deps:
-                openai = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "openai",
-                        "file_path": rel,
-                        "detector_type": "dependency_package_json",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "package_json", "package": "openai"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if "transformers" in deps:
-                transformers = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "transformers",
-                        "file_path": rel,
-                        "detector_type": "dependency_package_json",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "package_json", "package": "transformers"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if "anthropic" in deps:
-                anthropic = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "anthropic",
-                        "file_path": rel,
-                        "detector_type": "dependency_package_json",
-                        "confidence": 0.9,
-                        "evidence": {"reason": "package_json", "package": "anthropic"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-        # --- text scan (code)
-        if _is_text_file(path):
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
+def _git_unchanged_tracked_files(root: Path, ref: str) -> set[str]:
+    """
+    Files (relative to `root`) that git tracks and that do not differ from `ref` in the
+    working tree. Untracked and gitignored files (``.env``, model weights) are never in
+    it, so they always get the stat/hash check.
+    Raises ValueError if git cannot answer (not a repo, unknown ref).
+    """
+    git = ["git", "-c", "core.quotePath=false"]
+    tracked = _git_lines(root, [*git, "ls-files", "-z"], ref)
+    changed = _git_lines(root, [*git, "diff", "--name-only", "--relative", "-z", ref, "--"], ref)
+    return tracked - changed
+
+
+def _git_commit(root: Path, ref: str) -> str:
+    """Commit id `ref` resolves to; raises ValueError if it does not."""
+    try:
+        cp = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=str(root),
+            capture_output=True,
+            check=False,
+            timeout=60,
+        )
+    except Exception as e:
+        raise ValueError(f"--changed-since: git unavailable: {e}") from e
+    commit = cp.stdout.decode("utf-8", errors="replace").strip()
+    if cp.returncode != 0 or not commit:
+        raise ValueError(f"--changed-since {ref}: unknown revision")
+    return commit
+
+
+def _git_head_state(root: Path) -> tuple[str, set[str]] | None:
+    """``(HEAD commit, files clean at HEAD)``, or None outside a git work tree."""
+    try:
+        return _git_commit(root, "HEAD"), _git_unchanged_tracked_files(root, "HEAD")
+    except ValueError:
+        return None
+
+
+def _git_tracks(root: Path, path: Path) -> bool:
+    try:
+        cp = subprocess.run(
+            ["git", "ls-files", "--error-unmatch", "--", str(path)],
+            cwd=str(root),
+            capture_output=True,
+            check=False,
+            timeout=60,
+        )
+    except Exception:
+        return False
+    return cp.returncode == 0
+
+
+def is_ignored_path(path: Path) -> bool:
+    return any(part in IGNORED_DIRS for part in path.parts)
+
 
-            low = text.lower()
-
-            if (
-                "OpenAI(" in text
-                or ".chat.completions" in text
-                or ".responses.create" in text
-                or "import openai" in text
-                or "from openai" in text
-            ):
-                openai = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "openai",
-                        "file_path": rel,
-                        "detector_type": "code_signature",
-                        "confidence": 0.75,
-                        "evidence": {"reason": "code", "signature": "openai_sdk"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if (
-                "import anthropic" in low
-                or "from anthropic" in low
-                or "anthropic(" in low
-                or "client.messages.create" in low
-            ):
-                anthropic = True
-                external_dependencies.add("anthropic")
-                findings.append(
-                    {
-                        "detected_ai_usage": "anthropic",
-                        "file_path": rel,
-                        "detector_type": "code_signature",
-                        "confidence": 0.75,
-                        "evidence": {"reason": "code", "signature": "anthropic_sdk"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if (
-                "from transformers" in text
-                or "import transformers" in text
-                or "pipeline(" in text
-                or "AutoModel" in text
-                or "AutoTokenizer" in text
-            ):
-                transformers = True
-                findings.append(
-                    {
-                        "detected_ai_usage": "transformers",
-                        "file_path": rel,
-                        "detector_type": "code_signature",
-                        "confidence": 0.75,
-                        "evidence": {"reason": "code", "signature": "transformers"},
-                        "change_summary": _git_change_summary(root, rel) if include_history else None,
-                    }
-                )
-
-            if not user_facing:
-                for sig in _USER_FACING_SIGS:
-                    if sig in low:
-                        user_facing = True
-                        break
-
-            if not embeddings:
-                for sig in _EMBEDDING_SIGS:
-                    if sig in low:
-                        embeddings = True
-                        break
-
-            if not classifier:
-                for sig in _CLASSIFIER_SIGS:
-                    if sig in low:
-                        classifier = True
-                        break
-
-            # If we didn't catch deps from manifests, infer from imports.
-            for dep in _EXT_AI_DEPS:
-                if f"import {dep.replace('-', '_')}" in low or f"from {dep.replace('-', '_')}" in low:
-                    external_dependencies.add(dep)
+def iter_scan_paths(root: Path) -> list[Path]:
+    """Files considered by `scan_repo`, in scan order."""
+    return [path for path in sorted(root.rglob("*")) if not is_ignored_path(path) and path.is_file()]
+
+
+def _scan_flags(signals: set[str], external_dependencies: set[str]) -> dict[str, Any]:
+    openai = "openai" in signals
+    transformers = "transformers" in signals
+    model_artifacts = "model_artifacts" in signals
+    anthropic = "anthropic" in signals
+    embeddings = "embeddings" in signals
+    classifier = "classifier" in signals
 
     llm_used = bool(openai or anthropic)
     model_types: set[str] = set()
@@ -529,9 +715,6 @@ def scan_repo(
     ai_detected = bool(llm_used or transformers or model_artifacts or embeddings or classifier)
 
     return {
-        "schema_version": "aigov.discovery_scan.v2",
-        "root": str(root),
-        "root_relative": os.getcwd() if os.getcwd() else None,
         "openai": openai,
         "transformers": transformers,
         "model_artifacts": model_artifacts,
@@ -539,8 +722,213 @@ def scan_repo(
         "ai_detected": ai_detected,
         "llm_used": llm_used,
         "model_types": sorted(model_types),
-        "user_facing": user_facing,
-        "pii_possible": pii_possible,
+        "user_facing": "user_facing" in signals,
+        "pii_possible": "pii_possible" in signals,
         "external_dependencies": sorted(external_dependencies),
+    }
+
+
+def _check_shard(index: int, count: int) -> None:
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"invalid shard {index}/{count}: expected 1 <= index <= count")
+
+
+def shard_of(rel: str, count: int) -> int:
+    """1-based shard for a relative path: stable across machines, platforms and Python runs."""
+    digest = hashlib.sha256(Path(rel).as_posix().encode("utf-8", errors="surrogateescape")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def merge_scans(docs: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Combine the shard documents of one sharded scan into the document a single full scan
+    would produce (same flags, `model_types`, `external_dependencies` and finding order).
+
+    Every shard 1..N must be present exactly once, with the same `root`.
+    Raises ValueError otherwise.
+    """
+    if not docs:
+        raise ValueError("no shard documents to merge")
+    by_index: dict[int, dict[str, Any]] = {}
+    counts: set[int] = set()
+    roots: set[str] = set()
+    for doc in docs:
+        if not isinstance(doc, dict) or doc.get("schema_version") != "aigov.discovery_scan.v2":
+            raise ValueError("not an aigov.discovery_scan.v2 document")
+        shard = doc.get("shard")
+        if not isinstance(shard, dict):
+            raise ValueError("document has no shard metadata (was it produced with --shard?)")
+        index, count = int(shard.get("index", 0)), int(shard.get("count", 0))
+        _check_shard(index, count)
+        if index in by_index:
+            raise ValueError(f"shard {index}/{count} given more than once")
+        by_index[index] = doc
+        counts.add(count)
+        roots.add(str(doc.get("root")))
+    if len(counts) != 1:
+        raise ValueError(f"shards come from different shard counts: {sorted(counts)}")
+    if len(roots) != 1:
+        raise ValueError(f"shards scanned different roots: {sorted(roots)}")
+    (count,) = counts
+    missing = sorted(set(range(1, count + 1)) - set(by_index))
+    if missing:
+        raise ValueError(f"missing shard(s) {', '.join(f'{i}/{count}' for i in missing)}")
+
+    ordered = [by_index[i] for i in range(1, count + 1)]
+    first = ordered[0]
+    findings = [f for doc in ordered for f in doc.get("findings") or ()]
+    # Full scans emit findings in sorted path order (file-internal order kept by the stable sort).
+    findings.sort(key=lambda f: Path(str(f.get("file_path"))).parts)
+
+    # Every aggregate flag / list is an OR / union over files, so combining shards is exact.
+    return {
+        "schema_version": "aigov.discovery_scan.v2",
+        "root": first.get("root"),
+        "root_relative": first.get("root_relative"),
+        "openai": any(bool(d.get("openai")) for d in ordered),
+        "transformers": any(bool(d.get("transformers")) for d in ordered),
+        "model_artifacts": any(bool(d.get("model_artifacts")) for d in ordered),
+        "ai_detected": any(bool(d.get("ai_detected")) for d in ordered),
+        "llm_used": any(bool(d.get("llm_used")) for d in ordered),
+        "model_types": sorted({str(t) for d in ordered for t in d.get("model_types") or ()}),
+        "user_facing": any(bool(d.get("user_facing")) for d in ordered),
+        "pii_possible": any(bool(d.get("pii_possible")) for d in ordered),
+        "external_dependencies": sorted({str(x) for d in ordered for x in d.get("external_dependencies") or ()}),
         "findings": findings,
     }
+
+
+def iter_scan(
+    root: Path,
+    *,
+    include_history: bool = True,
+    cache_path: Path | None = None,
+    changed_since: str | None = None,
+    shard: tuple[int, int] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Streaming form of `scan_repo` (same options, same results).
+
+    Yields every finding as soon as its file has been scanned, as
+    `{"record": "finding", **finding}`, then one final
+    `{"record": "summary", ...}` carrying the v2 document fields except `findings`,
+    plus `findings_count`. Memory does not grow with the number of findings.
+    """
+    root = root.resolve()
+
+    cache: DiscoveryCache | None = None
+    head: tuple[str, set[str]] | None = None
+    trusted: set[str] | None = None
+    trusted_commit: str | None = None
+    if cache_path is not None:
+        ruleset = ruleset_fingerprint()
+        head = _git_head_state(root)
+        if head is not None and _git_tracks(root, cache_path):
+            # A committed cache is content from the checkout itself; never read it.
+            cache = DiscoveryCache(cache_path, ruleset=ruleset)
+        else:
+            cache = DiscoveryCache.load(cache_path, ruleset=ruleset)
+    if changed_since is not None:
+        if cache is None:
+            raise ValueError("--changed-since requires the discovery cache")
+        trusted_commit = _git_commit(root, changed_since)
+        trusted = _git_unchanged_tracked_files(root, changed_since)
+    if shard is not None:
+        _check_shard(*shard)
+
+    signals: set[str] = set()
+    external_dependencies: set[str] = set()
+    findings_count = 0
+    history = _ChangeSummaries(root) if include_history else None
+    try:
+        for path in iter_scan_paths(root):
+            rel = _relpath(path, root)
+            if shard is not None and shard_of(rel, shard[1]) != shard[0]:
+                continue
+            if cache is None:
+                res = scan_file(path, rel)[0]
+            else:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                # Trusted only if unchanged since the ref and the entry was computed at that ref.
+                trust = trusted is not None and rel in trusted and cache.entry_commit(rel) == trusted_commit
+                clean_at = head[0] if head is not None and rel in head[1] else None
+                cached = cache.lookup(rel, path, st, trust=trust, commit=clean_at)
+                if cached is None:
+                    cached, digest = scan_file(path, rel)
+                    cache.store(rel, st, digest, cached, commit=clean_at)
+                res = cached
+
+            signals.update(res.get("signals") or ())
+            external_dependencies.update(res.get("external_dependencies") or ())
+            for f in res.get("findings") or ():
+                finding = dict(f)
+                if history is not None:
+                    finding["change_summary"] = history.get(str(finding["file_path"]))
+                findings_count += 1
+                yield {"record": "finding", **finding}
+    finally:
+        if history is not None:
+            history.close()
+
+    if cache is not None:
+        # A shard only sees its own files; keep the other shards' entries.
+        cache.save(prune=shard is None)
+
+    summary: dict[str, Any] = {
+        "record": "summary",
+        "schema_version": "aigov.discovery_scan.v2",
+        "root": str(root),
+        "root_relative": os.getcwd() if os.getcwd() else None,
+        **_scan_flags(signals, external_dependencies),
+        "findings_count": findings_count,
+    }
+    if shard is not None:
+        summary["shard"] = {"index": shard[0], "count": shard[1]}
+    yield summary
+
+
+def scan_repo(
+    root: Path,
+    *,
+    include_history: bool = True,
+    cache_path: Path | None = None,
+    changed_since: str | None = None,
+    shard: tuple[int, int] | None = None,
+) -> dict[str, Any]:
+    """
+    Deterministic repository scan (`aigov.discovery_scan.v2`).
+
+    With `cache_path`, per-file results are reused from a `DiscoveryCache` for files whose
+    (size, mtime_ns) or content hash is unchanged; only changed files are read and scanned.
+    With `changed_since` (a git ref), cached results are trusted without a stat/hash check
+    for every tracked file git does not report as changed since that ref, if the cached
+    result was computed from that commit's version of the file; other files are still
+    checked. A cache file tracked by git is ignored.
+
+    With `shard=(index, count)` (1-based index) only files assigned to that shard by
+    `shard_of` are scanned and the document carries a `shard` object; `merge_scans`
+    combines all `count` shard documents into the full-scan document.
+    """
+    findings: list[dict[str, Any]] = []
+    summary: dict[str, Any] = {}
+    for rec in iter_scan(
+        root,
+        include_history=include_history,
+        cache_path=cache_path,
+        changed_since=changed_since,
+        shard=shard,
+    ):
+        kind = rec.pop("record")
+        if kind == "finding":
+            findings.append(rec)
+        else:
+            summary = rec
+    summary.pop("findings_count", None)
+    shard_info = summary.pop("shard", None)
+    out = {**summary, "findings": findings}
+    if shard_info is not None:
+        out["shard"] = shard_info
+    return out
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+@dataclass(frozen=True)
+class SignatureRule:
+    """
+    One detector signature: the rule id is reported if ANY literal occurs in the text.
+
+    Literals are plain substrings (no regex). `case_sensitive=False` matches the same
+    way as `literal in text.lower()` with a lowercase literal.
+    """
+
+    id: str
+    literals: tuple[str, ...]
+    case_sensitive: bool = False
+
+
+def _trie_pattern(keys: Iterable[str]) -> str:
+    """
+    Regex for a set of literals, factored as a trie so `re` branches per character instead
+    of retrying every alternative at every offset. Greedy optional tails make the match at
+    a given offset the longest literal starting there.
+    """
+    trie: dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class SignatureMatcher:
+    """
+    Compiled multi-pattern matcher over a fixed rule set.
+
+    The text is case-folded once and searched with a single trie regex over all literals.
+    The search resumes one character after each hit so overlapping literals are not lost;
+    shorter literals that are prefixes of a hit come from a precomputed table. Case-sensitive
+    literals are confirmed against the original text at the hit offset.
+    """
+
+    def __init__(self, rules: Iterable[SignatureRule]) -> None:
+        self.rules: tuple[SignatureRule, ...] = tuple(rules)
+        self._rule_ids = frozenset(r.id for r in self.rules)
+        # folded literal -> [(rule id, literal, case_sensitive)]
+        self._entries: dict[str, list[tuple[str, str, bool]]] = {}
+        for rule in self.rules:
+            for lit in rule.literals:
+                if not lit:
+                    raise ValueError(f"empty literal in signature rule {rule.id!r}")
+                lit = lit if rule.case_sensitive else lit.lower()
+                self._entries.setdefault(lit.lower(), []).append((rule.id, lit, rule.case_sensitive))
+
+        keys = sorted(self._entries, key=lambda k: (-len(k), k))
+        self.max_literal_len = max((len(lit) for r in self.rules for lit in r.literals), default=0)
+        # every literal that is a prefix of `key` (including itself), longest first
+        self._prefixes: dict[str, tuple[str, ...]] = {k: tuple(p for p in keys if k.startswith(p)) for k in keys}
+        self._pattern = re.compile(_trie_pattern(keys)) if keys else None
+
+    def match(self, text: str) -> set[str]:
+        """Return the ids of every rule with at least one literal present in `text`."""
+        hits: set[str] = set()
+        if self._pattern is None:
+            return hits
+        low = text.lower()
+        # str.lower() can change length for a few code points; offsets are then unusable.
+        aligned = len(low) == len(text)
+        search = self._pattern.search
+        pos = 0
+        while len(hits) < len(self._rule_ids):
+            m = search(low, pos)
+            if m is None:
+                break
+            start = m.start()
+            for key in self._prefixes[m.group(0)]:
+                for rule_id, lit, case_sensitive in self._entries[key]:
+                    if rule_id in hits:
+                        continue
+                    if not case_sensitive or (text.startswith(lit, start) if aligned else lit in text):
+                        hits.add(rule_id)
+            pos = start + 1
+        return hits
+
+    def match_chunks(self, chunks: Iterable[str]) -> set[str]:
+        """
+        Same result as `match("".join(chunks))`, holding one chunk at a time.
+
+        Each chunk is searched together with the last `max_literal_len - 1` characters of the
+        text before it, so literals crossing a chunk boundary still match.
+        """
+        hits: set[str] = set()
+        keep = max(self.max_literal_len - 1, 0)
+        tail = ""
+        for chunk in chunks:
+            window = tail + chunk
+            if len(hits) < len(self._rule_ids):
+                hits |= self.match(window)
+            tail = window[-keep:] if keep else ""
+        return hits
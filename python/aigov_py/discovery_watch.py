@@ -0,0 +1,324 @@
+"""
+`govai discovery watch`: keep per-file discovery results in memory and re-scan only the
+files that change.
+
+Change notifications come from Linux inotify (via libc, no extra dependency) with a
+stat-polling fallback elsewhere. Every file is scanned with `discovery_scan.scan_file`
+and aggregated with the same flag rules as `scan_repo`, so the watched summary always
+equals a fresh `scan_repo(root, include_history=False)` of the same tree.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from aigov_py.discovery_scan import (
+    _relpath,
+    _scan_flags,
+    is_ignored_path,
+    iter_scan_paths,
+    scan_file,
+)
+
+# Events arriving within this window after the first one are handled as one batch
+# (editors typically write, rename and chmod in quick succession).
+SETTLE_SECONDS = 0.05
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class DiscoveryState:
+    """Per-file `scan_file` results for one root, plus the aggregate they imply."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root.resolve()
+        self._results: dict[str, dict[str, Any]] = {}
+
+    def files(self) -> set[str]:
+        return set(self._results)
+
+    def full_scan(self) -> None:
+        self._results = {}
+        for path in iter_scan_paths(self.root):
+            rel = _relpath(path, self.root)
+            self._results[rel] = scan_file(path, rel)[0]
+
+    def rescan(self, rels: set[str]) -> None:
+        """Re-scan `rels` (root-relative); paths that are gone or ignored are dropped."""
+        for rel in rels:
+            path = self.root / rel
+            if is_ignored_path(path) or not path.is_file():
+                self._results.pop(rel, None)
+                continue
+            self._results[rel] = scan_file(path, rel)[0]
+
+    def summary(self) -> dict[str, Any]:
+        signals: set[str] = set()
+        external_dependencies: set[str] = set()
+        findings_count = 0
+        for res in self._results.values():
+            signals.update(res.get("signals") or ())
+            external_dependencies.update(res.get("external_dependencies") or ())
+            findings_count += len(res.get("findings") or ())
+        return {**_scan_flags(signals, external_dependencies), "findings_count": findings_count}
+
+
+def summary_changes(before: dict[str, Any], after: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """`{key: {"from": old, "to": new}}` for every summary value that differs."""
+    return {
+        k: {"from": before.get(k), "to": after.get(k)}
+        for k in sorted(set(before) | set(after))
+        if before.get(k) != after.get(k)
+    }
+
+
+class PollingEvents:
+    """Change source comparing (size, mtime_ns) snapshots of the scanned files."""
+
+    def __init__(self, root: Path, *, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.root = root.resolve()
+        self.interval = interval
+        self._snapshot = self._take()
+
+    def _take(self) -> dict[str, tuple[int, int]]:
+        snap: dict[str, tuple[int, int]] = {}
+        for path in iter_scan_paths(self.root):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snap[_relpath(path, self.root)] = (st.st_size, st.st_mtime_ns)
+        return snap
+
+    def wait(self, timeout: float | None = None) -> set[str] | None:
+        """Block until files change (or `timeout`); returns the touched relative paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self._take()
+            old, self._snapshot = self._snapshot, snap
+            touched = {rel for rel in set(old) | set(snap) if old.get(rel) != snap.get(rel)}
+            if touched:
+                return touched
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyEvents:
+    """
+    Change source backed by Linux inotify: one watch per non-ignored directory, new
+    directories are watched as they appear. Raises OSError if inotify is unavailable.
+
+    `wait` returns None after a kernel queue overflow (events were lost; the caller
+    must fall back to a full rescan).
+    """
+
+    def __init__(self, root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.root = root.resolve()
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        # watch descriptor -> watched directory
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._watch_tree(self.root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_dir(self, path: Path) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        self._dirs[wd] = path
+
+    def _watch_tree(self, top: Path) -> None:
+        self._watch_dir(top)
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not is_ignored_path(Path(dirpath) / d)]
+            for d in dirnames:
+                try:
+                    self._watch_dir(Path(dirpath) / d)
+                except OSError:
+                    # removed while walking or not readable; nothing to watch
+                    pass
+
+    def _files_under(self, top: Path) -> set[str]:
+        return {_relpath(p, self.root) for p in iter_scan_paths(top)}
+
+    def _read(self) -> set[str] | None:
+        touched: set[str] = set()
+        overflow = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            pos = 0
+            while pos + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, n = _EVENT_HEADER.unpack_from(buf, pos)
+                raw = buf[pos + _EVENT_HEADER.size : pos + _EVENT_HEADER.size + n].rstrip(b"\0")
+                pos += _EVENT_HEADER.size + n
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & _IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None or not raw:
+                    continue
+                path = parent / os.fsdecode(raw)
+                if is_ignored_path(path):
+                    continue
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        try:
+                            self._watch_tree(path)
+                        except OSError:
+                            pass
+                        touched |= self._files_under(path)
+                    else:
+                        # Directory removed or moved away: every file under it is gone.
+                        prefix = _relpath(path, self.root) + os.sep
+                        touched.add(prefix)
+                    continue
+                touched.add(_relpath(path, self.root))
+        return None if overflow else touched
+
+    def wait(self, timeout: float | None = None) -> set[str] | None:
+        """
+        Block until files change (or `timeout`); returns touched relative paths. A path
+        ending in the path separator stands for everything below that directory.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        time.sleep(SETTLE_SECONDS)
+        return self._read()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_events(root: Path, *, poll: bool = False, interval: float = DEFAULT_POLL_INTERVAL) -> InotifyEvents | PollingEvents:
+    """inotify where available (unless `poll`), otherwise stat polling."""
+    if not poll:
+        try:
+            return InotifyEvents(root)
+        except OSError:
+            pass
+    return PollingEvents(root, interval=interval)
+
+
+def iter_watch(
+    root: Path,
+    *,
+    poll: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: float | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield `{"record": "summary", ...}` for the initial scan, then one
+    `{"record": "change", "files", "changes", "summary", "elapsed_ms"}` record per batch of
+    file events that changed the aggregate discovery summary. Runs until the consumer
+    stops iterating (or, with `timeout`, until no events arrive for that long).
+    """
+    state = DiscoveryState(root)
+    events = open_events(state.root, poll=poll, interval=interval)
+    try:
+        state.full_scan()
+        summary = state.summary()
+        yield {
+            "record": "summary",
+            "root": str(state.root),
+            "source": "inotify" if isinstance(events, InotifyEvents) else "poll",
+            **summary,
+        }
+        while True:
+            touched = events.wait(timeout)
+            if touched is not None and not touched:
+                if timeout is not None:
+                    return
+                continue
+            started = time.monotonic()
+            if touched is None:
+                files = state.files()
+                state.full_scan()
+                files |= state.files()
+            else:
+                files = set()
+                for rel in touched:
+                    if rel.endswith(os.sep):
+                        files |= {f for f in state.files() if f.startswith(rel)}
+                    else:
+                        files.add(rel)
+                state.rescan(files)
+            before, summary = summary, state.summary()
+            changes = summary_changes(before, summary)
+            if not changes:
+                continue
+            yield {
+                "record": "change",
+                "files": sorted(files),
+                "changes": changes,
+                "summary": summary,
+                "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            }
+    finally:
+        events.close()
@@ -1,51 +1,54 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import hashlib
-import zipfile
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
 
+from aigov_py.artifact_fingerprint import sha256_path
+from aigov_py.artifact_store import ArtifactStore
+from aigov_py.pack_writer import PackWriter, reusable_pack
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
 
+def _digest(data: bytes) -> Dict[str, Any]:
+    return {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
 
-def _write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
 
+def _staging_matches(path: Path, data: bytes) -> bool:
+    try:
+        return path.read_bytes() == data
+    except OSError:
+        return False
 
-def _read_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
 
-
-def _manifest(entries: List[Tuple[str, Path]]) -> Dict[str, Any]:
+def _manifest(names: List[str], hashes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Manifest from precomputed entry hashes (the staged copies are not re-read)."""
     files = []
-    for logical_name, p in entries:
+    for logical_name in names:
         files.append(
             {
                 "name": logical_name,
                 "path": logical_name,
-                "sha256": _sha256_file(p),
-                "bytes": p.stat().st_size,
+                "sha256": hashes[logical_name]["sha256"],
+                "bytes": hashes[logical_name]["bytes"],
             }
         )
     return {"schema_version": "aigov.pack.manifest.v1", "files": files}
 
 
-def main() -> None:
-    run_id = os.environ.get("RUN_ID", "").strip()
-    if not run_id:
-        raise SystemExit("RUN_ID is required")
+def _check_unchanged(pack: PackWriter, hashes: Dict[str, Dict[str, Any]]) -> None:
+    """The manifest was built from the first read; abort if a streamed input changed since."""
+    for name, entry in pack.entries.items():
+        if entry["sha256"] != hashes[name]["sha256"]:
+            raise SystemExit(f"{name} changed while the evidence pack was being built; rerun")
 
-    repo_root = Path(__file__).resolve().parents[2]
 
+def build_evidence_pack(run_id: str, repo_root: Path) -> Dict[str, Any]:
+    """
+    Write docs/packs/<run_id>/ and docs/packs/<run_id>.zip; returns the pack digest.
+    An existing deterministic pack with identical entry hashes is reused (`reused: True`).
+    """
     evidence_path = repo_root / "docs" / "evidence" / f"{run_id}.json"
     report_path = repo_root / "docs" / "reports" / f"{run_id}.md"
     audit_path = repo_root / "docs" / "audit" / f"{run_id}.json"
@@ -57,74 +60,99 @@ def main() -> None:
     if not audit_path.exists():
         raise SystemExit(f"missing audit JSON: {audit_path}")
 
-    bundle = _read_json(evidence_path)
+    evidence_bytes = evidence_path.read_bytes()
+    bundle = json.loads(evidence_bytes.decode("utf-8"))
     policy_version = str(bundle.get("policy_version", "")).strip() or "unknown"
 
     out_dir = repo_root / "docs" / "packs" / run_id
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy into pack staging directory with stable names
-    bundle_out = out_dir / "bundle.json"
-    report_out = out_dir / "report.md"
-    audit_out = out_dir / "audit.json"
-    policy_out = out_dir / "policy.txt"
-    readme_out = out_dir / "README.txt"
-    manifest_out = out_dir / "manifest.json"
-
-    bundle_out.write_bytes(evidence_path.read_bytes())
-    report_out.write_bytes(report_path.read_bytes())
-    audit_out.write_bytes(audit_path.read_bytes())
-
-    _write_text(policy_out, f"policy_version={policy_version}\n")
-
-    _write_text(
-        readme_out,
-        "\n".join(
-            [
-                "AIGov evidence pack",
-                "",
-                f"run_id={run_id}",
-                f"policy_version={policy_version}",
-                "",
-                "Contents",
-                "- bundle.json: machine verifiable evidence bundle",
-                "- report.md: human readable audit report",
-                "- audit.json: machine verifiable combined audit index",
-                "- policy.txt: policy snapshot reference",
-                "- manifest.json: sha256 for each file in this pack",
-                "",
-                "Verification",
-                "1) Check manifest.json hashes match files",
-                "2) Optionally verify audit log chain with the governance server",
-                "",
-            ]
-        ),
+    readme = "\n".join(
+        [
+            "AIGov evidence pack",
+            "",
+            f"run_id={run_id}",
+            f"policy_version={policy_version}",
+            "",
+            "Contents",
+            "- bundle.json: machine verifiable evidence bundle",
+            "- report.md: human readable audit report",
+            "- audit.json: machine verifiable combined audit index",
+            "- policy.txt: policy snapshot reference",
+            "- manifest.json: sha256 for each file in this pack",
+            "",
+            "Verification",
+            "1) Check manifest.json hashes match files",
+            "2) Optionally verify audit log chain with the governance server",
+            "",
+        ]
     )
 
-    entries: List[Tuple[str, Path]] = [
-        ("bundle.json", bundle_out),
-        ("report.md", report_out),
-        ("audit.json", audit_out),
-        ("policy.txt", policy_out),
-        ("README.txt", readme_out),
-    ]
-    manifest = _manifest(entries)
-    _write_text(manifest_out, json.dumps(manifest, ensure_ascii=False, indent=2))
-
-    # Now create zip
+    policy_bytes = f"policy_version={policy_version}\n".encode("utf-8")
+    readme_bytes = readme.encode("utf-8")
+
+    # Content key: every entry's hash, known before anything is written. Large inputs are
+    # hashed streaming and only read a second time if the pack has to be rebuilt; that read
+    # must reproduce these hashes or the build is aborted.
+    hashes: Dict[str, Dict[str, Any]] = {
+        "bundle.json": _digest(evidence_bytes),
+        "report.md": {"sha256": sha256_path(report_path), "bytes": report_path.stat().st_size},
+        "audit.json": {"sha256": sha256_path(audit_path), "bytes": audit_path.stat().st_size},
+        "policy.txt": _digest(policy_bytes),
+        "README.txt": _digest(readme_bytes),
+    }
+    manifest = _manifest(list(hashes), hashes)
+    manifest_bytes = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    hashes["manifest.json"] = _digest(manifest_bytes)
+
     zip_path = repo_root / "docs" / "packs" / f"{run_id}.zip"
-    zip_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        z.write(bundle_out, arcname="bundle.json")
-        z.write(report_out, arcname="report.md")
-        z.write(audit_out, arcname="audit.json")
-        z.write(policy_out, arcname="policy.txt")
-        z.write(readme_out, arcname="README.txt")
-        z.write(manifest_out, arcname="manifest.json")
-
-    print(f"saved {zip_path}")
-    print(f"pack_sha256={_sha256_file(zip_path)}")
+    digest = reusable_pack(zip_path, {name: h["sha256"] for name, h in hashes.items()})
+    if digest is not None and _staging_matches(out_dir / "manifest.json", manifest_bytes):
+        return {"zip_path": zip_path, "manifest": manifest, "reused": True, **digest}
+
+    store = ArtifactStore.open(repo_root)
+    if store is not None:
+        # Staging files become store refs (hardlinks) instead of copies.
+        with PackWriter(zip_path) as pack:
+            pack.add_bytes("bundle.json", evidence_bytes)
+            pack.add_file("report.md", report_path)
+            pack.add_file("audit.json", audit_path)
+            pack.add_bytes("policy.txt", policy_bytes)
+            pack.add_bytes("README.txt", readme_bytes)
+            _check_unchanged(pack, hashes)
+            pack.add_bytes("manifest.json", manifest_bytes)
+        digest = pack.close()
+        store.ingest(evidence_path, hashes["bundle.json"]["sha256"])
+        store.ingest(report_path, hashes["report.md"]["sha256"])
+        store.ingest(audit_path, hashes["audit.json"]["sha256"])
+        for data in (policy_bytes, readme_bytes, manifest_bytes):
+            store.put_bytes(data)
+        for name, h in hashes.items():
+            store.link(h["sha256"], out_dir / name)
+        store.ingest(zip_path, digest["sha256"])
+        return {"zip_path": zip_path, "manifest": manifest, "reused": False, **digest}
+
+    # Each input is written to the staging directory (stable names) and the zip at once.
+    with PackWriter(zip_path) as pack:
+        pack.add_bytes("bundle.json", evidence_bytes, copy_to=out_dir / "bundle.json")
+        pack.add_file("report.md", report_path, copy_to=out_dir / "report.md")
+        pack.add_file("audit.json", audit_path, copy_to=out_dir / "audit.json")
+        pack.add_bytes("policy.txt", policy_bytes, copy_to=out_dir / "policy.txt")
+        pack.add_bytes("README.txt", readme_bytes, copy_to=out_dir / "README.txt")
+        _check_unchanged(pack, hashes)
+        pack.add_bytes("manifest.json", manifest_bytes, copy_to=out_dir / "manifest.json")
+    return {"zip_path": zip_path, "manifest": manifest, "reused": False, **pack.close()}
+
+
+def main() -> None:
+    run_id = os.environ.get("RUN_ID", "").strip()
+    if not run_id:
+        raise SystemExit("RUN_ID is required")
+
+    out = build_evidence_pack(run_id, Path(__file__).resolve().parents[2])
+
+    print(f"{'unchanged' if out['reused'] else 'saved'} {out['zip_path']}")
+    print(f"pack_sha256={out['sha256']}")
 
 
 if __name__ == "__main__":
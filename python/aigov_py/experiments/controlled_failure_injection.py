@@ -15,7 +15,8 @@ from aigov_py.experiments.gate_model import (
     GateAblation,
     RunRecord,
     build_run,
-    decision_gate_verdict_from_fields,
+    compiled_gate_verdict,
+    gate_index_from_fields,
     get_rubric_row,
     load_scenario_rubric,
     rubric_scenarios,
@@ -70,21 +71,18 @@ def _ablation_presets() -> dict[str, GateAblation]:
     }
 
 
-def _ablated_verdict(fields: dict[str, object], ablation: GateAblation) -> str:
-    return decision_gate_verdict_from_fields(fields, ablation=ablation)
-
-
 def _ablation_metrics(runs_list: list[RunRecord]) -> dict[str, dict[str, float]]:
+    # Pack each run's gate inputs once; every preset is then a table lookup per run.
+    indices: dict[str, int] = {}
+    cases: list[tuple[int, str]] = []
+    for r in runs_list:
+        if r.condition not in indices:
+            indices[r.condition] = gate_index_from_fields(sf.fields_for_scenario(r.condition))
+        cases.append((indices[r.condition], str(get_rubric_row(r.condition)["expected_verdict"])))
+
     out: dict[str, dict[str, float]] = {}
     for label, ab in _ablation_presets().items():
-        correct = 0
-        for r in runs_list:
-            row = get_rubric_row(r.condition)
-            expected = str(row["expected_verdict"])
-            fields = sf.fields_for_scenario(r.condition)
-            got = _ablated_verdict(fields, ab)
-            if got == expected:
-                correct += 1
+        correct = sum(1 for index, expected in cases if compiled_gate_verdict(index, ablation=ab) == expected)
         out[label] = {
             "verdict_classification_accuracy": rate(correct, len(runs_list)),
         }
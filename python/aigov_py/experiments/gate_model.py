@@ -197,30 +197,80 @@ def decision_gate_verdict(
     return "VALID"
 
 
-def decision_gate_verdict_from_fields(
-    fields: dict[str, Any], *, ablation: GateAblation | None = None
-) -> Verdict:
+# Compiled gate: every input is boolean once normalized (``evaluation_result == "pass"``,
+# ``approval == "granted"``), so for a fixed ablation the verdict is a pure function of a
+# 15-bit integer. Each ablation gets a lookup table whose entries are filled on first use from
+# `decision_gate_verdict`, which stays the reference implementation.
+GATE_INPUT_BITS: tuple[str, ...] = (
+    "evaluation_result",
+    "evaluation_internal_consistent",
+    "run_available",
+    "evidence_pack_present",
+    "events_content_sha256_match",
+    "export_digest_match",
+    "artifact_bound_verification",
+    "policy_version_match",
+    "evidence_complete",
+    "ai_discovery_present",
+    "approval",
+    "approval_is_stale",
+    "causal_evaluation_before_approval",
+    "run_id_matches_decision_scope",
+    "trace_consistent",
+)
+
+_VERDICTS: tuple[Verdict, ...] = ("VALID", "INVALID", "BLOCKED")
+
+
+def gate_inputs_from_index(index: int) -> dict[str, Any]:
+    """Keyword arguments for `decision_gate_verdict` encoded by a packed gate index."""
+    out: dict[str, Any] = {name: bool(index >> bit & 1) for bit, name in enumerate(GATE_INPUT_BITS)}
+    out["evaluation_result"] = "pass" if out["evaluation_result"] else "fail"
+    out["approval"] = "granted" if out["approval"] else "denied"
+    return out
+
+
+def gate_index_from_fields(fields: dict[str, Any]) -> int:
+    """Pack a field bundle into its gate table index (bit i is ``GATE_INPUT_BITS[i]``)."""
     er = fields["evaluation_result"]
     if er not in ("pass", "fail"):
         raise TypeError("evaluation_result")
-    return decision_gate_verdict(
-        evaluation_result=er,  # type: ignore[arg-type]
-        evaluation_internal_consistent=bool(fields["evaluation_internal_consistent"]),
-        run_available=bool(fields["run_available"]),
-        evidence_pack_present=bool(fields["evidence_pack_present"]),
-        events_content_sha256_match=bool(fields["events_content_sha256_match"]),
-        export_digest_match=bool(fields["export_digest_match"]),
-        artifact_bound_verification=bool(fields["artifact_bound_verification"]),
-        policy_version_match=bool(fields["policy_version_match"]),
-        evidence_complete=bool(fields["evidence_complete"]),
-        ai_discovery_present=bool(fields["ai_discovery_present"]),
-        approval=str(fields["approval"]),
-        approval_is_stale=bool(fields["approval_is_stale"]),
-        causal_evaluation_before_approval=bool(fields["causal_evaluation_before_approval"]),
-        run_id_matches_decision_scope=bool(fields["run_id_matches_decision_scope"]),
-        trace_consistent=bool(fields["trace_consistent"]),
-        ablation=ablation,
-    )
+    index = 1 if er == "pass" else 0
+    for bit in range(1, len(GATE_INPUT_BITS)):
+        name = GATE_INPUT_BITS[bit]
+        value = str(fields[name]) == "granted" if name == "approval" else bool(fields[name])
+        if value:
+            index |= 1 << bit
+    return index
+
+
+_UNFILLED = 0xFF
+_GATE_TABLES: dict[GateAblation, bytearray] = {}
+
+
+def compiled_gate_verdict(index: int, *, ablation: GateAblation | None = None) -> Verdict:
+    """Table lookup; an entry is filled from `decision_gate_verdict` the first time it is hit."""
+    ab = ablation or GateAblation()
+    table = _GATE_TABLES.get(ab)
+    if table is None:
+        table = _GATE_TABLES[ab] = bytearray([_UNFILLED]) * (1 << len(GATE_INPUT_BITS))
+    code = table[index]
+    if code == _UNFILLED:
+        code = table[index] = _VERDICTS.index(decision_gate_verdict(**gate_inputs_from_index(index), ablation=ab))
+    return _VERDICTS[code]
+
+
+def compiled_gate_table(ablation: GateAblation | None = None) -> bytes:
+    """The full table for `ablation`: verdict code (index into ``_VERDICTS``) per packed gate index."""
+    for index in range(1 << len(GATE_INPUT_BITS)):
+        compiled_gate_verdict(index, ablation=ablation)
+    return bytes(_GATE_TABLES[ablation or GateAblation()])
+
+
+def decision_gate_verdict_from_fields(
+    fields: dict[str, Any], *, ablation: GateAblation | None = None
+) -> Verdict:
+    return compiled_gate_verdict(gate_index_from_fields(fields), ablation=ablation)
 
 
 def make_base_fields() -> dict[str, object]:
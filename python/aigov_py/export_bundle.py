@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import sys
-import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from aigov_py.artifact_fingerprint import sha256_path
+from aigov_py.artifact_store import ArtifactStore
+from aigov_py.pack_writer import PackWriter, reusable_pack
+
+PACK_INDEX_SCHEMA = "aigov.pack_index.v1"
+
+# Default cap on evidence + report bytes of runs being exported concurrently.
+DEFAULT_MAX_IN_FLIGHT_BYTES = 512 * 1024 * 1024
 
 
 def _repo_root() -> Path:
@@ -21,18 +31,6 @@ def _sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
-def _load_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
 def _atomic_write(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
@@ -135,12 +133,49 @@ def _extract_identifiers(evidence: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def export_bundle(run_id: str) -> None:
+def _reusable_audit_bytes(path: Path, run_id: str, hashes: Dict[str, str]) -> Optional[bytes]:
+    """Existing audit JSON bytes if they were generated for exactly these input hashes."""
+    try:
+        raw = path.read_bytes()
+        obj = json.loads(raw.decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(obj, dict) or obj.get("run_id") != run_id or obj.get("hashes") != hashes:
+        return None
+    return raw
+
+
+def _linked_sha256(store: Optional[ArtifactStore], path: Path, audit_path: Path, key: str) -> Optional[str]:
+    """Hash recorded in the existing audit JSON if `path` is still a store ref to it (not read)."""
+    if store is None:
+        return None
+    try:
+        recorded = json.loads(audit_path.read_text(encoding="utf-8")).get("hashes", {}).get(key)
+    except (OSError, ValueError, AttributeError):
+        return None
+    if isinstance(recorded, str) and store.holds(path, recorded):
+        return recorded
+    return None
+
+
+def export_bundle(run_id: str, *, root: Optional[Path] = None, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Write docs/audit/<run_id>.json and docs/packs/<run_id>.zip under `root` (default: repo root).
+
+    The pack is deterministic. When the evidence and report hashes match the ones recorded
+    in the existing audit JSON (and the pack's digest sidecar), audit JSON and pack are
+    reused as they are: one read per input, nothing compressed or written. Otherwise the
+    evidence is parsed, hashed and packed from one buffer and the pack digest is computed
+    while the archive is written. Returns the audit object plus `pack_sha256` / `pack_reused`.
+
+    With an artifact store (`.govai/cas`), inputs and outputs become store refs, and a report
+    that is still a ref to its recorded hash is not re-read.
+    """
     run_id = run_id.strip()
     if not run_id:
         raise SystemExit("run_id is required")
 
-    root = _repo_root()
+    root = root if root is not None else _repo_root()
 
     evidence_path = root / "docs" / "evidence" / f"{run_id}.json"
     report_path = root / "docs" / "reports" / f"{run_id}.md"
@@ -156,12 +191,12 @@ def export_bundle(run_id: str) -> None:
     if not report_path.exists():
         raise FileNotFoundError(f"Missing report file: {report_path}")
 
-    evidence_obj = _load_json(evidence_path)
+    evidence_bytes = evidence_path.read_bytes()
+    evidence_obj: Dict[str, Any] = json.loads(evidence_bytes.decode("utf-8"))
     policy_version = _policy_version_from_evidence(evidence_obj) or "unknown"
     identifiers = _extract_identifiers(evidence_obj)
 
-    evidence_sha256 = _sha256_file(evidence_path)
-    report_sha256 = _sha256_file(report_path)
+    evidence_sha256 = _sha256_bytes(evidence_bytes)
 
     bundle_sha256 = str(evidence_obj.get("bundle_sha256") or "").strip()
     chain_head: Optional[str] = None
@@ -180,44 +215,195 @@ def export_bundle(run_id: str) -> None:
             evidence_chain_head_sha256=chain_head,
         )
 
-    audit_obj: Dict[str, Any] = {
-        "run_id": run_id,
-        "bundle_sha256": bundle_sha256,
-        "policy_version": policy_version,
-        "identifiers": identifiers,
-        "generated_ts_utc": _utc_now_iso(),
-        "evidence_chain_head_sha256": chain_head,
-        "hashes": {
-            "evidence_sha256": evidence_sha256,
-            "report_sha256": report_sha256,
-        },
-        "paths": {
-            "evidence_json": f"docs/evidence/{run_id}.json",
-            "report_md": f"docs/reports/{run_id}.md",
-        },
+    audit_json_path = audit_dir / f"{run_id}.json"
+    zip_path = packs_dir / f"{run_id}.zip"
+
+    store = ArtifactStore.open(root)
+    report_sha256 = _linked_sha256(store, report_path, audit_json_path, "report_sha256") or sha256_path(report_path)
+    hashes = {
+        "evidence_sha256": evidence_sha256,
+        "report_sha256": report_sha256,
     }
 
-    audit_json_path = audit_dir / f"{run_id}.json"
-    audit_bytes = json.dumps(audit_obj, ensure_ascii=False, indent=2).encode("utf-8")
-    _atomic_write(audit_json_path, audit_bytes)
+    # Unchanged inputs: keep the existing audit JSON byte for byte (incl. generated_ts_utc),
+    # so the pack built from it is identical too.
+    audit_bytes = _reusable_audit_bytes(audit_json_path, run_id, hashes)
+    audit_reused = audit_bytes is not None
+    if audit_bytes is None:
+        audit_obj: Dict[str, Any] = {
+            "run_id": run_id,
+            "bundle_sha256": bundle_sha256,
+            "policy_version": policy_version,
+            "identifiers": identifiers,
+            "generated_ts_utc": _utc_now_iso(),
+            "evidence_chain_head_sha256": chain_head,
+            "hashes": hashes,
+            "paths": {
+                "evidence_json": f"docs/evidence/{run_id}.json",
+                "report_md": f"docs/reports/{run_id}.md",
+            },
+        }
+        audit_bytes = json.dumps(audit_obj, ensure_ascii=False, indent=2).encode("utf-8")
+        _atomic_write(audit_json_path, audit_bytes)
+    else:
+        audit_obj = json.loads(audit_bytes.decode("utf-8"))
 
     # ----------------------------
-    # CREATE FINAL PACK ZIP
+    # CREATE FINAL PACK ZIP (deterministic; skipped when built from the same inputs)
     # ----------------------------
-    zip_path = packs_dir / f"{run_id}.zip"
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
-        z.write(evidence_path, arcname=f"evidence/{run_id}.json")
-        z.write(report_path, arcname=f"reports/{run_id}.md")
-        z.write(audit_json_path, arcname=f"audit/{run_id}.json")
+    evidence_arc = f"evidence/{run_id}.json"
+    report_arc = f"reports/{run_id}.md"
+    audit_arc = f"audit/{run_id}.json"
+    digest = reusable_pack(
+        zip_path,
+        {evidence_arc: evidence_sha256, report_arc: report_sha256, audit_arc: _sha256_bytes(audit_bytes)},
+    )
+    reused = digest is not None
+    if digest is None:
+        with PackWriter(zip_path) as pack:
+            pack.add_bytes(evidence_arc, evidence_bytes)
+            pack.add_file(report_arc, report_path)
+            pack.add_bytes(audit_arc, audit_bytes)
+        digest = pack.close()
+
+    if store is not None:
+        store.ingest(evidence_path, evidence_sha256)
+        store.ingest(report_path, report_sha256)
+        store.ingest(audit_json_path, _sha256_bytes(audit_bytes))
+        store.ingest(zip_path, digest["sha256"])
+
+    if verbose:
+        print(f"{'unchanged' if audit_reused else 'saved'} {audit_json_path}")
+        print(f"{'unchanged' if reused else 'saved'} {zip_path}")
+        print(f"bundle_sha256={audit_obj.get('bundle_sha256')}")
+        print(f"pack_sha256={digest['sha256']}")
+    return {**audit_obj, "pack_sha256": digest["sha256"], "pack_reused": reused}
+
+
+def list_run_ids(root: Optional[Path] = None) -> List[str]:
+    """Run ids with an evidence bundle under docs/evidence/, sorted."""
+    root = root if root is not None else _repo_root()
+    return sorted(p.stem for p in (root / "docs" / "evidence").glob("*.json") if p.is_file())
+
+
+def read_run_ids_file(path: Path) -> List[str]:
+    """One run id per line; blank lines and `#` comments are ignored, duplicates dropped."""
+    seen: Dict[str, None] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        rid = line.split("#", 1)[0].strip()
+        if rid:
+            seen.setdefault(rid, None)
+    return list(seen)
+
+
+def _input_bytes(root: Path, run_id: str) -> int:
+    total = 0
+    for p in (root / "docs" / "evidence" / f"{run_id}.json", root / "docs" / "reports" / f"{run_id}.md"):
+        try:
+            total += p.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _export_one(run_id: str, root: str) -> Dict[str, Any]:
+    """Worker: export one run; failures are returned, never raised."""
+    try:
+        out = export_bundle(run_id, root=Path(root), verbose=False)
+    except SystemExit as e:
+        return {"run_id": run_id, "ok": False, "error": str(e.code)}
+    except Exception as e:
+        return {"run_id": run_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {
+        "run_id": run_id,
+        "ok": True,
+        "bundle_sha256": out.get("bundle_sha256"),
+        "pack_sha256": out["pack_sha256"],
+        "pack_reused": out["pack_reused"],
+        "pack": f"docs/packs/{run_id}.zip",
+    }
 
-    print(f"saved {audit_json_path}")
-    print(f"saved {zip_path}")
-    print(f"bundle_sha256={bundle_sha256}")
+
+def export_bundles(
+    run_ids: Iterable[str],
+    *,
+    root: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES,
+    index_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Export many runs on a process pool and write a pack index (default docs/packs/index.json).
+
+    New runs are submitted only while the evidence + report bytes of the runs in flight stay
+    within `max_in_flight_bytes` (one run is always admitted), so memory is bounded for any
+    number of runs. Per-run failures are collected in `errors`; they do not stop the batch.
+    """
+    root = root if root is not None else _repo_root()
+    ids = list(dict.fromkeys(r.strip() for r in run_ids if r.strip()))
+    workers = max(1, min(len(ids) or 1, max_workers or os.cpu_count() or 1))
+    results: List[Dict[str, Any]] = []
+
+    if workers == 1:
+        results = [_export_one(rid, str(root)) for rid in ids]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: Dict[Future[Dict[str, Any]], int] = {}
+            in_flight = 0
+            queue = iter(ids)
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < 2 * workers and (not pending or in_flight < max_in_flight_bytes):
+                    rid = next(queue, None)
+                    if rid is None:
+                        exhausted = True
+                        break
+                    cost = _input_bytes(root, rid)
+                    pending[pool.submit(_export_one, rid, str(root))] = cost
+                    in_flight += cost
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    in_flight -= pending.pop(fut)
+                    results.append(fut.result())
+
+    results.sort(key=lambda r: r["run_id"])
+    packs = [{k: v for k, v in r.items() if k != "ok"} for r in results if r["ok"]]
+    errors = [{"run_id": r["run_id"], "error": r["error"]} for r in results if not r["ok"]]
+    index = {
+        "schema_version": PACK_INDEX_SCHEMA,
+        "generated_ts_utc": _utc_now_iso(),
+        "packs": packs,
+        "errors": errors,
+    }
+    index_path = index_path if index_path is not None else root / "docs" / "packs" / "index.json"
+    _atomic_write(index_path, json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8"))
+    return {
+        "index": str(index_path),
+        "exported": len(packs),
+        "reused": sum(1 for p in packs if p.get("pack_reused")),
+        "failed": len(errors),
+        "errors": errors,
+    }
 
 
 def main(argv: list[str]) -> None:
+    usage = "Usage: python -m aigov_py.export_bundle <run_id> | --all | --run-ids-file <path>"
     if len(argv) < 2:
-        raise SystemExit("Usage: python -m aigov_py.export_bundle <run_id>")
+        raise SystemExit(usage)
+    if argv[1] in ("--all", "--run-ids-file"):
+        if argv[1] == "--all":
+            ids = list_run_ids()
+        elif len(argv) > 2:
+            ids = read_run_ids_file(Path(argv[2]))
+        else:
+            raise SystemExit(usage)
+        summary = export_bundles(ids)
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        if summary["failed"]:
+            raise SystemExit(1)
+        return
     export_bundle(argv[1])
 
 
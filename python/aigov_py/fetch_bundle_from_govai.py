@@ -9,6 +9,8 @@ from urllib.parse import quote
 
 import requests
 
+from aigov_py.artifact_store import break_link
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -94,6 +96,7 @@ def main(argv: list[str]) -> None:
 
     out_path = _evidence_path(run_id)
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    break_link(out_path)
     out_path.write_text(json.dumps(bundle, ensure_ascii=False, indent=2), encoding="utf-8")
 
     print(f"saved evidence bundle: {out_path}")
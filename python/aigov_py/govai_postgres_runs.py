@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from aigov_py.psycopg_database_url import resolve_psycopg_database_url
 
+RUN_ROW_COLUMNS = (
+    "id",
+    "created_at",
+    "mode",
+    "status",
+    "policy_version",
+    "bundle_sha256",
+    "evidence_sha256",
+    "report_sha256",
+    "evidence_source",
+    "closed_at",
+    "environment",
+)
 
-def upsert_run_row_postgres(row: Dict[str, Any]) -> None:
-    """Upsert a single run manifest row into ``console.runs`` (GovAI Postgres)."""
-    try:
-        import psycopg
-    except ImportError as e:  # pragma: no cover - optional dependency
-        raise RuntimeError(
-            "Install psycopg for postgres run persistence (e.g. pip install 'aigov-py[runs-postgres]')"
-        ) from e
+# Rows per round of `upsert_run_rows`; batches at least `COPY_MIN_ROWS` long go through COPY.
+DEFAULT_BATCH_SIZE = 5000
+COPY_MIN_ROWS = 200
+
+_UPDATE_SET = ",\n      ".join(f"{c} = excluded.{c}" for c in RUN_ROW_COLUMNS if c != "id")
 
-    sql = """
+_UPSERT_SQL = f"""
     insert into console.runs (
       id, created_at, mode, status, policy_version, bundle_sha256,
       evidence_sha256, report_sha256, evidence_source, closed_at, environment
@@ -24,18 +37,154 @@ def upsert_run_row_postgres(row: Dict[str, Any]) -> None:
       %(closed_at)s::timestamptz, coalesce(%(environment)s, 'dev')
     )
     on conflict (id) do update set
-      created_at = excluded.created_at,
-      mode = excluded.mode,
-      status = excluded.status,
-      policy_version = excluded.policy_version,
-      bundle_sha256 = excluded.bundle_sha256,
-      evidence_sha256 = excluded.evidence_sha256,
-      report_sha256 = excluded.report_sha256,
-      evidence_source = excluded.evidence_source,
-      closed_at = excluded.closed_at,
-      environment = excluded.environment
+      {_UPDATE_SET}
+    """
+
+_STAGE_SQL = "create temp table if not exists _runs_stage (like console.runs) on commit delete rows"
+
+_MERGE_SQL = f"""
+    insert into console.runs ({", ".join(RUN_ROW_COLUMNS)})
+    select {", ".join(RUN_ROW_COLUMNS)} from _runs_stage
+    on conflict (id) do update set
+      {_UPDATE_SET}
+    """
+
+
+def _psycopg() -> Any:
+    try:
+        import psycopg
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "Install psycopg for postgres run persistence (e.g. pip install 'aigov-py[runs-postgres]')"
+        ) from e
+    return psycopg
+
+
+class ConnectionPool:
     """
+    Small thread-safe pool of psycopg connections to one database URL.
 
-    with psycopg.connect(resolve_psycopg_database_url(), autocommit=True) as conn:
+    Idle connections are reused; broken ones are dropped on return. At most `max_size`
+    connections are kept idle (more may be open briefly under contention).
+    """
+
+    def __init__(self, url: str, *, max_size: int = 4) -> None:
+        self.url = url
+        self.max_size = max_size
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None or conn.closed:
+            conn = _psycopg().connect(self.url)
+        ok = False
+        try:
+            yield conn
+            conn.commit()
+            ok = True
+        finally:
+            if not ok and not conn.closed:
+                try:
+                    conn.rollback()
+                except Exception:
+                    conn.close()
+            reusable = not conn.closed and not getattr(conn, "broken", False)
+            with self._lock:
+                if reusable and len(self._idle) < self.max_size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_POOL: Optional[ConnectionPool] = None
+_POOL_PID = 0
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Process-wide pool for the resolved GovAI database URL (new after a fork or URL change)."""
+    global _POOL, _POOL_PID
+    url = resolve_psycopg_database_url()
+    with _POOL_LOCK:
+        if _POOL is None or _POOL.url != url or _POOL_PID != os.getpid():
+            if _POOL is not None and _POOL_PID == os.getpid():
+                _POOL.close()
+            _POOL, _POOL_PID = ConnectionPool(url), os.getpid()
+        return _POOL
+
+
+def _dedupe_last(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep the last row per id (one statement cannot update the same row twice)."""
+    by_id: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        by_id.pop(row["id"], None)
+        by_id[row["id"]] = row
+    return list(by_id.values())
+
+
+def _copy_values(row: Dict[str, Any]) -> tuple:
+    values = [row.get(c) for c in RUN_ROW_COLUMNS]
+    if values[-1] is None:
+        values[-1] = "dev"
+    return tuple(values)
+
+
+def _write_batch(cur: Any, batch: List[Dict[str, Any]]) -> None:
+    if len(batch) < COPY_MIN_ROWS:
+        # psycopg pipelines executemany: one round trip for the whole batch.
+        cur.executemany(_UPSERT_SQL, [{c: r.get(c) for c in RUN_ROW_COLUMNS} for r in batch])
+        return
+    cur.execute(_STAGE_SQL)
+    with cur.copy(f"copy _runs_stage ({', '.join(RUN_ROW_COLUMNS)}) from stdin") as copy:
+        for row in batch:
+            copy.write_row(_copy_values(row))
+    cur.execute(_MERGE_SQL)
+
+
+def upsert_run_rows(
+    rows: Iterable[Dict[str, Any]],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pool: Optional[ConnectionPool] = None,
+) -> int:
+    """
+    Upsert run manifest rows into ``console.runs`` over one pooled connection.
+
+    Rows are written in batches of `batch_size`, each in its own transaction: small batches
+    with pipelined ``executemany``, larger ones with ``COPY`` into a temp table and a single
+    ``INSERT ... ON CONFLICT`` merge. Within a batch the last row per id wins. Returns the
+    number of rows written.
+    """
+    pool = pool if pool is not None else get_pool()
+    total = 0
+    batch: List[Dict[str, Any]] = []
+    with pool.connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, row)
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    deduped = _dedupe_last(batch)
+                    _write_batch(cur, deduped)
+                    conn.commit()
+                    total += len(deduped)
+                    batch = []
+            if batch:
+                deduped = _dedupe_last(batch)
+                _write_batch(cur, deduped)
+                total += len(deduped)
+    return total
+
+
+def upsert_run_row_postgres(row: Dict[str, Any]) -> None:
+    """Upsert a single run manifest row into ``console.runs`` (GovAI Postgres)."""
+    upsert_run_rows([row])
@@ -0,0 +1,405 @@
+"""
+Pipelined, resumable ingest of many runs (``python -m aigov_py.ingest_run --all``).
+
+Stages run concurrently and are connected by bounded queues, so a slow stage applies
+back-pressure instead of buffering thousands of runs:
+
+    run ids -> hash + build row (N threads) -> batched upsert (1 thread) -> upload (M threads)
+
+Every finished run is appended to a JSONL state file (default ``.govai/ingest-state.jsonl``)
+with the fingerprint of what was ingested (the row's sha256 fields and the pack's size and
+mtime). A restarted ingest skips a run marked ``done`` only while its fingerprint still
+matches, so re-exported runs are ingested again; failed runs are retried. ``--restart``
+ignores the existing state. Progress with rate and ETA is reported on stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+from aigov_py.export_bundle import list_run_ids, read_run_ids_file
+from aigov_py.ingest_run import (
+    _artifact_paths,
+    _get_mode,
+    _repo_root_from_here,
+    _should_upload_to_storage,
+    build_run_row,
+)
+from aigov_py.storage_upload import (
+    StorageBackend,
+    SupabaseStorageBackend,
+    UploadManifest,
+    default_upload_manifest_path,
+    run_upload_items,
+    upload_artifacts,
+)
+
+INGEST_STATE_SCHEMA = "aigov.ingest_state.v1"
+
+# Relative to the repo root, next to the other local state.
+DEFAULT_STATE_RELPATH = Path(".govai") / "ingest-state.jsonl"
+
+DEFAULT_HASH_WORKERS = 4
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+_DONE = object()
+
+
+# Row fields that identify the ingested content of a run.
+_FINGERPRINT_FIELDS = ("bundle_sha256", "evidence_sha256", "report_sha256")
+
+
+def run_fingerprint(row: Dict[str, Any], pack_zip: Path) -> Dict[str, Any]:
+    """Content identity of an ingested run: the row's hashes plus the pack's (size, mtime_ns)."""
+    try:
+        st = pack_zip.stat()
+        pack: Optional[List[int]] = [st.st_size, st.st_mtime_ns]
+    except OSError:
+        pack = None
+    return {**{k: row.get(k) for k in _FINGERPRINT_FIELDS}, "pack_zip": pack}
+
+
+class IngestState:
+    """
+    Append-only JSONL log of finished runs; the last record per run wins. `done` maps each
+    finished run to the fingerprint it was ingested with. `restart` ignores existing records.
+    """
+
+    def __init__(self, path: Path, *, restart: bool = False) -> None:
+        self.path = path
+        self.done: Dict[str, Optional[Dict[str, Any]]] = {}
+        if not restart:
+            self._load()
+        self._lock = threading.Lock()
+        self._fp: Optional[TextIO] = None
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line after a crash
+                    if not isinstance(rec, dict) or rec.get("schema") != INGEST_STATE_SCHEMA:
+                        continue
+                    fingerprint = rec.get("fingerprint")
+                    if rec.get("status") == "done":
+                        self.done[str(rec.get("run_id"))] = fingerprint if isinstance(fingerprint, dict) else None
+                    else:
+                        self.done.pop(str(rec.get("run_id")), None)
+        except OSError:
+            pass
+
+    def mark(self, run_id: str, status: str, **extra: Any) -> None:
+        rec = {"schema": INGEST_STATE_SCHEMA, "run_id": run_id, "status": status, "ts": time.time(), **extra}
+        with self._lock:
+            if self._fp is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fp = self.path.open("a", encoding="utf-8")
+            self._fp.write(json.dumps(rec) + "\n")
+            self._fp.flush()
+            if status == "done":
+                self.done[run_id] = extra.get("fingerprint")
+            else:
+                self.done.pop(run_id, None)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+
+
+class Progress:
+    """Thread-safe counters with a periodic rate / ETA line."""
+
+    def __init__(self, total: int, out: TextIO, interval: float) -> None:
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self.out = out
+        self.interval = interval
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def tick(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self.done += 1
+            else:
+                self.failed += 1
+
+    def skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def line(self) -> str:
+        with self._lock:
+            finished = self.done + self.failed + self.skipped
+            done, failed, skipped = self.done, self.failed, self.skipped
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        rate = finished / elapsed
+        eta = f"{(self.total - finished) / rate:.0f}s" if rate > 0 else "?"
+        return (
+            f"ingest: {finished}/{self.total} ({done} done, {skipped} unchanged, {failed} failed) "
+            f"{rate:.1f} runs/s eta {eta}"
+        )
+
+    def start(self) -> None:
+        if self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="ingest-progress", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            print(self.line(), file=self.out, flush=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        print(self.line(), file=self.out, flush=True)
+
+
+def run_ingest_pipeline(
+    run_ids: Iterable[str],
+    *,
+    root: Optional[Path] = None,
+    state_path: Optional[Path] = None,
+    restart: bool = False,
+    upsert: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+    backend: Optional[StorageBackend] = None,
+    upload: Optional[bool] = None,
+    force_upload: bool = False,
+    hash_workers: int = DEFAULT_HASH_WORKERS,
+    upload_workers: int = DEFAULT_UPLOAD_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+    progress_out: TextIO = sys.stderr,
+) -> Dict[str, Any]:
+    """
+    Ingest `run_ids`. Runs already `done` in the state file are skipped while their
+    fingerprint (`run_fingerprint`) is unchanged; `restart` ignores the state file. `upsert`
+    defaults to ``run_rows.upsert_run_rows``; uploads follow ``AIGOV_STORAGE_UPLOAD`` / mode unless
+    `upload` is given, to Supabase unless `backend` is given; `force_upload` uploads even
+    objects the upload manifest records as unchanged. Returns counts and failures.
+    """
+    root = root if root is not None else _repo_root_from_here()
+    state = IngestState(state_path if state_path is not None else root / DEFAULT_STATE_RELPATH, restart=restart)
+    upsert_rows: Callable[[List[Dict[str, Any]]], Any]
+    if upsert is None:
+        from aigov_py.run_rows import upsert_run_rows
+
+        upsert_rows = upsert_run_rows
+    else:
+        upsert_rows = upsert
+
+    if upload is None:
+        upload = _should_upload_to_storage(_get_mode())
+    manifest: Optional[UploadManifest] = None
+    if upload:
+        if backend is None:
+            from aigov_py.supabase_db import create_supabase_client
+
+            backend = SupabaseStorageBackend(create_supabase_client(strict=True))
+        manifest = UploadManifest(default_upload_manifest_path(root))
+
+    requested = list(dict.fromkeys(r.strip() for r in run_ids if r.strip()))
+    hash_workers = max(1, hash_workers)
+    upload_workers = max(1, upload_workers)
+    q_ids: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    q_rows: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    q_upload: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    failures: List[Dict[str, Any]] = []
+    failures_lock = threading.Lock()
+    fingerprints: Dict[str, Dict[str, Any]] = {}
+    progress = Progress(len(requested), progress_out, progress_interval)
+
+    def fail(run_id: str, stage: str, error: str) -> None:
+        with failures_lock:
+            failures.append({"run_id": run_id, "stage": stage, "error": error})
+        state.mark(run_id, "failed", stage=stage, error=error)
+        progress.tick(False)
+
+    def finish(run_id: str) -> None:
+        state.mark(run_id, "done", fingerprint=fingerprints.pop(run_id, None))
+        progress.tick(True)
+
+    def feed() -> None:
+        for run_id in requested:
+            q_ids.put(run_id)
+        for _ in range(hash_workers):
+            q_ids.put(_DONE)
+
+    def hasher() -> None:
+        while True:
+            run_id = q_ids.get()
+            if run_id is _DONE:
+                q_rows.put(_DONE)
+                return
+            try:
+                paths = _artifact_paths(run_id, root)
+                if not paths.audit_json.exists():
+                    raise FileNotFoundError(f"missing audit JSON for {run_id}")
+                row = build_run_row(run_id, root=root)
+                fingerprint = run_fingerprint(row, paths.pack_zip)
+                if state.done.get(run_id) == fingerprint:
+                    progress.skip()
+                    continue
+                fingerprints[run_id] = fingerprint
+                q_rows.put((run_id, row))
+            except Exception as e:
+                fail(run_id, "hash", f"{type(e).__name__}: {e}")
+
+    def flush(batch: List[Any]) -> None:
+        try:
+            upsert_rows([row for _, row in batch])
+        except Exception as e:
+            for run_id, _ in batch:
+                fail(run_id, "upsert", f"{type(e).__name__}: {e}")
+            return
+        for run_id, _ in batch:
+            if upload:
+                q_upload.put(run_id)
+            else:
+                finish(run_id)
+
+    def upserter() -> None:
+        batch: List[Any] = []
+        finished_hashers = 0
+        while finished_hashers < hash_workers:
+            try:
+                item = q_rows.get(timeout=0.5)
+            except queue.Empty:
+                # Idle input: write what we have rather than waiting for a full batch.
+                if batch:
+                    flush(batch)
+                    batch = []
+                continue
+            if item is _DONE:
+                finished_hashers += 1
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+        for _ in range(upload_workers):
+            q_upload.put(_DONE)
+
+    def uploader() -> None:
+        assert backend is not None
+        while True:
+            run_id = q_upload.get()
+            if run_id is _DONE:
+                return
+            paths = _artifact_paths(run_id, root)
+            items = run_upload_items(
+                run_id, pack_zip=paths.pack_zip, audit_json=paths.audit_json, evidence_json=paths.evidence_json
+            )
+            try:
+                # Concurrency is across runs (one run per thread); the manifest is saved once at the end.
+                results = upload_artifacts(
+                    backend, items, manifest=manifest, max_workers=1, save_manifest=False, force=force_upload
+                )
+            except Exception as e:
+                fail(run_id, "upload", f"{type(e).__name__}: {e}")
+                continue
+            bad = [f"{r.bucket}/{r.object_name}: {r.message}" for r in results if not r.ok]
+            if bad:
+                fail(run_id, "upload", "; ".join(bad))
+            else:
+                finish(run_id)
+
+    threads = [threading.Thread(target=feed, name="ingest-feed", daemon=True)]
+    threads += [threading.Thread(target=hasher, name=f"ingest-hash-{i}", daemon=True) for i in range(hash_workers)]
+    threads.append(threading.Thread(target=upserter, name="ingest-upsert", daemon=True))
+    if upload:
+        threads += [
+            threading.Thread(target=uploader, name=f"ingest-upload-{i}", daemon=True) for i in range(upload_workers)
+        ]
+    progress.start()
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        progress.stop()
+        state.close()
+        if manifest is not None:
+            manifest.save()
+
+    return {
+        "total": len(requested),
+        "skipped": progress.skipped,
+        "done": progress.done,
+        "failed": progress.failed,
+        "failures": sorted(failures, key=lambda f: f["run_id"]),
+        "state": str(state.path),
+    }
+
+
+def main(argv: List[str]) -> int:
+    """``python -m aigov_py.ingest_run --all | --run-ids-file <path> [options]``."""
+    ap = argparse.ArgumentParser(prog="python -m aigov_py.ingest_run", description="Pipelined ingest of many runs.")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--all", action="store_true", help="Every run with docs/evidence/<run_id>.json.")
+    src.add_argument("--run-ids-file", type=Path, help="Run ids, one per line (# comments allowed).")
+    ap.add_argument("--state", type=Path, default=None, help=f"Resume state file (default: <repo>/{DEFAULT_STATE_RELPATH}).")
+    ap.add_argument("--restart", action="store_true", help="Ignore the resume state and ingest every run again.")
+    ap.add_argument(
+        "--force-upload",
+        action="store_true",
+        help="Upload artifacts even when the upload manifest records them as unchanged.",
+    )
+    ap.add_argument("--hash-workers", type=int, default=DEFAULT_HASH_WORKERS, help="Threads hashing artifacts / building rows.")
+    ap.add_argument("--upload-workers", type=int, default=DEFAULT_UPLOAD_WORKERS, help="Threads uploading artifacts.")
+    ap.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per batched upsert.")
+    ap.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE, help="Capacity of each inter-stage queue.")
+    ap.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_PROGRESS_INTERVAL,
+        help="Seconds between progress lines on stderr (0: only the final line).",
+    )
+    args = ap.parse_args(argv)
+    if min(args.hash_workers, args.upload_workers, args.batch_size, args.queue_size) < 1:
+        print("--hash-workers, --upload-workers, --batch-size and --queue-size must be >= 1", file=sys.stderr)
+        return 2
+
+    try:
+        ids = list_run_ids() if args.all else read_run_ids_file(args.run_ids_file)
+    except OSError as e:
+        print(f"cannot read run ids: {e}", file=sys.stderr)
+        return 2
+
+    summary = run_ingest_pipeline(
+        ids,
+        state_path=args.state,
+        restart=args.restart,
+        force_upload=args.force_upload,
+        hash_workers=args.hash_workers,
+        upload_workers=args.upload_workers,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size,
+        progress_interval=args.progress_interval,
+    )
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failed"] else 0
@@ -11,8 +11,7 @@ from typing import Any, Dict, Optional
 
 from aigov_py.env_resolution import resolve_aigov_environment
 from aigov_py.run_rows import upsert_run_row
-from aigov_py.supabase_db import create_supabase_client
-from aigov_py.storage_upload import upload_artifacts_for_run
+from aigov_py.storage_upload import UploadManifest, default_upload_manifest_path, upload_artifacts_for_run
 
 
 @dataclass(frozen=True)
@@ -63,8 +62,8 @@ def _get_mode() -> str:
     return v or "ci"
 
 
-def _artifact_paths(run_id: str) -> ArtifactPaths:
-    root = _repo_root_from_here()
+def _artifact_paths(run_id: str, root: Optional[Path] = None) -> ArtifactPaths:
+    root = root if root is not None else _repo_root_from_here()
     return ArtifactPaths(
         repo_root=root,
         audit_json=root / "docs" / "audit" / f"{run_id}.json",
@@ -175,10 +174,10 @@ def _should_upload_to_storage(mode: str) -> bool:
     return m in ("ci", "prod")
 
 
-def build_run_row(run_id: str) -> Dict[str, Any]:
+def build_run_row(run_id: str, *, root: Optional[Path] = None) -> Dict[str, Any]:
     mode = _get_mode()
     environment = resolve_aigov_environment()
-    paths = _artifact_paths(run_id)
+    paths = _artifact_paths(run_id, root)
 
     audit_obj = _read_json(paths.audit_json)
 
@@ -222,11 +221,13 @@ def build_run_row(run_id: str) -> Dict[str, Any]:
     return row
 
 
-def upload_run_artifacts(run_id: str, mode: str) -> None:
+def upload_run_artifacts(run_id: str, mode: str, *, force: bool = False) -> None:
     if not _should_upload_to_storage(mode):
         print("storage upload skipped")
         return
 
+    from aigov_py.supabase_db import create_supabase_client
+
     client = create_supabase_client(strict=True)
     paths = _artifact_paths(run_id)
 
@@ -236,11 +237,15 @@ def upload_run_artifacts(run_id: str, mode: str) -> None:
         pack_zip=paths.pack_zip,
         audit_json=paths.audit_json,
         evidence_json=paths.evidence_json,
+        manifest=UploadManifest(default_upload_manifest_path(paths.repo_root)),
+        force=force,
     )
 
     ok_all = True
     for r in results:
-        if r.ok:
+        if r.skipped:
+            print(f"storage upload skipped (unchanged) bucket={r.bucket} object={r.object_name}")
+        elif r.ok:
             print(f"storage upload ok bucket={r.bucket} object={r.object_name}")
         else:
             ok_all = False
@@ -252,9 +257,18 @@ def upload_run_artifacts(run_id: str, mode: str) -> None:
 
 def main(argv: list[str]) -> int:
     if len(argv) < 2:
-        print("Usage: python -m aigov_py.ingest_run <RUN_ID>", file=sys.stderr)
+        print(
+            "Usage: python -m aigov_py.ingest_run <RUN_ID> [--force-upload] | --all | --run-ids-file <path> [options]",
+            file=sys.stderr,
+        )
         return 2
 
+    if argv[1].startswith("--"):
+        # Many runs: staged, resumable pipeline.
+        from aigov_py.ingest_pipeline import main as pipeline_main
+
+        return pipeline_main(argv[1:])
+
     run_id = argv[1].strip()
     if not run_id:
         print("RUN_ID is required", file=sys.stderr)
@@ -268,7 +282,7 @@ def main(argv: list[str]) -> int:
     upsert_run_row(row)
 
     mode = str(row.get("mode") or _get_mode())
-    upload_run_artifacts(run_id, mode)
+    upload_run_artifacts(run_id, mode, force="--force-upload" in argv[2:])
 
     print(f"ingested run {run_id} (run metadata per AIGOV_RUN_PERSISTENCE)")
     return 0
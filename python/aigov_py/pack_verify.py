@@ -0,0 +1,181 @@
+"""
+Verify evidence packs against their ``manifest.json`` (``aigov.pack.manifest.v1``).
+
+A pack is either a zip (``docs/packs/<run_id>.zip``) or a staging directory
+(``docs/packs/<run_id>/``) holding ``manifest.json`` next to the listed files. Every listed
+file is hashed and counted; zip members are streamed straight out of the archive, nothing is
+extracted. Files of all packs are checked on one thread pool (hashing and inflating release
+the GIL), so a directory of many packs is verified in parallel.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+MANIFEST_SCHEMA = "aigov.pack.manifest.v1"
+MANIFEST_NAME = "manifest.json"
+PACK_VERIFY_SCHEMA = "aigov.pack_verify.v1"
+
+_CHUNK = 1024 * 1024
+
+
+@dataclass
+class _Pack:
+    path: Path
+    kind: str  # "zip" | "dir"
+    files: List[Dict[str, Any]] = field(default_factory=list)
+    unlisted: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def find_packs(path: Path) -> Tuple[List[Path], List[Path]]:
+    """
+    Packs under `path`: the path itself if it is a zip or a directory with a manifest,
+    otherwise the zips and manifest directories directly inside it.
+
+    Returns ``(packs, skipped)``; `skipped` are zips in a scanned directory without a
+    manifest (e.g. audit bundles from ``export-bundle``), which are not evidence packs.
+    """
+    if path.is_file() or (path / MANIFEST_NAME).is_file():
+        return [path], []
+    packs: List[Path] = []
+    skipped: List[Path] = []
+    for child in sorted(path.iterdir()):
+        if child.is_dir() and (child / MANIFEST_NAME).is_file():
+            packs.append(child)
+        elif child.is_file() and child.suffix == ".zip":
+            try:
+                with zipfile.ZipFile(child) as zf:
+                    has_manifest = MANIFEST_NAME in zf.NameToInfo
+            except (OSError, zipfile.BadZipFile):
+                has_manifest = True  # report it as a broken pack rather than skipping it
+            (packs if has_manifest else skipped).append(child)
+    return packs, skipped
+
+
+def _safe_member(name: str) -> bool:
+    p = PurePosixPath(name)
+    return bool(name) and not p.is_absolute() and ".." not in p.parts and "\\" not in name
+
+
+def _load_pack(path: Path) -> _Pack:
+    kind = "zip" if path.is_file() else "dir"
+    pack = _Pack(path=path, kind=kind)
+    try:
+        if kind == "zip":
+            with zipfile.ZipFile(path) as zf:
+                manifest = json.loads(zf.read(MANIFEST_NAME).decode("utf-8"))
+                present = [n for n in zf.namelist() if not n.endswith("/")]
+        else:
+            manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+            present = sorted(
+                str(p.relative_to(path).as_posix()) for p in path.rglob("*") if p.is_file()
+            )
+    except KeyError:
+        pack.error = f"missing {MANIFEST_NAME}"
+        return pack
+    except (OSError, ValueError, zipfile.BadZipFile) as e:
+        pack.error = f"{type(e).__name__}: {e}"
+        return pack
+
+    if not isinstance(manifest, dict) or manifest.get("schema_version") != MANIFEST_SCHEMA:
+        pack.error = f"unsupported manifest schema (expected {MANIFEST_SCHEMA})"
+        return pack
+    entries = manifest.get("files")
+    if not isinstance(entries, list):
+        pack.error = "manifest.files is not a list"
+        return pack
+    for entry in entries:
+        name = (entry.get("path") or entry.get("name")) if isinstance(entry, dict) else None
+        if not isinstance(name, str) or not _safe_member(name):
+            pack.error = f"invalid manifest entry: {entry!r}"
+            return pack
+        pack.files.append(
+            {"name": name, "sha256": str(entry.get("sha256", "")), "bytes": entry.get("bytes")}
+        )
+    listed = {f["name"] for f in pack.files} | {MANIFEST_NAME}
+    pack.unlisted = sorted(n for n in present if n not in listed)
+    return pack
+
+
+def _hash_stream(f: IO[bytes]) -> Tuple[str, int]:
+    h = hashlib.sha256()
+    n = 0
+    for chunk in iter(lambda: f.read(_CHUNK), b""):
+        h.update(chunk)
+        n += len(chunk)
+    return h.hexdigest(), n
+
+
+def _check_file(pack: _Pack, entry: Dict[str, Any]) -> Dict[str, Any]:
+    name = entry["name"]
+    out: Dict[str, Any] = {"name": name, "sha256": entry["sha256"], "bytes": entry["bytes"]}
+    try:
+        if pack.kind == "zip":
+            # One ZipFile per task: a shared handle would serialize reads on its file lock.
+            with zipfile.ZipFile(pack.path) as zf, zf.open(name) as f:
+                sha, n = _hash_stream(f)
+        else:
+            with (pack.path / name).open("rb") as f:
+                sha, n = _hash_stream(f)
+    except KeyError:
+        return {**out, "ok": False, "error": "missing"}
+    except (OSError, zipfile.BadZipFile, RuntimeError) as e:
+        return {**out, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    problems = []
+    if sha != entry["sha256"]:
+        problems.append("sha256 mismatch")
+    if entry["bytes"] is not None and n != entry["bytes"]:
+        problems.append("byte count mismatch")
+    if problems:
+        return {**out, "ok": False, "error": ", ".join(problems), "actual_sha256": sha, "actual_bytes": n}
+    return {**out, "ok": True}
+
+
+def verify_packs(path: Path, *, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Verify every pack under `path` (see `find_packs`); one summary document.
+
+    A pack is ok when its manifest is readable, every listed file matches its sha256 and
+    byte count, and no file is present that the manifest does not list.
+    """
+    pack_paths, skipped = find_packs(path)
+    workers = max(1, max_workers or min(32, (os.cpu_count() or 1) + 4))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        packs = list(pool.map(_load_pack, pack_paths))
+        tasks = [(p, e) for p in packs if p.error is None for e in p.files]
+        checked = list(pool.map(lambda t: _check_file(*t), tasks))
+
+    by_pack: Dict[int, List[Dict[str, Any]]] = {}
+    for (p, _), result in zip(tasks, checked):
+        by_pack.setdefault(id(p), []).append(result)
+
+    results: List[Dict[str, Any]] = []
+    for p in packs:
+        files = by_pack.get(id(p), [])
+        ok = p.error is None and not p.unlisted and all(f["ok"] for f in files)
+        item: Dict[str, Any] = {"path": str(p.path), "kind": p.kind, "ok": ok}
+        if p.error is not None:
+            item["error"] = p.error
+        if p.unlisted:
+            item["unlisted"] = p.unlisted
+        item["files"] = files
+        results.append(item)
+
+    failed = [r["path"] for r in results if not r["ok"]]
+    return {
+        "schema_version": PACK_VERIFY_SCHEMA,
+        "ok": bool(results) and not failed,
+        "packs": len(results),
+        "files": len(tasks),
+        "failed": failed,
+        "skipped": [str(p) for p in skipped],
+        "results": results,
+    }
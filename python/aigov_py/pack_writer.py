@@ -0,0 +1,210 @@
+"""
+Single-pass zip pack writer for evidence packs and audit bundles.
+
+Every input is read once: each chunk goes to the entry's SHA-256, the zip entry (and an
+optional staging copy). The archive is written to a non-seekable hashing sink, so
+`zipfile` streams entries with data descriptors instead of seeking back, and the
+archive's SHA-256 is known when the last byte is written. No step re-reads its output.
+
+Packs are reproducible (``PACK_FORMAT``): entries keep the order they are added in and get a
+fixed timestamp, mode, creator system and deflate level, so the same entry bytes always
+produce the same archive bytes (for a given zlib). A `<pack>.digest.json` sidecar records
+the archive digest and per-entry hashes; `reusable_pack` uses it to skip rebuilding a pack
+whose inputs are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+from aigov_py.artifact_store import break_link
+
+_CHUNK = 1024 * 1024
+
+PACK_FORMAT = "aigov.pack.deterministic.v1"
+DIGEST_SIDECAR_SCHEMA = "aigov.pack_digest.v1"
+
+# Earliest timestamp a zip entry can carry; used for every entry.
+_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_ENTRY_MODE = 0o100644
+_CREATE_SYSTEM_UNIX = 3
+_COMPRESS_LEVEL = 6
+
+
+class _HashingSink(io.RawIOBase):
+    """Write-only, non-seekable file wrapper that hashes and counts what passes through."""
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._h = hashlib.sha256()
+        self._n = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, b: Any) -> int:
+        view = memoryview(b)
+        self._fp.write(view)
+        self._h.update(view)
+        self._n += view.nbytes
+        return view.nbytes
+
+    def tell(self) -> int:
+        return self._n
+
+    def flush(self) -> None:
+        self._fp.flush()
+
+    def hexdigest(self) -> str:
+        return self._h.hexdigest()
+
+
+class PackWriter:
+    """
+    Zip archive written atomically (temp file + rename) in one pass.
+
+    `add_file` / `add_bytes` return `{"sha256", "bytes"}` of the entry content;
+    `close` returns `{"sha256", "bytes"}` of the finished archive.
+    """
+
+    def __init__(self, path: Path, *, compression: int = zipfile.ZIP_DEFLATED) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._fp = self._tmp.open("wb")
+        self._sink = _HashingSink(self._fp)
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=compression)  # type: ignore[arg-type]
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.digest: dict[str, Any] | None = None
+
+    def _zinfo(self, arcname: str, size: int) -> zipfile.ZipInfo:
+        zinfo = zipfile.ZipInfo(arcname, date_time=_ENTRY_DATE_TIME)
+        zinfo.compress_type = self._zip.compression
+        zinfo._compresslevel = _COMPRESS_LEVEL  # type: ignore[attr-defined]
+        zinfo.create_system = _CREATE_SYSTEM_UNIX
+        zinfo.external_attr = _ENTRY_MODE << 16
+        # Known up front so zipfile picks zip64 for large entries.
+        zinfo.file_size = size
+        return zinfo
+
+    def add_file(self, arcname: str, src: Path, *, copy_to: Path | None = None) -> dict[str, Any]:
+        """Stream `src` into the archive (and into `copy_to`, if given) with one read."""
+        st = src.stat()
+        h = hashlib.sha256()
+        n = 0
+        copy: BinaryIO | None = None
+        if copy_to is not None:
+            copy_to.parent.mkdir(parents=True, exist_ok=True)
+            break_link(copy_to)
+            copy = copy_to.open("wb")
+        try:
+            with src.open("rb") as f, self._zip.open(self._zinfo(arcname, st.st_size), "w") as dst:
+                for chunk in iter(lambda: f.read(_CHUNK), b""):
+                    h.update(chunk)
+                    dst.write(chunk)
+                    if copy is not None:
+                        copy.write(chunk)
+                    n += len(chunk)
+        finally:
+            if copy is not None:
+                copy.close()
+        entry = {"sha256": h.hexdigest(), "bytes": n}
+        self.entries[arcname] = entry
+        return entry
+
+    def add_bytes(self, arcname: str, data: bytes, *, copy_to: Path | None = None) -> dict[str, Any]:
+        if copy_to is not None:
+            copy_to.parent.mkdir(parents=True, exist_ok=True)
+            break_link(copy_to)
+            copy_to.write_bytes(data)
+        with self._zip.open(self._zinfo(arcname, len(data)), "w") as dst:
+            dst.write(data)
+        entry = {"sha256": hashlib.sha256(data).hexdigest(), "bytes": len(data)}
+        self.entries[arcname] = entry
+        return entry
+
+    def close(self) -> dict[str, Any]:
+        """Finish the archive, move it into place and write its digest sidecar."""
+        if self.digest is None:
+            self._zip.close()
+            self._fp.close()
+            os.replace(self._tmp, self.path)
+            self.digest = {"sha256": self._sink.hexdigest(), "bytes": self._sink.tell()}
+            _write_sidecar(self.path, self.digest, self.entries)
+        return self.digest
+
+    def abort(self) -> None:
+        try:
+            self._zip.close()
+        except Exception:
+            pass
+        self._fp.close()
+        try:
+            self._tmp.unlink()
+        except OSError:
+            pass
+
+    def __enter__(self) -> PackWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def digest_sidecar_path(pack_path: Path) -> Path:
+    return pack_path.with_name(pack_path.name + ".digest.json")
+
+
+def _write_sidecar(pack_path: Path, digest: dict[str, Any], entries: dict[str, dict[str, Any]]) -> None:
+    doc = {
+        "schema_version": DIGEST_SIDECAR_SCHEMA,
+        "pack_format": PACK_FORMAT,
+        "sha256": digest["sha256"],
+        "bytes": digest["bytes"],
+        "entries": {name: e["sha256"] for name, e in entries.items()},
+    }
+    side = digest_sidecar_path(pack_path)
+    tmp = side.with_name(side.name + ".tmp")
+    tmp.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, side)
+
+
+def reusable_pack(pack_path: Path, entries: dict[str, str]) -> dict[str, Any] | None:
+    """
+    Digest (`{"sha256", "bytes"}`) of an existing pack built by this format from exactly
+    `entries` (arcname -> content sha256, in order), or None if it has to be rebuilt.
+    Checks the sidecar and the archive size only; the archive is not read.
+    """
+    try:
+        doc = json.loads(digest_sidecar_path(pack_path).read_text(encoding="utf-8"))
+        size = pack_path.stat().st_size
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(doc, dict)
+        or doc.get("schema_version") != DIGEST_SIDECAR_SCHEMA
+        or doc.get("pack_format") != PACK_FORMAT
+        or doc.get("bytes") != size
+        or not isinstance(doc.get("entries"), dict)
+        or list(doc["entries"].items()) != list(entries.items())
+    ):
+        return None
+    return {"sha256": doc.get("sha256"), "bytes": size}
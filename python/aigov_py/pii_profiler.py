@@ -0,0 +1,283 @@
+"""
+Sampled PII profiling of tabular data files (``aigov.pii_profile.v1``).
+
+Unlike the discovery `pii_possible` signal (header names only), the profiler reads a
+bounded sample of rows from every CSV/Parquet file and checks the values column by
+column for email, phone and national-id shapes. Checks are vectorized with NumPy: a
+column sample becomes a (rows x chars) code-point matrix and each shape is a handful of
+whole-matrix comparisons, so cost does not depend on Python-level per-value regexes.
+
+Files are profiled in parallel (one file per worker process), each under a time budget.
+Parquet needs the optional `pyarrow`; without it Parquet files report an error entry.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+from aigov_py.discovery_scan import _PII_COLUMN_TOKENS, _normalize_token, _relpath, iter_scan_paths
+
+PII_PROFILE_SCHEMA = "aigov.pii_profile.v1"
+
+PII_TYPES = ("email", "phone", "us_ssn", "national_id")
+
+DEFAULT_SAMPLE_ROWS = 2000
+DEFAULT_TIME_BUDGET = 2.0
+# Share of non-empty sampled values that must match a shape for the column to be flagged.
+DEFAULT_MIN_RATIO = 0.3
+
+# CSV files up to this size are sampled from the top; larger ones at evenly spaced offsets.
+_HEAD_SAMPLE_BYTES = 4 * 1024 * 1024
+_SAMPLE_SEGMENTS = 8
+# Values longer than this cannot match any shape and are not materialized in the matrix.
+_MAX_VALUE_CHARS = 64
+
+_TABULAR_SUFFIXES = (".csv", ".parquet")
+_HEADER_TOKENS = frozenset(_normalize_token(t) for t in _PII_COLUMN_TOKENS)
+
+
+def _char_matrix(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """(n, width) uint32 code points (0-padded) and the true lengths of `values`."""
+    lengths = np.fromiter((len(v) for v in values), dtype=np.int64, count=len(values))
+    width = int(min(_MAX_VALUE_CHARS, lengths.max(initial=1))) or 1
+    arr = np.array([v[:width] for v in values], dtype=f"<U{width}")
+    return arr.view(np.uint32).reshape(len(values), width), lengths
+
+
+def classify_values(values: list[str]) -> dict[str, np.ndarray]:
+    """
+    Boolean match vector per PII type for already-stripped, non-empty `values`.
+
+    - email: one `@` (not first), no spaces, a `.` at least two characters after `@`,
+      not ending in `.`
+    - phone: 9-15 digits, only digits/space/`-`/`()`/leading `+`, and either a leading `+`
+      or at least one separator (plain integers are not phones)
+    - us_ssn: `ddd-dd-dddd`
+    - national_id: birth-number shape `dddddd/ddd(d)`
+    """
+    m, lengths = _char_matrix(values)
+    n, width = m.shape
+    pos = np.arange(width)
+    in_value = pos[None, :] < lengths[:, None]
+    fits = lengths <= width
+
+    digit = (m >= 48) & (m <= 57)
+    at = m == 64
+    dot = m == 46
+    dash = m == 45
+    space = m == 32
+    plus = m == 43
+    paren = (m == 40) | (m == 41)
+    slash = m == 47
+
+    n_digit = digit.sum(axis=1)
+    n_at = at.sum(axis=1)
+
+    at_pos = at.argmax(axis=1)
+    last = m[np.arange(n), np.clip(lengths - 1, 0, width - 1)]
+    email = (
+        fits
+        & (n_at == 1)
+        & (at_pos >= 1)
+        & ~space.any(axis=1)
+        & (dot & (pos[None, :] > at_pos[:, None] + 1)).any(axis=1)
+        & (last != 46)
+    )
+
+    allowed = digit | space | dash | paren | plus
+    separators = (space | dash | paren).any(axis=1)
+    phone = (
+        fits
+        & (n_digit >= 9)
+        & (n_digit <= 15)
+        & (allowed | ~in_value).all(axis=1)
+        & ~(plus & (pos[None, :] > 0)).any(axis=1)
+        & (plus[:, 0] | separators)
+    )
+
+    ssn = np.zeros(n, dtype=bool)
+    if width >= 11:
+        ssn = (lengths == 11) & dash[:, 3] & dash[:, 6] & digit[:, [0, 1, 2, 4, 5, 7, 8, 9, 10]].all(axis=1)
+
+    national_id = np.zeros(n, dtype=bool)
+    if width >= 10:
+        national_id = (
+            ((lengths == 10) | (lengths == 11))
+            & slash[:, 6]
+            & (slash.sum(axis=1) == 1)
+            & (n_digit == lengths - 1)
+        )
+
+    return {"email": email, "phone": phone & ~ssn, "us_ssn": ssn, "national_id": national_id}
+
+
+def profile_columns(
+    header: list[str],
+    columns: list[list[str]],
+    *,
+    min_ratio: float = DEFAULT_MIN_RATIO,
+) -> list[dict[str, Any]]:
+    """Per-column profile: header token match, match counts per PII type, flagged types."""
+    out: list[dict[str, Any]] = []
+    for name, raw in zip(header, columns):
+        values = [v.strip() for v in raw if v is not None]
+        values = [v for v in values if v]
+        counts = {t: 0 for t in PII_TYPES}
+        if values:
+            for t, hits in classify_values(values).items():
+                counts[t] = int(hits.sum())
+        header_match = _normalize_token(str(name)) in _HEADER_TOKENS
+        pii_types = [t for t in PII_TYPES if values and counts[t] / len(values) >= min_ratio]
+        out.append(
+            {
+                "name": str(name),
+                "non_empty": len(values),
+                "matches": counts,
+                "header_match": header_match,
+                "pii_types": pii_types,
+                "pii_possible": bool(header_match or pii_types),
+            }
+        )
+    return out
+
+
+def _sample_csv(path: Path, sample_rows: int, deadline: float) -> tuple[list[str], list[list[str]], bool]:
+    """Header and up to `sample_rows` rows; rows with a different field count are skipped."""
+    size = path.stat().st_size
+    rows: list[list[str]] = []
+    truncated = False
+    with path.open("rb") as f:
+        header: list[str] = []
+        for raw in f:
+            line = raw.decode("utf-8", errors="ignore")
+            parsed = next(csv.reader([line]), [])
+            if any(c.strip() for c in parsed):
+                header = parsed
+                break
+        if not header:
+            return [], [], False
+        data_start = f.tell()
+
+        if size <= _HEAD_SAMPLE_BYTES:
+            offsets = [data_start]
+            per_segment = sample_rows
+        else:
+            step = (size - data_start) // _SAMPLE_SEGMENTS
+            offsets = [data_start + i * step for i in range(_SAMPLE_SEGMENTS)]
+            per_segment = max(1, sample_rows // _SAMPLE_SEGMENTS)
+
+        for i, offset in enumerate(offsets):
+            if time.monotonic() > deadline:
+                truncated = True
+                break
+            f.seek(offset)
+            if i > 0 or offset != data_start:
+                f.readline()  # resync to the next line start
+            lines: list[str] = []
+            for raw in f:
+                lines.append(raw.decode("utf-8", errors="ignore"))
+                if len(lines) >= per_segment:
+                    break
+            for row in csv.reader(io.StringIO("".join(lines))):
+                if len(row) == len(header):
+                    rows.append(row)
+    columns = [list(col) for col in zip(*rows)] if rows else [[] for _ in header]
+    return header, columns, truncated
+
+
+def _sample_parquet(path: Path, sample_rows: int, deadline: float) -> tuple[list[str], list[list[str]], bool]:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+
+    pf = pq.ParquetFile(str(path))
+    schema = pf.schema_arrow
+    names = [f.name for f in schema if pa.types.is_string(f.type) or pa.types.is_large_string(f.type)]
+    columns: dict[str, list[str]] = {n: [] for n in names}
+    truncated = False
+    groups = pf.num_row_groups
+    if names and groups:
+        picks = sorted({int(i * groups / _SAMPLE_SEGMENTS) for i in range(min(groups, _SAMPLE_SEGMENTS))})
+        per_group = max(1, sample_rows // len(picks))
+        for g in picks:
+            if time.monotonic() > deadline:
+                truncated = True
+                break
+            for batch in pf.iter_batches(batch_size=per_group, row_groups=[g], columns=names):
+                for n in names:
+                    columns[n].extend(v for v in batch.column(n).to_pylist() if v is not None)
+                break
+    header = list(schema.names)
+    # Non-string columns are still reported (header match only).
+    return header, [columns.get(n, []) for n in header], truncated
+
+
+def profile_file(
+    path: Path,
+    rel: str | None = None,
+    *,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    min_ratio: float = DEFAULT_MIN_RATIO,
+) -> dict[str, Any]:
+    """Profile one CSV/Parquet file; never raises (failures become an `error` entry)."""
+    rel = rel if rel is not None else str(path)
+    fmt = path.suffix.lower().lstrip(".")
+    started = time.monotonic()
+    base: dict[str, Any] = {"schema": PII_PROFILE_SCHEMA, "file_path": rel, "format": fmt}
+    try:
+        sampler = _sample_parquet if fmt == "parquet" else _sample_csv
+        header, columns, truncated = sampler(path, sample_rows, started + time_budget)
+        cols = profile_columns(header, columns, min_ratio=min_ratio)
+    except ImportError:
+        return {**base, "error": "pyarrow is not installed"}
+    except Exception as e:
+        return {**base, "error": str(e)}
+    return {
+        **base,
+        "rows_sampled": max((len(c) for c in columns), default=0),
+        "truncated": truncated,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "pii_possible": any(c["pii_possible"] for c in cols),
+        "columns": cols,
+    }
+
+
+def _profile_task(args: tuple[str, str, int, float, float]) -> dict[str, Any]:
+    path, rel, sample_rows, time_budget, min_ratio = args
+    return profile_file(Path(path), rel, sample_rows=sample_rows, time_budget=time_budget, min_ratio=min_ratio)
+
+
+def iter_tabular_files(root: Path) -> list[Path]:
+    """CSV/Parquet files under `root` (same exclusions and order as discovery scans)."""
+    if root.is_file():
+        return [root]
+    return [p for p in iter_scan_paths(root) if p.name.lower().endswith(_TABULAR_SUFFIXES)]
+
+
+def profile_paths(
+    root: Path,
+    paths: Iterable[Path] | None = None,
+    *,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    min_ratio: float = DEFAULT_MIN_RATIO,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Profile tabular files in parallel (one file per worker process); results follow input order."""
+    root = root.resolve()
+    items = list(paths) if paths is not None else iter_tabular_files(root)
+    base = root if root.is_dir() else root.parent
+    tasks = [(str(p), _relpath(p.resolve(), base), sample_rows, time_budget, min_ratio) for p in items]
+    workers = max(1, min(len(tasks), max_workers or os.cpu_count() or 1))
+    if workers == 1:
+        return [_profile_task(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_profile_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
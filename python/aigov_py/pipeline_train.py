@@ -2,7 +2,7 @@ import json
 import os
 import uuid
 from datetime import datetime, timezone
-import hashlib
+from pathlib import Path
 
 import requests
 from joblib import dump
@@ -10,6 +10,7 @@ from sklearn.datasets import load_iris
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
 
+from .artifact_fingerprint import sha256_path
 from .prototype_domain import (
   approved_human_event_id_for_run,
   dataset_governance_iris,
@@ -47,11 +48,7 @@ def post_event(event: dict) -> dict:
 
 
 def sha256_file(path: str) -> str:
-  h = hashlib.sha256()
-  with open(path, "rb") as f:
-    for chunk in iter(lambda: f.read(1024 * 1024), b""):
-      h.update(chunk)
-  return h.hexdigest()
+  return sha256_path(Path(path))
 
 
 def main() -> None:
@@ -0,0 +1,202 @@
+"""
+Batch evaluation of a policy module's requirements across many runs (``aigov.policy_batch_eval.v1``).
+
+Every evidence code the policy mentions gets a bit position; each run's present evidence
+becomes a row of ``uint64`` words and each requirement a mask of the same width. A
+requirement fails for a run when ``present & mask != mask``. That is computed for all runs
+and all requirements at once, in row chunks, so 200k runs cost a few array operations
+instead of 200k set comparisons per requirement. Chunks are sized by a byte budget, so
+policies with many requirements and evidence codes take smaller steps.
+
+A run's present evidence is the set of ``event_type`` values in its evidence bundle
+(``docs/evidence/<run_id>.json``), the same codes ``required_evidence`` lists.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from aigov_py.policy_loader import PolicyModule, policy_identity
+
+POLICY_BATCH_EVAL_SCHEMA = "aigov.policy_batch_eval.v1"
+
+# Bytes of the (runs x requirements x words) uint64 scratch array per vectorized step;
+# the number of runs per step is derived from it.
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class EvidenceCodebook:
+    """Evidence code -> bit position (sorted codes, so positions are deterministic)."""
+
+    def __init__(self, codes: Iterable[str]) -> None:
+        self.codes: tuple[str, ...] = tuple(sorted(set(codes)))
+        self.index: dict[str, int] = {c: i for i, c in enumerate(self.codes)}
+        self.words = max(1, (len(self.codes) + 63) // 64)
+
+    @classmethod
+    def for_policies(cls, *policies: PolicyModule) -> EvidenceCodebook:
+        return cls(c for p in policies for r in p.requirements for c in r.required_evidence)
+
+    def mask(self, codes: Iterable[str]) -> np.ndarray:
+        return self.encode([codes])[0]
+
+    def encode(self, evidence: Sequence[Iterable[str]]) -> np.ndarray:
+        """``(len(evidence), words)`` uint64 bitsets; codes outside the codebook are ignored."""
+        rows: list[int] = []
+        bits: list[int] = []
+        for i, codes in enumerate(evidence):
+            for c in codes:
+                b = self.index.get(c)
+                if b is not None:
+                    rows.append(i)
+                    bits.append(b)
+        out = np.zeros((len(evidence), self.words), dtype=np.uint64)
+        if rows:
+            pos = np.asarray(bits, dtype=np.uint64)
+            np.bitwise_or.at(
+                out,
+                (np.asarray(rows, dtype=np.intp), (pos >> np.uint64(6)).astype(np.intp)),
+                np.left_shift(np.uint64(1), pos & np.uint64(63)),
+            )
+        return out
+
+    def decode(self, row: np.ndarray) -> list[str]:
+        out: list[str] = []
+        for w, word in enumerate(row.tolist()):
+            while word:
+                low = word & -word
+                out.append(self.codes[w * 64 + low.bit_length() - 1])
+                word ^= low
+        return out
+
+
+def requirement_masks(policy: PolicyModule, codebook: EvidenceCodebook) -> np.ndarray:
+    """``(len(policy.requirements), words)`` masks of each requirement's evidence."""
+    return codebook.encode([r.required_evidence for r in policy.requirements])
+
+
+def failing_requirements(
+    present: np.ndarray, masks: np.ndarray, *, chunk_bytes: int = CHUNK_BYTES
+) -> np.ndarray:
+    """``(runs, requirements)`` bool: True where a run lacks some evidence of a requirement."""
+    out = np.empty((present.shape[0], masks.shape[0]), dtype=bool)
+    chunk_rows = max(1, chunk_bytes // max(1, masks.shape[0] * masks.shape[1] * masks.itemsize))
+    for start in range(0, present.shape[0], chunk_rows):
+        block = present[start : start + chunk_rows, None, :]
+        out[start : start + chunk_rows] = ((block & masks[None, :, :]) != masks[None, :, :]).any(axis=2)
+    return out
+
+
+@dataclass
+class BatchEvaluation:
+    policy: PolicyModule
+    codebook: EvidenceCodebook
+    run_ids: list[str]
+    present: np.ndarray  # (runs, words) uint64
+    failing: np.ndarray  # (runs, requirements) bool
+
+    @property
+    def blocked(self) -> np.ndarray:
+        return np.asarray(self.failing.any(axis=1), dtype=bool)
+
+    def failure_counts(self) -> list[int]:
+        """Failing runs per requirement, in `policy.requirements` order (codes need not be unique)."""
+        return [int(n) for n in self.failing.sum(axis=0).tolist()]
+
+    def affected_runs(self, requirement: int) -> list[str]:
+        """Runs failing `policy.requirements[requirement]`."""
+        return [self.run_ids[i] for i in np.flatnonzero(self.failing[:, requirement]).tolist()]
+
+    def missing_evidence(self, run_index: int) -> list[str]:
+        required = np.bitwise_or.reduce(requirement_masks(self.policy, self.codebook), axis=0)
+        return self.codebook.decode(required & ~self.present[run_index])
+
+    def summary(self, *, max_listed: int | None = None) -> dict[str, Any]:
+        """JSON-ready report; run lists are truncated to `max_listed` (counts never are)."""
+
+        def listed(ids: list[str]) -> list[str]:
+            return ids if max_listed is None else ids[:max_listed]
+
+        counts = self.failure_counts()
+        blocked = [self.run_ids[i] for i in np.flatnonzero(self.blocked).tolist()]
+        return {
+            "schema_version": POLICY_BATCH_EVAL_SCHEMA,
+            "policy": policy_identity(self.policy),
+            "runs": len(self.run_ids),
+            "blocked": len(blocked),
+            "blocked_runs": listed(blocked),
+            "requirements": [
+                {
+                    "code": r.code,
+                    "required_evidence": list(r.required_evidence),
+                    "failing": counts[i],
+                    "runs": listed(self.affected_runs(i)) if counts[i] else [],
+                }
+                for i, r in enumerate(self.policy.requirements)
+            ],
+        }
+
+
+def evaluate_runs(
+    policy: PolicyModule,
+    run_ids: Sequence[str],
+    evidence: Sequence[Iterable[str]],
+    *,
+    codebook: EvidenceCodebook | None = None,
+) -> BatchEvaluation:
+    """Evaluate `policy` for every run; `evidence[i]` are the evidence codes present for `run_ids[i]`."""
+    if len(run_ids) != len(evidence):
+        raise ValueError("run_ids and evidence must have the same length")
+    codebook = codebook if codebook is not None else EvidenceCodebook.for_policies(policy)
+    present = codebook.encode(evidence)
+    failing = failing_requirements(present, requirement_masks(policy, codebook))
+    return BatchEvaluation(policy=policy, codebook=codebook, run_ids=list(run_ids), present=present, failing=failing)
+
+
+def bundle_evidence_codes(bundle: dict[str, Any]) -> set[str]:
+    out: set[str] = set()
+    for e in bundle.get("events") or []:
+        if isinstance(e, dict) and isinstance(e.get("event_type"), str) and e["event_type"]:
+            out.add(e["event_type"])
+    return out
+
+
+def load_run_evidence(
+    root: Path,
+    run_ids: Sequence[str],
+    *,
+    max_workers: int | None = None,
+) -> tuple[list[str], list[set[str]], list[dict[str, str]]]:
+    """
+    Evidence codes of each run's ``docs/evidence/<run_id>.json``, read on a thread pool.
+
+    Returns ``(run_ids, evidence, errors)`` for the runs that could be read; unreadable
+    bundles are reported in `errors` and left out.
+    """
+
+    def one(run_id: str) -> tuple[str, set[str] | None, str | None]:
+        path = root / "docs" / "evidence" / f"{run_id}.json"
+        try:
+            return run_id, bundle_evidence_codes(json.loads(path.read_bytes())), None
+        except (OSError, ValueError, AttributeError) as e:
+            return run_id, None, f"{type(e).__name__}: {e}"
+
+    workers = max(1, max_workers or min(32, (os.cpu_count() or 1) + 4))
+    ids: list[str] = []
+    evidence: list[set[str]] = []
+    errors: list[dict[str, str]] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for run_id, codes, err in pool.map(one, run_ids):
+            if codes is None:
+                errors.append({"run_id": run_id, "error": str(err)})
+            else:
+                ids.append(run_id)
+                evidence.append(codes)
+    return ids, evidence, errors
@@ -0,0 +1,372 @@
+"""
+Policy-change impact over a historical audit ledger (``aigov.policy_impact.v1``).
+
+The ledger (``audit_log*.jsonl``: one ``{prev_hash, record_hash, event_json}`` record per
+line) is reduced in one streaming pass to a per-run evidence index: first offset per event
+type, passed evaluations, approving risk reviews and human approvals keyed by their linkage
+fields, promotions and trainings. Byte ranges of the ledger are scanned in worker processes
+and merged. The index is saved with the ledger offset and tail record hash it covers; since
+the ledger is append-only, a later run only scans the bytes appended since.
+
+Both policies are then evaluated from the index, without re-reading the ledger:
+
+- ``*.json``: a GovAI server policy config (``rust/policy.*.json``). Its gate flags are
+  replayed against the order of events in the ledger, with the server's defaults for
+  missing keys and its reason codes (``missing_passed_evaluation_for_promotion``, ...).
+  Schema checks are not replayed; every event in the ledger passed them at ingest.
+- ``*.yaml`` / ``*.yml``: a customer policy module; a run fails the requirements whose
+  ``required_evidence`` it lacks (vectorized with `policy_batch_eval`).
+
+A run is ``BLOCKED`` under a policy when it has any reason, ``VALID`` otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+POLICY_IMPACT_SCHEMA = "aigov.policy_impact.v1"
+LEDGER_INDEX_SCHEMA = "aigov.ledger_run_index.v1"
+
+# Under the per-user cache directory ($XDG_CACHE_HOME or ~/.cache), one file per ledger path;
+# override the directory with GOVAI_LEDGER_INDEX_DIR.
+DEFAULT_LEDGER_INDEX_RELPATH = Path("govai") / "ledger-index"
+
+# Ledger bytes per worker task.
+CHUNK_BYTES = 32 * 1024 * 1024
+
+_LINKAGE_FIELDS = (
+    "assessment_id",
+    "risk_id",
+    "dataset_governance_commitment",
+    "ai_system_id",
+    "dataset_id",
+    "model_version_id",
+)
+
+RunFacts = Dict[str, Any]
+
+
+def default_ledger_index_path(ledger: Path) -> Path:
+    env = os.environ.get("GOVAI_LEDGER_INDEX_DIR", "").strip()
+    if env:
+        base = Path(env)
+    else:
+        cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+        base = (Path(cache) if cache else Path.home() / ".cache") / DEFAULT_LEDGER_INDEX_RELPATH
+    key = hashlib.sha256(str(ledger.resolve()).encode("utf-8")).hexdigest()[:32]
+    return base / f"{key}.json"
+
+
+def _linkage(payload: Dict[str, Any]) -> str:
+    return "\x1f".join(str(payload.get(k) or "").strip() for k in _LINKAGE_FIELDS)
+
+
+def _new_facts() -> RunFacts:
+    return {"first": {}, "eval_pass": None, "risk_ok": {}, "approvals": {}, "promotions": [], "trained": []}
+
+
+def _min_off(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    if a is None:
+        return b
+    return a if b is None else min(a, b)
+
+
+def _add_event(facts: RunFacts, off: int, ev: Dict[str, Any]) -> None:
+    t = str(ev.get("event_type") or "")
+    payload = ev.get("payload")
+    p: Dict[str, Any] = payload if isinstance(payload, dict) else {}
+    if t and t not in facts["first"]:
+        facts["first"][t] = off
+    if t == "evaluation_reported" and p.get("passed") is True:
+        facts["eval_pass"] = _min_off(facts["eval_pass"], off)
+    elif t == "risk_reviewed" and p.get("decision") == "approve":
+        key = _linkage(p)
+        facts["risk_ok"][key] = _min_off(facts["risk_ok"].get(key), off)
+    elif t == "human_approved":
+        eid = str(ev.get("event_id") or "")
+        facts["approvals"][eid] = [off, _linkage(p), p.get("decision") == "approve", str(p.get("approver") or "").strip()]
+    elif t == "model_promoted":
+        facts["promotions"].append([off, str(p.get("approved_human_event_id") or "").strip(), _linkage(p)])
+    elif t == "model_trained":
+        facts["trained"].append(off)
+
+
+def _merge_facts(into: RunFacts, other: RunFacts) -> None:
+    for t, off in other["first"].items():
+        into["first"][t] = _min_off(into["first"].get(t), off)
+    into["eval_pass"] = _min_off(into["eval_pass"], other["eval_pass"])
+    for key, off in other["risk_ok"].items():
+        into["risk_ok"][key] = _min_off(into["risk_ok"].get(key), off)
+    into["approvals"].update(other["approvals"])
+    into["promotions"].extend(other["promotions"])
+    into["trained"].extend(other["trained"])
+
+
+def _scan_range(path: str, start: int, end: int) -> Dict[str, Any]:
+    """Worker: facts of the records whose line starts in [start, end)."""
+    runs: Dict[str, RunFacts] = {}
+    bad = 0
+    tail: Optional[Tuple[int, str]] = None
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                pos = start + len(f.readline())
+        while pos < end:
+            line = f.readline()
+            if not line.endswith(b"\n"):
+                break  # EOF or a partial trailing write; picked up by the next incremental scan
+            off, pos = pos, pos + len(line)
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+                ev = json.loads(rec["event_json"])
+                run_id = str(ev.get("run_id") or "")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                bad += 1
+                continue
+            tail = (off, str(rec.get("record_hash") or ""))
+            if run_id:
+                _add_event(runs.setdefault(run_id, _new_facts()), off, ev)
+    return {"runs": runs, "bad": bad, "tail": tail, "end": pos}
+
+
+@dataclass
+class LedgerIndex:
+    ledger: str
+    offset: int = 0
+    tail_start: Optional[int] = None
+    tail_hash: Optional[str] = None
+    bad_records: int = 0
+    runs: Dict[str, RunFacts] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, ledger: Path) -> Optional[LedgerIndex]:
+        """The saved index if it still describes a prefix of `ledger`, else None."""
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+            if doc.get("schema_version") != LEDGER_INDEX_SCHEMA or doc.get("ledger") != str(ledger):
+                return None
+            index = cls(**{f.name: doc[f.name] for f in fields(cls)})
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        try:
+            if ledger.stat().st_size < index.offset:
+                return None
+            if index.tail_start is not None:
+                with ledger.open("rb") as f:
+                    f.seek(index.tail_start)
+                    rec = json.loads(f.readline())
+                if rec.get("record_hash") != index.tail_hash:
+                    return None
+        except (OSError, ValueError, AttributeError):
+            return None
+        return index
+
+    def save(self, path: Path) -> None:
+        doc = {"schema_version": LEDGER_INDEX_SCHEMA, **{f.name: getattr(self, f.name) for f in fields(self)}}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def build_ledger_index(
+    ledger: Path,
+    *,
+    index_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> Tuple[LedgerIndex, Dict[str, int]]:
+    """
+    Per-run evidence index of `ledger`, resumed from `index_path` when it still matches.
+
+    Only bytes after the saved offset are scanned, split into `chunk_bytes` ranges across a
+    process pool. Returns the index and scan stats (``scanned_bytes``, ``reused_runs``).
+    """
+    ledger = ledger.resolve()
+    index = LedgerIndex.load(index_path, ledger) if index_path is not None else None
+    index = index if index is not None else LedgerIndex(ledger=str(ledger))
+    reused = len(index.runs)
+    size = ledger.stat().st_size
+    ranges = [(s, min(s + chunk_bytes, size)) for s in range(index.offset, size, max(1, chunk_bytes))]
+
+    if len(ranges) > 1 and (max_workers or os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(ranges), max_workers or os.cpu_count() or 1)) as pool:
+            parts = list(pool.map(_scan_range, [str(ledger)] * len(ranges), *zip(*ranges)))
+    else:
+        parts = [_scan_range(str(ledger), s, e) for s, e in ranges]
+
+    start = index.offset
+    for part in parts:  # in file order, so later approvals overwrite earlier ones
+        for run_id, facts in part["runs"].items():
+            if run_id in index.runs:
+                _merge_facts(index.runs[run_id], facts)
+            else:
+                index.runs[run_id] = facts
+        index.bad_records += part["bad"]
+        if part["tail"] is not None:
+            index.tail_start, index.tail_hash = part["tail"]
+        index.offset = max(index.offset, part["end"])
+    if index_path is not None:
+        index.save(index_path)
+    return index, {"scanned_bytes": index.offset - start, "reused_runs": reused}
+
+
+@dataclass(frozen=True)
+class GatePolicy:
+    """Gate flags of a GovAI server policy config (defaults match the server's)."""
+
+    require_approval: bool = True
+    block_if_missing_evidence: bool = True
+    require_passed_evaluation_for_promotion: bool = True
+    require_risk_review_for_approval: bool = True
+    require_risk_review_for_promotion: bool = True
+    enforce_approver_allowlist: bool = True
+    approver_allowlist: Tuple[str, ...] = ("compliance_officer", "risk_officer")
+
+    @classmethod
+    def load(cls, path: Path) -> GatePolicy:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(raw, dict):
+            raise ValueError("policy config must be a JSON object")
+        kwargs: Dict[str, Any] = {}
+        for f in fields(cls):
+            if f.name not in raw:
+                continue
+            v = raw[f.name]
+            if f.name == "approver_allowlist":
+                if not isinstance(v, list):
+                    raise ValueError("approver_allowlist must be a list")
+                v = tuple(dict.fromkeys(s for s in (str(x).strip().lower() for x in v) if s))
+            elif not isinstance(v, bool):
+                raise ValueError(f"{f.name} must be a boolean")
+            kwargs[f.name] = v
+        return cls(**kwargs)
+
+    def effective_allowlist(self) -> Tuple[str, ...]:
+        env = os.environ.get("AIGOV_APPROVER_ALLOWLIST", "").strip()
+        if env:
+            return tuple(dict.fromkeys(s for s in (x.strip().lower() for x in env.split(",")) if s))
+        return self.approver_allowlist
+
+    def reasons(self, facts: RunFacts, allowlist: Tuple[str, ...]) -> List[str]:
+        out: set[str] = set()
+        first, risk_ok = facts["first"], facts["risk_ok"]
+
+        def before(off: Optional[int], limit: int) -> bool:
+            return off is not None and off < limit
+
+        if self.block_if_missing_evidence:
+            if any(not before(first.get("data_registered"), off) for off in facts["trained"]):
+                out.add("missing_data_registered")
+        for off, link, _, approver in facts["approvals"].values():
+            if self.enforce_approver_allowlist and approver.lower() not in allowlist:
+                out.add("approver_not_allowlisted")
+            if self.require_risk_review_for_approval and not before(risk_ok.get(link), off):
+                out.add("missing_risk_review_for_approval")
+        for off, ref, link in facts["promotions"]:
+            if self.require_passed_evaluation_for_promotion and not before(facts["eval_pass"], off):
+                out.add("missing_passed_evaluation_for_promotion")
+            if self.require_risk_review_for_promotion and not before(risk_ok.get(link), off):
+                out.add("missing_risk_review_for_promotion")
+            if self.require_approval:
+                approval = facts["approvals"].get(ref) if ref else None
+                if approval is None or not (approval[0] < off and approval[2] and approval[1] == link):
+                    out.add("missing_human_approval_for_promotion")
+        return sorted(out)
+
+
+def load_policy_evaluator(
+    path: Path,
+    *,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Dict[str, Any], Callable[[List[RunFacts]], List[List[str]]]]:
+    """``(identity, evaluate)`` for a policy file; `evaluate` maps run facts to reason lists."""
+    if path.suffix.lower() == ".json":
+        gate = GatePolicy.load(path)
+        allowlist = gate.effective_allowlist()
+        ident = {"kind": "gate_config", "path": str(path)}
+        return ident, lambda runs: [gate.reasons(f, allowlist) for f in runs]
+
+    from aigov_py.policy_batch_eval import EvidenceCodebook, failing_requirements, requirement_masks
+    from aigov_py.policy_loader import load_policy_module, policy_identity
+
+    module = load_policy_module(path, cache_dir=cache_dir)
+    codes = [r.code for r in module.requirements]
+
+    def evaluate(runs: List[RunFacts]) -> List[List[str]]:
+        book = EvidenceCodebook.for_policies(module)
+        failing = failing_requirements(book.encode([f["first"].keys() for f in runs]), requirement_masks(module, book))
+        out: List[List[str]] = [[] for _ in runs]
+        for i, j in zip(*np.nonzero(failing)):
+            out[int(i)].append(codes[int(j)])
+        return out
+
+    return {"kind": "policy_module", "path": str(path), **policy_identity(module)}, evaluate
+
+
+def policy_impact(
+    old_policy: Path,
+    new_policy: Path,
+    ledger: Path,
+    *,
+    index_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    max_listed: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Runs whose verdict differs between `old_policy` and `new_policy`, with the reasons."""
+    old_ident, old_eval = load_policy_evaluator(old_policy, cache_dir=cache_dir)
+    new_ident, new_eval = load_policy_evaluator(new_policy, cache_dir=cache_dir)
+    index, stats = build_ledger_index(ledger, index_path=index_path, max_workers=max_workers)
+
+    run_ids = sorted(index.runs)
+    facts = [index.runs[r] for r in run_ids]
+    old_reasons, new_reasons = old_eval(facts), new_eval(facts)
+
+    transitions: Dict[str, int] = {}
+    changes: List[Dict[str, Any]] = []
+    for run_id, before, after in zip(run_ids, old_reasons, new_reasons):
+        v_old = "BLOCKED" if before else "VALID"
+        v_new = "BLOCKED" if after else "VALID"
+        if v_old == v_new:
+            continue
+        key = f"{v_old}->{v_new}"
+        transitions[key] = transitions.get(key, 0) + 1
+        changes.append(
+            {
+                "run_id": run_id,
+                "old": {"verdict": v_old, "reasons": before},
+                "new": {"verdict": v_new, "reasons": after},
+            }
+        )
+    return {
+        "schema_version": POLICY_IMPACT_SCHEMA,
+        "ledger": index.ledger,
+        "old_policy": old_ident,
+        "new_policy": new_ident,
+        "runs": len(run_ids),
+        "blocked": {"old": sum(1 for r in old_reasons if r), "new": sum(1 for r in new_reasons if r)},
+        "changed": len(changes),
+        "transitions": transitions,
+        "changes": changes if max_listed is None else changes[:max_listed],
+        "index": {**stats, "bad_records": index.bad_records, "path": str(index_path) if index_path else None},
+    }
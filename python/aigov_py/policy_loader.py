@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Bump when parsing or validation changes: cached modules from another loader version are ignored.
+POLICY_LOADER_VERSION = "aigov.policy_loader.v1"
+POLICY_CACHE_SCHEMA = "aigov.policy_cache.v1"
+
+# Under the per-user cache directory ($XDG_CACHE_HOME or ~/.cache), never the checkout,
+# so a repository cannot ship cache entries; override with GOVAI_POLICY_CACHE_DIR.
+DEFAULT_POLICY_CACHE_RELPATH = Path("govai") / "policy-cache"
+
+# libyaml when available (same safe-loader semantics, much faster on large files).
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_policy_required_evidence(policy_path: str | Path) -> set[str]:
     """
@@ -56,14 +71,7 @@ def _require_nonempty_list(obj: dict[str, Any], key: str, *, where: str) -> list
     return v
 
 
-def load_policy_module(path: str | Path) -> PolicyModule:
-    """
-    Load and validate a customer policy module YAML.
-
-    Policy modules must compile into a flat deterministic required_evidence set.
-    """
-    p = Path(path)
-    raw = yaml.safe_load(p.read_text(encoding="utf-8"))
+def _module_from_raw(raw: Any) -> PolicyModule:
     if not isinstance(raw, dict):
         raise ValueError("policy module must be a YAML object at the top level")
 
@@ -99,6 +107,91 @@ def load_policy_module(path: str | Path) -> PolicyModule:
     return PolicyModule(policy=ident, requirements=tuple(reqs))
 
 
+def default_policy_cache_dir() -> Path:
+    env = os.environ.get("GOVAI_POLICY_CACHE_DIR", "").strip()
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME", "").strip()
+    return (Path(base) if base else Path.home() / ".cache") / DEFAULT_POLICY_CACHE_RELPATH
+
+
+def _module_to_doc(policy: PolicyModule) -> dict[str, Any]:
+    return {
+        "policy": policy_identity(policy),
+        "requirements": [
+            {"code": r.code, "required_evidence": list(r.required_evidence)} for r in policy.requirements
+        ],
+    }
+
+
+_MEMO: dict[str, PolicyModule] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def _read_cached(path: Path, sha256: str) -> PolicyModule | None:
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            doc.get("schema_version") != POLICY_CACHE_SCHEMA
+            or doc.get("loader") != POLICY_LOADER_VERSION
+            or doc.get("sha256") != sha256
+        ):
+            return None
+        # Validated again on every hit (cheap without the YAML parse): the entry is only as
+        # trustworthy as the directory it was read from.
+        return _module_from_raw(doc["module"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_cached(path: Path, sha256: str, policy: PolicyModule) -> None:
+    doc = {
+        "schema_version": POLICY_CACHE_SCHEMA,
+        "loader": POLICY_LOADER_VERSION,
+        "sha256": sha256,
+        "module": _module_to_doc(policy),
+    }
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(doc, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_policy_module(path: str | Path, *, cache_dir: str | Path | None = None) -> PolicyModule:
+    """
+    Load and validate a customer policy module YAML.
+
+    Policy modules must compile into a flat deterministic required_evidence set.
+
+    Validated modules are memoized per process by the file's sha256. With `cache_dir`,
+    they are also kept on disk as ``<sha256>.json`` (tagged with ``POLICY_LOADER_VERSION``),
+    so later processes skip YAML parsing and validation for an unchanged file.
+    Best-effort: an unreadable cache entry is reparsed and a failed write is ignored.
+    """
+    data = Path(path).read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    with _MEMO_LOCK:
+        hit = _MEMO.get(sha256)
+    if hit is not None:
+        return hit
+
+    cache_path = Path(cache_dir) / f"{sha256}.json" if cache_dir is not None else None
+    policy = _read_cached(cache_path, sha256) if cache_path is not None else None
+    if policy is None:
+        policy = _module_from_raw(yaml.load(data.decode("utf-8"), Loader=_YAML_LOADER))
+        if cache_path is not None:
+            _write_cached(cache_path, sha256, policy)
+    with _MEMO_LOCK:
+        _MEMO[sha256] = policy
+    return policy
+
+
 def required_evidence_from_policy(policy: PolicyModule) -> set[str]:
     """
     Compile a policy module into a flat deterministic required_evidence set.
@@ -3,9 +3,12 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aigov_py.artifact_store import break_link
 
 
 @dataclass(frozen=True)
@@ -48,39 +51,72 @@ def _events(bundle: Dict[str, Any]) -> List[Event]:
     return out
 
 
-def _pick_last(events: List[Event], t: str) -> Optional[Event]:
-    for e in reversed(events):
-        if e.event_type == t:
-            return e
-    return None
+class EventIndex:
+    """
+    Lookups over a bundle's events, built in one pass.
+
+    Keeps the last event per type and per ``(type, payload scope)``, so each lookup is a
+    dict hit instead of a scan over the event list.
+    """
+
+    def __init__(self, events: List[Event]) -> None:
+        self.events = events
+        self._last: Dict[str, Event] = {}
+        self._last_scoped: Dict[Tuple[str, str], Event] = {}
+        for e in events:
+            self._last[e.event_type] = e
+            scope = e.payload.get("scope")
+            if isinstance(scope, str) and scope:
+                self._last_scoped[(e.event_type, scope)] = e
+
+    def last(self, event_type: str) -> Optional[Event]:
+        return self._last.get(event_type)
+
+    def last_in_scope(self, event_type: str, scope: str) -> Optional[Event]:
+        return self._last_scoped.get((event_type, scope))
+
+    def scopes(self, event_type: str) -> List[str]:
+        return sorted(s for (t, s) in self._last_scoped if t == event_type)
 
 
 def _md_escape(s: str) -> str:
     return s.replace("|", "\\|")
 
 
-def main() -> None:
-    run_id = os.environ.get("RUN_ID", "").strip()
-    if not run_id:
-        raise SystemExit("RUN_ID is required")
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
 
-    repo_root = Path(__file__).resolve().parents[2]
 
-    bundle_path = repo_root / "docs" / "evidence" / f"{run_id}.json"
-    if not bundle_path.exists():
-        raise SystemExit(f"bundle not found: {bundle_path}")
+def _bundle_sha256(bundle: Dict[str, Any], bundle_path: Path) -> str:
+    return str(bundle.get("bundle_sha256", "")).strip() or _sha256_file(bundle_path)
 
-    bundle = _load_bundle(bundle_path)
-    events = _events(bundle)
 
-    run_started = _pick_last(events, "run_started")
-    data_registered = _pick_last(events, "data_registered")
-    evaluation_reported = _pick_last(events, "evaluation_reported")
-    risk_recorded = _pick_last(events, "risk_recorded")
-    risk_mitigated = _pick_last(events, "risk_mitigated")
-    risk_reviewed = _pick_last(events, "risk_reviewed")
-    human_approved = _pick_last(events, "human_approved")
-    model_promoted = _pick_last(events, "model_promoted")
+def embedded_bundle_sha256(report_path: Path) -> Optional[str]:
+    """The ``bundle_sha256=`` header value of an existing report (None if absent or unreadable)."""
+    try:
+        with report_path.open("r", encoding="utf-8") as f:
+            for _, line in zip(range(16), f):
+                if line.startswith("bundle_sha256="):
+                    return line[len("bundle_sha256="):].strip() or None
+    except OSError:
+        return None
+    return None
+
+
+def render_report(run_id: str, bundle: Dict[str, Any], bundle_sha256: str) -> str:
+    """Markdown report for one evidence bundle."""
+    events = _events(bundle)
+    index = EventIndex(events)
+
+    run_started = index.last("run_started")
+    data_registered = index.last("data_registered")
+    evaluation_reported = index.last("evaluation_reported")
+    risk_recorded = index.last("risk_recorded")
+    risk_mitigated = index.last("risk_mitigated")
+    risk_reviewed = index.last("risk_reviewed")
+    # Only promotion approvals gate the model; approvals for other scopes are not reported.
+    human_approved = index.last_in_scope("human_approved", "model_promoted")
+    model_promoted = index.last("model_promoted")
 
     system = run_started.system if run_started else (events[0].system if events else "")
     actor = run_started.actor if run_started else (events[0].actor if events else "")
@@ -88,10 +124,6 @@ def main() -> None:
     log_path = str(bundle.get("log_path", "")).strip()
     artifact_path = str(bundle.get("model_artifact_path", "")).strip()
 
-    bundle_sha256 = str(bundle.get("bundle_sha256", "")).strip()
-    if not bundle_sha256:
-        bundle_sha256 = _sha256_file(bundle_path)
-
     dataset = ""
     dataset_fp = ""
     dataset_version = ""
@@ -177,10 +209,6 @@ def main() -> None:
             model_promoted.payload.get("approved_human_event_id", "")
         )
 
-    report_dir = repo_root / "docs" / "reports"
-    report_dir.mkdir(parents=True, exist_ok=True)
-    report_path = report_dir / f"{run_id}.md"
-
     lines: List[str] = []
 
     lines.append(f"# Audit report for run `{run_id}`")
@@ -304,8 +332,85 @@ def main() -> None:
         lines.append(f"- Log path (reported by server): `{_md_escape(log_path)}`")
         lines.append("")
 
-    report_path.write_text("\n".join(lines), encoding="utf-8")
-    print(f"saved {report_path}")
+    return "\n".join(lines)
+
+
+def write_report(run_id: str, *, root: Optional[Path] = None, force: bool = True) -> Dict[str, Any]:
+    """
+    Render docs/reports/<run_id>.md from docs/evidence/<run_id>.json.
+
+    Unless `force`, an existing report that already embeds the bundle's sha256 is left alone
+    (``written`` is False).
+    """
+    root = root if root is not None else _repo_root()
+    bundle_path = root / "docs" / "evidence" / f"{run_id}.json"
+    if not bundle_path.exists():
+        raise SystemExit(f"bundle not found: {bundle_path}")
+    bundle = _load_bundle(bundle_path)
+    bundle_sha256 = _bundle_sha256(bundle, bundle_path)
+
+    report_path = root / "docs" / "reports" / f"{run_id}.md"
+    if not force and embedded_bundle_sha256(report_path) == bundle_sha256:
+        return {"run_id": run_id, "bundle_sha256": bundle_sha256, "path": str(report_path), "written": False}
+
+    text = render_report(run_id, bundle, bundle_sha256)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    break_link(report_path)
+    report_path.write_text(text, encoding="utf-8")
+    return {"run_id": run_id, "bundle_sha256": bundle_sha256, "path": str(report_path), "written": True}
+
+
+def _render_one(run_id: str, root: str, force: bool) -> Dict[str, Any]:
+    """Worker: render one report; failures are returned, never raised."""
+    try:
+        out = write_report(run_id, root=Path(root), force=force)
+    except SystemExit as e:
+        return {"run_id": run_id, "ok": False, "error": str(e.code)}
+    except Exception as e:
+        return {"run_id": run_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {"ok": True, **out}
+
+
+def render_reports(
+    run_ids: Iterable[str],
+    *,
+    root: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Render reports for many runs on a process pool.
+
+    Runs whose existing report already embeds the current ``bundle_sha256`` are skipped
+    unless `force` (pass it after a template change). Per-run failures are collected in
+    `errors`; they do not stop the batch.
+    """
+    root = root if root is not None else _repo_root()
+    ids = list(dict.fromkeys(r.strip() for r in run_ids if r.strip()))
+    workers = max(1, min(len(ids) or 1, max_workers or os.cpu_count() or 1))
+    if workers == 1:
+        results = [_render_one(rid, str(root), force) for rid in ids]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk = max(1, len(ids) // (workers * 8))
+            results = list(pool.map(_render_one, ids, [str(root)] * len(ids), [force] * len(ids), chunksize=chunk))
+
+    ok = [r for r in results if r["ok"]]
+    errors = sorted(({"run_id": r["run_id"], "error": r["error"]} for r in results if not r["ok"]), key=lambda e: e["run_id"])
+    return {
+        "rendered": sum(1 for r in ok if r["written"]),
+        "skipped": sum(1 for r in ok if not r["written"]),
+        "failed": len(errors),
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    run_id = os.environ.get("RUN_ID", "").strip()
+    if not run_id:
+        raise SystemExit("RUN_ID is required")
+    out = write_report(run_id)
+    print(f"saved {out['path']}")
 
 
 if __name__ == "__main__":
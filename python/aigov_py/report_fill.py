@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
+from aigov_py.artifact_store import break_link
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -15,6 +17,7 @@ def _read_text(p: Path) -> str:
 
 def _write_text(p: Path, s: str) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
+    break_link(p)
     p.write_text(s, encoding="utf-8")
 
 
@@ -7,6 +7,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from aigov_py.artifact_store import break_link
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -68,6 +70,7 @@ def main(argv: list[str]) -> None:
         ]
     )
 
+    break_link(report_path)
     report_path.write_text(content, encoding="utf-8")
     print(f"saved {report_path}")
 
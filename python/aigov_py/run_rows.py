@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 
 def _persist_targets() -> Tuple[bool, bool]:
@@ -25,14 +25,24 @@ def _persist_targets() -> Tuple[bool, bool]:
     )
 
 
-def upsert_run_row(row: Dict[str, Any]) -> None:
-    """Backend-agnostic run row upsert (phase 1: switch via ``AIGOV_RUN_PERSISTENCE``)."""
+def upsert_run_rows(rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Batched run row upsert to the backends selected by ``AIGOV_RUN_PERSISTENCE``
+    (Postgres: pooled connection, COPY/pipelined batches). Returns the number of rows.
+    """
     to_pg, to_sb = _persist_targets()
+    batch: List[Dict[str, Any]] = list(rows)
     if to_pg:
-        from aigov_py.govai_postgres_runs import upsert_run_row_postgres
+        from aigov_py.govai_postgres_runs import upsert_run_rows as upsert_run_rows_postgres
 
-        upsert_run_row_postgres(row)
+        upsert_run_rows_postgres(batch)
     if to_sb:
-        from aigov_py.supabase_db import upsert_run_row_via_supabase
+        from aigov_py.supabase_db import upsert_run_rows_via_supabase
 
-        upsert_run_row_via_supabase(row)
+        upsert_run_rows_via_supabase(batch)
+    return len(batch)
+
+
+def upsert_run_row(row: Dict[str, Any]) -> None:
+    """Backend-agnostic run row upsert (phase 1: switch via ``AIGOV_RUN_PERSISTENCE``)."""
+    upsert_run_rows([row])
@@ -0,0 +1,363 @@
+"""
+Streaming parity between two run tables (Supabase ``runs`` vs GovAI ``console.runs``).
+
+Both sides are read in ``(created_at, id)`` keyset pages, followed by the rows whose
+``created_at`` is NULL in ``id`` pages, so no side is ever held in memory.
+Rows are reduced to a 128-bit digest of their compared fields and summed per bucket
+(UTC day of ``created_at``, or an ``id`` prefix); the sum is order-independent, so the
+per-bucket state is a count and one integer. Only buckets whose digests differ are read a
+second time, and only their rows are diffed by id.
+
+Memory is bounded by the number of buckets plus the row digests of one mismatching bucket.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+
+RUN_COLUMNS = (
+    "id,created_at,mode,status,policy_version,"
+    "bundle_sha256,evidence_sha256,report_sha256,evidence_source,closed_at,environment"
+)
+
+# Fields compared per row (timestamps at second precision, as PostgREST and psycopg may differ below that).
+COMPARED_FIELDS = (
+    "created_at",
+    "bundle_sha256",
+    "evidence_sha256",
+    "report_sha256",
+    "policy_version",
+    "status",
+    "mode",
+    "evidence_source",
+    "environment",
+)
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_ID_PREFIX_LEN = 2
+BUCKET_MODES = ("day", "prefix")
+
+_M128 = (1 << 128) - 1
+
+Keyset = Tuple[str, str]
+
+
+def parse_ts(v: Any) -> Optional[datetime]:
+    if v is None:
+        return None
+    if isinstance(v, datetime):
+        return v.astimezone(timezone.utc) if v.tzinfo else v.replace(tzinfo=timezone.utc)
+    s = str(v).strip()
+    if not s:
+        return None
+    try:
+        x = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return x.astimezone(timezone.utc) if x.tzinfo else x.replace(tzinfo=timezone.utc)
+
+
+def _norm(v: Any) -> Optional[str]:
+    if v is None:
+        return None
+    s = str(v).strip()
+    return s or None
+
+
+def row_values(row: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Normalized compared fields of a row."""
+    out: Dict[str, Optional[str]] = {}
+    for f in COMPARED_FIELDS:
+        if f == "created_at":
+            ts = parse_ts(row.get(f))
+            out[f] = ts.strftime("%Y-%m-%dT%H:%M:%SZ") if ts else None
+        else:
+            out[f] = _norm(row.get(f))
+    return out
+
+
+def row_digest(row: Dict[str, Any]) -> int:
+    values = row_values(row)
+    parts: List[str] = [str(row.get("id") or "")]
+    for f in COMPARED_FIELDS:
+        v = values[f]
+        parts.append("\x00" if v is None else v)
+    raw = "\x1f".join(parts)
+    return int.from_bytes(hashlib.sha256(raw.encode("utf-8")).digest()[:16], "big")
+
+
+def bucket_key_fn(mode: str, *, prefix_len: int = DEFAULT_ID_PREFIX_LEN) -> Callable[[Dict[str, Any]], str]:
+    if mode == "day":
+
+        def by_day(row: Dict[str, Any]) -> str:
+            ts = parse_ts(row.get("created_at"))
+            return ts.strftime("%Y-%m-%d") if ts else "none"
+
+        return by_day
+    if mode == "prefix":
+        return lambda row: str(row.get("id") or "")[:prefix_len]
+    raise ValueError(f"unknown bucket mode {mode!r}; expected one of {', '.join(BUCKET_MODES)}")
+
+
+class RunsSource(Protocol):
+    """One side of the comparison."""
+
+    def page(self, after: Optional[Keyset], limit: int) -> List[Dict[str, Any]]:
+        """
+        Rows with a non-NULL created_at, ordered by (created_at, id) strictly after `after`
+        (keyset), at most `limit`.
+        """
+        ...
+
+    def null_page(self, after_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Rows with a NULL created_at, ordered by id strictly after `after_id`, at most `limit`."""
+        ...
+
+    def bucket_rows(self, mode: str, bucket: str, limit: int) -> Iterator[Dict[str, Any]]:
+        """All rows of one bucket (paged internally)."""
+        ...
+
+
+def _keyset(row: Dict[str, Any]) -> Keyset:
+    ts = row.get("created_at")
+    return (ts.isoformat() if isinstance(ts, datetime) else str(ts), str(row.get("id")))
+
+
+def iter_rows(source: RunsSource, *, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    after: Optional[Keyset] = None
+    while True:
+        rows = source.page(after, page_size)
+        yield from rows
+        if len(rows) < page_size:
+            break
+        after = _keyset(rows[-1])
+    # NULL created_at never satisfies the keyset comparison; page those rows by id.
+    after_id: Optional[str] = None
+    while True:
+        rows = source.null_page(after_id, page_size)
+        yield from rows
+        if len(rows) < page_size:
+            return
+        after_id = str(rows[-1]["id"])
+
+
+@dataclass
+class BucketDigests:
+    counts: Dict[str, int] = field(default_factory=dict)
+    sums: Dict[str, int] = field(default_factory=dict)
+    total: int = 0
+
+    def add(self, bucket: str, digest: int) -> None:
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.sums[bucket] = (self.sums.get(bucket, 0) + digest) & _M128
+        self.total += 1
+
+
+def bucket_digests(
+    source: RunsSource,
+    key: Callable[[Dict[str, Any]], str],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> BucketDigests:
+    out = BucketDigests()
+    for row in iter_rows(source, page_size=page_size):
+        out.add(key(row), row_digest(row))
+    return out
+
+
+def mismatching_buckets(a: BucketDigests, b: BucketDigests) -> List[str]:
+    keys = set(a.counts) | set(b.counts)
+    return sorted(
+        k for k in keys if (a.counts.get(k), a.sums.get(k)) != (b.counts.get(k), b.sums.get(k))
+    )
+
+
+@dataclass
+class ParityReport:
+    source_rows: int
+    target_rows: int
+    buckets: int
+    mismatched_buckets: List[str]
+    missing_in_target: List[str]
+    extra_in_target: List[str]
+    field_mismatch: Dict[str, List[str]]
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatched_buckets
+
+
+def _diff_bucket(
+    source: RunsSource,
+    target: RunsSource,
+    mode: str,
+    key: Callable[[Dict[str, Any]], str],
+    bucket: str,
+    page_size: int,
+    report: ParityReport,
+) -> None:
+    # The id range of a short bucket ("a") also holds other buckets' ids ("ab1"); keep its own rows only.
+    src: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for row in source.bucket_rows(mode, bucket, page_size):
+        if key(row) == bucket:
+            src[str(row.get("id"))] = (row_digest(row), row)
+    for row in target.bucket_rows(mode, bucket, page_size):
+        if key(row) != bucket:
+            continue
+        rid = str(row.get("id"))
+        hit = src.pop(rid, None)
+        if hit is None:
+            report.extra_in_target.append(rid)
+        elif hit[0] != row_digest(row):
+            sv, tv = row_values(hit[1]), row_values(row)
+            report.field_mismatch[rid] = [f for f in COMPARED_FIELDS if sv[f] != tv[f]]
+    report.missing_in_target.extend(src)
+
+
+def compare_runs(
+    source: RunsSource,
+    target: RunsSource,
+    *,
+    bucket: str = "day",
+    prefix_len: int = DEFAULT_ID_PREFIX_LEN,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> ParityReport:
+    """Bucket digests of both sides, then a row diff of the mismatching buckets only."""
+    key = bucket_key_fn(bucket, prefix_len=prefix_len)
+    a = bucket_digests(source, key, page_size=page_size)
+    b = bucket_digests(target, key, page_size=page_size)
+    bad = mismatching_buckets(a, b)
+    report = ParityReport(
+        source_rows=a.total,
+        target_rows=b.total,
+        buckets=len(set(a.counts) | set(b.counts)),
+        mismatched_buckets=bad,
+        missing_in_target=[],
+        extra_in_target=[],
+        field_mismatch={},
+    )
+    for name in bad:
+        _diff_bucket(source, target, bucket, key, name, page_size, report)
+    report.missing_in_target.sort()
+    report.extra_in_target.sort()
+    return report
+
+
+def day_bounds(bucket: str) -> Tuple[str, str]:
+    start = datetime.strptime(bucket, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    return start.isoformat(), (start + timedelta(days=1)).isoformat()
+
+
+def prefix_bounds(bucket: str) -> Tuple[str, Optional[str]]:
+    """``[lo, hi)`` id range of a prefix bucket (a range on ``id`` can use the primary key)."""
+    for i in range(len(bucket) - 1, -1, -1):
+        if ord(bucket[i]) < 0x10FFFF:
+            return bucket, bucket[:i] + chr(ord(bucket[i]) + 1)
+    return bucket, None
+
+
+class PostgresRunsSource:
+    """``console.runs`` over a psycopg connection."""
+
+    def __init__(self, conn: Any, *, table: str = "console.runs") -> None:
+        self.conn = conn
+        self.table = table
+
+    def _fetch(self, sql: str, params: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        with self.conn.cursor() as cur:
+            cur.execute(sql, params)
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, row)) for row in cur.fetchall()]
+
+    def page(self, after: Optional[Keyset], limit: int) -> List[Dict[str, Any]]:
+        base = f"select {RUN_COLUMNS} from {self.table}"
+        if after is None:
+            return self._fetch(f"{base} where created_at is not null order by created_at, id limit %s", (limit,))
+        return self._fetch(
+            f"{base} where (created_at, id) > (%s::timestamptz, %s) order by created_at, id limit %s",
+            (after[0], after[1], limit),
+        )
+
+    def null_page(self, after_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        base = f"select {RUN_COLUMNS} from {self.table} where created_at is null"
+        if after_id is None:
+            return self._fetch(f"{base} order by id limit %s", (limit,))
+        return self._fetch(f"{base} and id > %s order by id limit %s", (after_id, limit))
+
+    def bucket_rows(self, mode: str, bucket: str, limit: int) -> Iterator[Dict[str, Any]]:
+        params: Tuple[Any, ...]
+        if mode == "day":
+            if bucket == "none":
+                where, params = "created_at is null", ()
+            else:
+                where, params = "created_at >= %s::timestamptz and created_at < %s::timestamptz", day_bounds(bucket)
+        else:
+            lo, hi = prefix_bounds(bucket)
+            where, params = ("id >= %s and id < %s", (lo, hi)) if hi is not None else ("id >= %s", (lo,))
+        after_id: Optional[str] = None
+        while True:
+            extra = " and id > %s" if after_id is not None else ""
+            rows = self._fetch(
+                f"select {RUN_COLUMNS} from {self.table} where {where}{extra} order by id limit %s",
+                params + ((after_id,) if after_id is not None else ()) + (limit,),
+            )
+            yield from rows
+            if len(rows) < limit:
+                return
+            after_id = str(rows[-1]["id"])
+
+
+def _pgrst_quote(v: str) -> str:
+    return '"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class SupabaseRunsSource:
+    """Supabase ``runs`` over PostgREST (keyset via an ``or`` filter, no offsets)."""
+
+    def __init__(self, client: Any, *, table: str = "runs") -> None:
+        self.client = client
+        self.table = table
+
+    def page(self, after: Optional[Keyset], limit: int) -> List[Dict[str, Any]]:
+        q = self.client.table(self.table).select(RUN_COLUMNS)
+        if after is None:
+            q = q.not_.is_("created_at", "null")
+        else:
+            ts, rid = _pgrst_quote(after[0]), _pgrst_quote(after[1])
+            q = q.or_(f"created_at.gt.{ts},and(created_at.eq.{ts},id.gt.{rid})")
+        resp = q.order("created_at", desc=False).order("id", desc=False).limit(limit).execute()
+        return [dict(r) for r in (getattr(resp, "data", None) or [])]
+
+    def null_page(self, after_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        q = self.client.table(self.table).select(RUN_COLUMNS).is_("created_at", "null")
+        if after_id is not None:
+            q = q.gt("id", after_id)
+        resp = q.order("id", desc=False).limit(limit).execute()
+        return [dict(r) for r in (getattr(resp, "data", None) or [])]
+
+    def bucket_rows(self, mode: str, bucket: str, limit: int) -> Iterator[Dict[str, Any]]:
+        after_id: Optional[str] = None
+        while True:
+            q = self.client.table(self.table).select(RUN_COLUMNS)
+            if mode == "day":
+                if bucket == "none":
+                    q = q.is_("created_at", "null")
+                else:
+                    start, end = day_bounds(bucket)
+                    q = q.gte("created_at", start).lt("created_at", end)
+            else:
+                lo, hi = prefix_bounds(bucket)
+                q = q.gte("id", lo)
+                if hi is not None:
+                    q = q.lt("id", hi)
+            if after_id is not None:
+                q = q.gt("id", after_id)
+            resp = q.order("id", desc=False).limit(limit).execute()
+            rows = [dict(r) for r in (getattr(resp, "data", None) or [])]
+            yield from rows
+            if len(rows) < limit:
+                return
+            after_id = str(rows[-1]["id"])
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional, Protocol, Union
+
+from aigov_py.artifact_fingerprint import sha256_path
+
+UPLOAD_MANIFEST_SCHEMA = "aigov.upload_manifest.v1"
+
+# Relative to the repo root, next to the other local state.
+DEFAULT_UPLOAD_MANIFEST_RELPATH = Path(".govai") / "upload-manifest.json"
+
+DEFAULT_UPLOAD_WORKERS = 4
 
 
 @dataclass(frozen=True)
@@ -10,6 +25,15 @@ class UploadResult:
     bucket: str
     object_name: str
     message: str
+    skipped: bool = False
+
+
+@dataclass(frozen=True)
+class UploadItem:
+    bucket: str
+    object_name: str
+    path: Path
+    content_type: str
 
 
 def _as_upsert_dict() -> dict:
@@ -21,12 +45,12 @@ def _as_upsert_dict() -> dict:
     }
 
 
-def upload_file_bytes(
+def _upload(
     client,
     *,
     bucket: str,
     object_name: str,
-    data: bytes,
+    body: Union[bytes, BinaryIO],
     content_type: str,
 ) -> UploadResult:
     try:
@@ -35,7 +59,7 @@ def upload_file_bytes(
         # try upload with upsert enabled
         res = storage.upload(
             object_name,
-            data,
+            body,
             file_options={
                 "content-type": content_type,
                 **_as_upsert_dict(),
@@ -54,6 +78,17 @@ def upload_file_bytes(
         return UploadResult(ok=False, bucket=bucket, object_name=object_name, message=str(e))
 
 
+def upload_file_bytes(
+    client,
+    *,
+    bucket: str,
+    object_name: str,
+    data: bytes,
+    content_type: str,
+) -> UploadResult:
+    return _upload(client, bucket=bucket, object_name=object_name, body=data, content_type=content_type)
+
+
 def upload_file_path(
     client,
     *,
@@ -70,54 +105,243 @@ def upload_file_path(
             message=f"file not found: {path}",
         )
 
-    data = path.read_bytes()
-    return upload_file_bytes(
-        client,
-        bucket=bucket,
-        object_name=object_name,
-        data=data,
-        content_type=content_type,
-    )
+    # Passed as an open file so the client streams it (multipart) instead of buffering it.
+    with path.open("rb") as f:
+        return _upload(client, bucket=bucket, object_name=object_name, body=f, content_type=content_type)
 
 
-def upload_artifacts_for_run(
-    client,
-    *,
-    run_id: str,
-    pack_zip: Path,
-    audit_json: Path,
-    evidence_json: Path,
-) -> list[UploadResult]:
-    results: list[UploadResult] = []
-
-    results.append(
-        upload_file_path(
-            client,
-            bucket="packs",
-            object_name=f"{run_id}.zip",
-            path=pack_zip,
-            content_type="application/zip",
+class StorageBackend(Protocol):
+    """Where artifacts are uploaded. `name` identifies the destination in the upload manifest."""
+
+    name: str
+
+    def upload(self, item: UploadItem) -> UploadResult: ...
+
+    def remote_sha256(self, bucket: str, object_name: str) -> Optional[str]:
+        """sha256 of the stored object if the backend can tell cheaply, else None."""
+        ...
+
+    def exists(self, bucket: str, object_name: str) -> Optional[bool]:
+        """Whether the object is stored (confirms a manifest hit); None if the backend cannot tell."""
+        ...
+
+
+class SupabaseStorageBackend:
+    """
+    Supabase Storage (upsert). Remote hashes are not exposed, so skips rely on the manifest;
+    a manifest hit is confirmed by listing the object, so deleted objects are uploaded again.
+    """
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.name = str(getattr(client, "supabase_url", "") or "supabase")
+
+    def upload(self, item: UploadItem) -> UploadResult:
+        return upload_file_path(
+            self.client,
+            bucket=item.bucket,
+            object_name=item.object_name,
+            path=item.path,
+            content_type=item.content_type,
         )
-    )
 
-    results.append(
-        upload_file_path(
-            client,
-            bucket="audit",
-            object_name=f"{run_id}.json",
-            path=audit_json,
-            content_type="application/json",
+    def remote_sha256(self, bucket: str, object_name: str) -> Optional[str]:
+        return None
+
+    def exists(self, bucket: str, object_name: str) -> Optional[bool]:
+        folder, _, name = object_name.rpartition("/")
+        try:
+            entries = self.client.storage.from_(bucket).list(folder or None, {"search": name})
+        except Exception:
+            return False  # cannot confirm: upload again (it is an upsert)
+        return any(isinstance(e, dict) and e.get("name") == name for e in entries or [])
+
+
+class LocalDirectoryBackend:
+    """
+    Buckets as directories under `root` (e.g. a mounted volume, or a stand-in for tests).
+    Each object gets a `<object>.sha256` sidecar, so the remote hash check reads no content.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.name = f"file://{root.resolve()}"
+
+    def _path(self, bucket: str, object_name: str) -> Path:
+        return self.root / bucket / object_name
+
+    def upload(self, item: UploadItem) -> UploadResult:
+        dest = self._path(item.bucket, item.object_name)
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            h = hashlib.sha256()
+            with item.path.open("rb") as src, tmp.open("wb") as out:
+                for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                    h.update(chunk)
+                    out.write(chunk)
+            os.replace(tmp, dest)
+            dest.with_name(dest.name + ".sha256").write_text(h.hexdigest() + "\n", encoding="utf-8")
+        except OSError as e:
+            return UploadResult(ok=False, bucket=item.bucket, object_name=item.object_name, message=str(e))
+        return UploadResult(ok=True, bucket=item.bucket, object_name=item.object_name, message="uploaded")
+
+    def remote_sha256(self, bucket: str, object_name: str) -> Optional[str]:
+        side = self._path(bucket, object_name)
+        try:
+            return side.with_name(side.name + ".sha256").read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def exists(self, bucket: str, object_name: str) -> Optional[bool]:
+        return self._path(bucket, object_name).is_file()
+
+
+class UploadManifest:
+    """
+    Local record of what was last uploaded where: backend name -> "bucket/object" -> sha256.
+    Thread-safe; `save` writes atomically. A corrupt or foreign file starts empty.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            doc = None
+        if isinstance(doc, dict) and doc.get("schema_version") == UPLOAD_MANIFEST_SCHEMA:
+            backends = doc.get("backends")
+            if isinstance(backends, dict):
+                self._entries = {k: dict(v) for k, v in backends.items() if isinstance(v, dict)}
+
+    def get(self, backend: str, bucket: str, object_name: str) -> Optional[str]:
+        with self._lock:
+            return self._entries.get(backend, {}).get(f"{bucket}/{object_name}")
+
+    def record(self, backend: str, bucket: str, object_name: str, sha256: str) -> None:
+        with self._lock:
+            self._entries.setdefault(backend, {})[f"{bucket}/{object_name}"] = sha256
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            doc = {"schema_version": UPLOAD_MANIFEST_SCHEMA, "backends": self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(doc, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+def default_upload_manifest_path(root: Path) -> Path:
+    return root.resolve() / DEFAULT_UPLOAD_MANIFEST_RELPATH
+
+
+def _upload_one(
+    backend: StorageBackend, item: UploadItem, manifest: Optional[UploadManifest], force: bool = False
+) -> UploadResult:
+    if not item.path.exists():
+        return UploadResult(
+            ok=False,
+            bucket=item.bucket,
+            object_name=item.object_name,
+            message=f"file not found: {item.path}",
         )
-    )
+    try:
+        sha = sha256_path(item.path)
+    except OSError as e:
+        return UploadResult(ok=False, bucket=item.bucket, object_name=item.object_name, message=str(e))
+
+    if not force:
+        if manifest is not None and manifest.get(backend.name, item.bucket, item.object_name) == sha:
+            try:
+                present = backend.exists(item.bucket, item.object_name)
+            except Exception:
+                present = False
+            if present is not False:
+                return UploadResult(
+                    ok=True, bucket=item.bucket, object_name=item.object_name, message="unchanged", skipped=True
+                )
+        try:
+            remote = backend.remote_sha256(item.bucket, item.object_name)
+        except Exception:
+            remote = None
+        if remote == sha:
+            if manifest is not None:
+                manifest.record(backend.name, item.bucket, item.object_name, sha)
+            return UploadResult(
+                ok=True, bucket=item.bucket, object_name=item.object_name, message="unchanged", skipped=True
+            )
+
+    res = backend.upload(item)
+    if res.ok and manifest is not None:
+        manifest.record(backend.name, item.bucket, item.object_name, sha)
+    return res
 
-    results.append(
-        upload_file_path(
-            client,
+
+def upload_artifacts(
+    backend: StorageBackend,
+    items: Iterable[UploadItem],
+    *,
+    manifest: Optional[UploadManifest] = None,
+    max_workers: Optional[int] = None,
+    save_manifest: bool = True,
+    force: bool = False,
+) -> list[UploadResult]:
+    """
+    Upload `items` on a thread pool (results in input order). Objects whose sha256 matches
+    the manifest entry for this backend (and that the backend still has), or the backend's
+    remote hash, are skipped; `force` uploads everything. The manifest is saved once at the
+    end (unless `save_manifest` is False).
+    """
+    todo = list(items)
+    workers = max(1, min(len(todo) or 1, max_workers or DEFAULT_UPLOAD_WORKERS))
+    try:
+        if workers == 1:
+            return [_upload_one(backend, it, manifest, force) for it in todo]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda it: _upload_one(backend, it, manifest, force), todo))
+    finally:
+        if manifest is not None and save_manifest:
+            manifest.save()
+
+
+def run_upload_items(run_id: str, *, pack_zip: Path, audit_json: Path, evidence_json: Path) -> list[UploadItem]:
+    return [
+        UploadItem(bucket="packs", object_name=f"{run_id}.zip", path=pack_zip, content_type="application/zip"),
+        UploadItem(bucket="audit", object_name=f"{run_id}.json", path=audit_json, content_type="application/json"),
+        UploadItem(
             bucket="evidence",
             object_name=f"{run_id}.json",
             path=evidence_json,
             content_type="application/json",
-        )
-    )
+        ),
+    ]
 
-    return results
+
+def upload_artifacts_for_run(
+    client,
+    *,
+    run_id: str,
+    pack_zip: Path,
+    audit_json: Path,
+    evidence_json: Path,
+    backend: Optional[StorageBackend] = None,
+    manifest: Optional[UploadManifest] = None,
+    max_workers: Optional[int] = None,
+    force: bool = False,
+) -> list[UploadResult]:
+    """Pack, audit and evidence uploads for one run (results in that order)."""
+    items = run_upload_items(run_id, pack_zip=pack_zip, audit_json=audit_json, evidence_json=evidence_json)
+    return upload_artifacts(
+        backend if backend is not None else SupabaseStorageBackend(client),
+        items,
+        manifest=manifest,
+        max_workers=max_workers,
+        force=force,
+    )
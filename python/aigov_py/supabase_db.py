@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from supabase import create_client
 
@@ -32,3 +32,19 @@ def upsert_run_row_via_supabase(row: Dict[str, Any]) -> None:
 
     if hasattr(response, "error") and response.error:
         raise RuntimeError(f"Supabase error: {response.error}")
+
+
+def upsert_run_rows_via_supabase(rows: List[Dict[str, Any]], *, chunk_size: int = 500) -> None:
+    """Batched form of ``upsert_run_row_via_supabase``: one PostgREST request per `chunk_size` rows."""
+    if not rows:
+        return
+    client = create_supabase_client(strict=True)
+    for i in range(0, len(rows), chunk_size):
+        response = (
+            client
+            .table("runs")
+            .upsert(rows[i : i + chunk_size], on_conflict="id")
+            .execute()
+        )
+        if hasattr(response, "error") and response.error:
+            raise RuntimeError(f"Supabase error: {response.error}")
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
@@ -33,26 +35,45 @@ def _audit_request_headers() -> Dict[str, str]:
     return h
 
 
-def verify(run_id: str, *, as_json: bool = False) -> int:
-    root = repo_root()
-    mode = os.environ.get("AIGOV_MODE", "ci")
-    endpoint = audit_base_url()
+@dataclass(frozen=True)
+class LogVerdict:
+    """Result of one ``GET /verify-log`` (the tenant ledger chain check, identical for every run)."""
+
+    verdict: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def fetch_log_verdict(endpoint: str) -> LogVerdict:
+    try:
+        r = requests.get(
+            f"{endpoint}/verify-log",
+            headers=_audit_request_headers(),
+            timeout=15,
+        )
+        r.raise_for_status()
+        body = r.json()
+    except Exception as e:
+        return LogVerdict(error=str(e))
+    if not isinstance(body, dict):
+        return LogVerdict(error=f"verify-log returned {type(body).__name__}, expected an object")
+    return LogVerdict(verdict=body)
+
 
+def check_artifacts(run_id: str, *, root: str, log: LogVerdict) -> Tuple[bool, List[Dict[str, Any]], List[str]]:
+    """
+    Checks of the local docs/* artifacts of one run against a shared `log` verdict.
+
+    Returns ``(ok, checks, lines)``; `lines` are the human-readable report lines, in order.
+    Does not print, so it is safe to run for many runs on a thread pool.
+    """
     audit_path = os.path.join(root, "docs", "audit", f"{run_id}.json")
     evidence_path = os.path.join(root, "docs", "evidence", f"{run_id}.json")
     report_path = os.path.join(root, "docs", "reports", f"{run_id}.md")
 
     checks: List[Dict[str, Any]] = []
+    lines: List[str] = []
     ok = True
-
-    def human(msg: str) -> None:
-        if not as_json:
-            print(msg)
-
-    if not as_json:
-        print("AIGOV VERIFICATION REPORT")
-        print(f"Audit ID: {run_id}")
-        print(f"AIGOV_MODE: {mode}")
+    human = lines.append
 
     audit = load_json(audit_path)
     evidence = load_json(evidence_path)
@@ -78,14 +99,8 @@ def verify(run_id: str, *, as_json: bool = False) -> int:
 
     # --- GOVERNANCE LOG VERIFICATION ---
     ledger_derived = isinstance(evidence, dict) and bool(evidence.get("log_path"))
-    try:
-        r = requests.get(
-            f"{endpoint}/verify-log",
-            headers=_audit_request_headers(),
-            timeout=15,
-        )
-        r.raise_for_status()
-        verdict = r.json()
+    if log.error is None:
+        verdict = log.verdict or {}
         if verdict.get("ok") is True:
             human("OK   governance hash chain verified")
             checks.append({"id": "governance_chain", "ok": True, "message": "hash chain verified", "detail": verdict})
@@ -93,14 +108,13 @@ def verify(run_id: str, *, as_json: bool = False) -> int:
             human(f"FAIL governance verify-log returned: {verdict}")
             checks.append({"id": "governance_chain", "ok": False, "message": "verify-log not ok", "detail": verdict})
             ok = False
-    except Exception as e:
-        if ledger_derived:
-            human(f"FAIL could not verify governance log chain: {e}")
-            checks.append({"id": "governance_chain", "ok": False, "message": str(e)})
-            ok = False
-        else:
-            human(f"WARN could not verify governance log chain (skipping): {e}")
-            checks.append({"id": "governance_chain", "ok": True, "level": "warn", "message": str(e)})
+    elif ledger_derived:
+        human(f"FAIL could not verify governance log chain: {log.error}")
+        checks.append({"id": "governance_chain", "ok": False, "message": log.error})
+        ok = False
+    else:
+        human(f"WARN could not verify governance log chain (skipping): {log.error}")
+        checks.append({"id": "governance_chain", "ok": True, "level": "warn", "message": log.error})
 
     # --- EVENTS LIST ---
     events = evidence.get("events")
@@ -162,6 +176,21 @@ def verify(run_id: str, *, as_json: bool = False) -> int:
         human("OK   report file present")
         checks.append({"id": "report_file", "ok": True, "message": "present"})
 
+    return ok, checks, lines
+
+
+def verify(run_id: str, *, as_json: bool = False) -> int:
+    root = repo_root()
+    mode = os.environ.get("AIGOV_MODE", "ci")
+    endpoint = audit_base_url()
+
+    if not as_json:
+        print("AIGOV VERIFICATION REPORT")
+        print(f"Audit ID: {run_id}")
+        print(f"AIGOV_MODE: {mode}")
+
+    ok, checks, lines = check_artifacts(run_id, root=root, log=fetch_log_verdict(endpoint))
+
     verdict = "VALID" if ok else "INVALID"
     if as_json:
         payload = {
@@ -173,6 +202,8 @@ def verify(run_id: str, *, as_json: bool = False) -> int:
         }
         print(json.dumps(payload, ensure_ascii=False, indent=2))
     else:
+        for line in lines:
+            print(line)
         if ok:
             print("ARTIFACTS_OK")
         else:
@@ -181,6 +212,49 @@ def verify(run_id: str, *, as_json: bool = False) -> int:
     return 0 if ok else 2
 
 
+def verify_many(
+    run_ids: Iterable[str],
+    *,
+    root: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Verify the local artifacts of many runs; one JSON-ready document with per-run checks.
+
+    ``/verify-log`` is requested once for the batch (all runs share the tenant ledger), and
+    the per-run file reads overlap on a thread pool. Runs keep their input order.
+    """
+    root = root if root is not None else repo_root()
+    mode = os.environ.get("AIGOV_MODE", "ci")
+    endpoint = audit_base_url()
+    ids = list(dict.fromkeys(r.strip() for r in run_ids if r.strip()))
+    log = fetch_log_verdict(endpoint)
+
+    def one(run_id: str) -> Dict[str, Any]:
+        try:
+            ok, checks, _ = check_artifacts(run_id, root=root, log=log)
+        except Exception as e:
+            ok, checks = False, [{"id": "artifacts", "ok": False, "message": f"{type(e).__name__}: {e}"}]
+        return {"run_id": run_id, "verdict": "VALID" if ok else "INVALID", "checks": checks}
+
+    workers = max(1, min(len(ids) or 1, max_workers or min(32, (os.cpu_count() or 1) + 4)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(one, ids))
+
+    invalid = [r["run_id"] for r in runs if r["verdict"] != "VALID"]
+    chain_ok = log.error is None and (log.verdict or {}).get("ok") is True
+    return {
+        "aigov_mode": mode,
+        "audit_endpoint": endpoint,
+        "verdict": "VALID" if runs and not invalid else "INVALID",
+        "governance_chain": {"ok": chain_ok, "detail": log.verdict, "error": log.error},
+        "total": len(runs),
+        "valid": len(runs) - len(invalid),
+        "invalid": invalid,
+        "runs": runs,
+    }
+
+
 def main(argv: list[str]) -> int:
     if len(argv) != 2:
         print("Usage: python -m aigov_py.verify <RUN_ID>")
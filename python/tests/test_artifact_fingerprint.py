@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from pathlib import Path
+
+import pytest
+
+from aigov_py import artifact_fingerprint as af
+from aigov_py.discovery_scan import scan_repo
+
+
+def _varint(n: int) -> bytes:
+    out = bytearray()
+    while True:
+        b = n & 0x7F
+        n >>= 7
+        out.append(b | (0x80 if n else 0))
+        if not n:
+            return bytes(out)
+
+
+def _ld(field: int, payload: bytes) -> bytes:
+    return _varint(field << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _onnx_tensor(dims: list[int], data_type: int, raw: bytes) -> bytes:
+    body = b"".join(_varint(1 << 3) + _varint(d) for d in dims)
+    return body + _varint(2 << 3) + _varint(data_type) + _ld(9, raw)
+
+
+def _write_safetensors(path: Path) -> None:
+    header = {
+        "a": {"dtype": "F32", "shape": [2, 3], "data_offsets": [0, 24]},
+        "b": {"dtype": "I8", "shape": [4], "data_offsets": [24, 28]},
+        "__metadata__": {"format": "pt"},
+    }
+    raw = json.dumps(header).encode("utf-8")
+    path.write_bytes(struct.pack("<Q", len(raw)) + raw + b"\x00" * 28)
+
+
+def test_headers_are_parsed_without_loading_weights(tmp_path: Path) -> None:
+    st = tmp_path / "model.safetensors"
+    _write_safetensors(st)
+    onnx = tmp_path / "model.onnx"
+    graph = _ld(5, _onnx_tensor([3, 4], 1, b"\x00" * 48)) + _ld(5, _onnx_tensor([5], 7, b"\x00" * 40))
+    onnx.write_bytes(_varint(1 << 3) + _varint(8) + _ld(7, graph))
+
+    fp_st, fp_onnx = af.fingerprint_artifacts([st, onnx])
+    assert fp_st["sha256"] == hashlib.sha256(st.read_bytes()).hexdigest()
+    assert fp_st["size_bytes"] == st.stat().st_size
+    assert (fp_st["format"], fp_st["tensor_count"], fp_st["dtypes"], fp_st["parameter_count"]) == (
+        "safetensors",
+        2,
+        {"F32": 1, "I8": 1},
+        10,
+    )
+    assert (fp_onnx["format"], fp_onnx["tensor_count"], fp_onnx["dtypes"], fp_onnx["parameter_count"]) == (
+        "onnx",
+        2,
+        {"float32": 1, "int64": 1},
+        17,
+    )
+
+
+def test_corrupt_header_is_reported_not_raised(tmp_path: Path) -> None:
+    bad = tmp_path / "broken.onnx"
+    bad.write_bytes(b"\xff\xff\xff")
+    fp = af.fingerprint_artifact(bad)
+    assert fp["sha256"] == hashlib.sha256(b"\xff\xff\xff").hexdigest()
+    assert "header_error" in fp
+
+
+def test_fingerprint_cache_skips_rehash_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    art = tmp_path / "pytorch_model.bin"
+    art.write_bytes(b"PK\x03\x04weights")
+    cache_path = tmp_path / "fp.json"
+    first = af.fingerprint_artifacts([art], cache=af.FingerprintCache.load(cache_path))
+    assert first[0]["format"] == "torch_zip"
+
+    hashed: list[Path] = []
+    real = af.sha256_path
+    monkeypatch.setattr(af, "sha256_path", lambda p: hashed.append(p) or real(p))
+    assert af.fingerprint_artifacts([art], cache=af.FingerprintCache.load(cache_path)) == first
+    assert hashed == []
+
+    art.write_bytes(b"other weights, longer")
+    again = af.fingerprint_artifacts([art], cache=af.FingerprintCache.load(cache_path))
+    assert hashed == [art]
+    assert again[0]["sha256"] == hashlib.sha256(b"other weights, longer").hexdigest()
+
+
+def test_discovery_stage_attaches_fingerprints_to_artifact_findings(tmp_path: Path) -> None:
+    _write_safetensors(tmp_path / "model.safetensors")
+    (tmp_path / "app.py").write_text("import openai\n", encoding="utf-8")
+    scan = scan_repo(tmp_path, include_history=False)
+    af.attach_artifact_fingerprints(scan, tmp_path)
+
+    by_usage = {f["detected_ai_usage"]: f for f in scan["findings"]}
+    assert by_usage["model_artifact"]["artifact"]["tensor_count"] == 2
+    assert "artifact" not in by_usage["openai"]
+    json.dumps(scan)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from aigov_py.artifact_store import ArtifactStore, ingest_refs, verify_runs
+from aigov_py.cli import main
+from aigov_py.evidence_pack import build_evidence_pack
+from aigov_py.export_bundle import export_bundle
+from aigov_py.report_fill import _write_text
+
+
+def _seed(root: Path, run_id: str, report: str = "# report\n") -> None:
+    (root / "docs" / "evidence").mkdir(parents=True, exist_ok=True)
+    (root / "docs" / "reports").mkdir(parents=True, exist_ok=True)
+    evidence = {"run_id": run_id, "policy_version": "v1", "events": []}
+    (root / "docs" / "evidence" / f"{run_id}.json").write_text(json.dumps(evidence), encoding="utf-8")
+    (root / "docs" / "reports" / f"{run_id}.md").write_text(report, encoding="utf-8")
+
+
+def test_ingest_deduplicates_and_links(tmp_path: Path) -> None:
+    store = ArtifactStore.open(tmp_path, create=True)
+    assert store is not None
+    a = tmp_path / "docs" / "reports" / "a.md"
+    b = tmp_path / "docs" / "reports" / "b.md"
+    a.parent.mkdir(parents=True)
+    a.write_text("same\n", encoding="utf-8")
+    b.write_text("same\n", encoding="utf-8")
+
+    ra = store.ingest(a)
+    rb = store.ingest(b)
+    assert ra["stored"] and not rb["stored"]
+    assert ra["sha256"] == rb["sha256"]
+    obj = store.object_path(ra["sha256"])
+    assert os.path.samefile(a, obj) and os.path.samefile(b, obj)
+    assert store.verify(a, ra["sha256"]) == "linked"
+
+    # Rewriting a ref detaches it; the shared object is untouched.
+    _write_text(a, "changed\n")
+    assert obj.read_text(encoding="utf-8") == "same\n"
+    assert store.verify(a, ra["sha256"]) == "mismatch"
+    assert store.verify(b, ra["sha256"]) == "linked"
+    assert store.fsck() == []
+
+
+def test_gc_removes_only_unreferenced_objects(tmp_path: Path) -> None:
+    store = ArtifactStore.open(tmp_path, create=True)
+    assert store is not None
+    keep = store.put_bytes(b"keep")
+    drop = store.put_bytes(b"drop")
+    store.link(keep, tmp_path / "docs" / "audit" / "k.json")
+
+    assert store.gc()["removed"] == 0  # too recent
+    assert store.gc(min_age=0, dry_run=True) == {"objects": 2, "removed": 1, "bytes_freed": 4, "dry_run": True}
+    assert store.has(drop)
+    store.gc(min_age=0)
+    assert store.has(keep) and not store.has(drop)
+
+
+def test_export_and_evidence_pack_use_the_store(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for rid in ("r1", "r2"):
+        _seed(tmp_path, rid)
+    assert main(["--compact-json", "store", "ingest", "--root", str(tmp_path)]) == 0
+    ingested = json.loads(capsys.readouterr().out)
+    assert ingested["files"] == 4 and ingested["stored"] == 3  # the two reports are identical
+
+    store = ArtifactStore.open(tmp_path)
+    assert store is not None
+    export_bundle("r1", root=tmp_path, verbose=False)
+    out = build_evidence_pack("r1", tmp_path)
+    staged = tmp_path / "docs" / "packs" / "r1" / "report.md"
+    assert os.path.samefile(staged, tmp_path / "docs" / "reports" / "r1.md")
+    assert os.path.samefile(tmp_path / "docs" / "packs" / "r1.zip", store.object_path(out["sha256"]))
+
+    [run] = verify_runs(store, tmp_path, ["r1"])
+    assert run == {"run_id": "r1", "ok": True, "checks": {"evidence": "linked", "report": "linked", "pack": "linked"}}
+
+    # A detached, edited report is caught.
+    _write_text(tmp_path / "docs" / "reports" / "r1.md", "# edited\n")
+    assert main(["--compact-json", "store", "verify", "--root", str(tmp_path), "--objects"]) == 1
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["runs"][0]["checks"]["report"] == "mismatch"
+    assert doc["corrupt_objects"] == []
+
+    assert ingest_refs(store, tmp_path)["stored"] == 2  # edited report + pack digest sidecar
+    assert main(["store", "gc", "--root", str(tmp_path / "missing")]) == 4
+
+
+@pytest.mark.skipif(shutil.which("make") is None, reason="make not installed")
+def test_report_template_after_store_export_leaves_objects_intact(tmp_path: Path) -> None:
+    _seed(tmp_path, "r1")
+    store = ArtifactStore.open(tmp_path, create=True)
+    assert store is not None
+    export_bundle("r1", root=tmp_path, verbose=False)
+    report = tmp_path / "docs" / "reports" / "r1.md"
+    obj = store.object_path(hashlib.sha256(b"# report\n").hexdigest())
+    assert os.path.samefile(report, obj)
+
+    makefile = Path(__file__).resolve().parents[2] / "Makefile"
+    subprocess.run(
+        ["make", "-s", "-f", str(makefile), "report_template", "RUN_ID=r1"],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+    )
+    assert report.read_text(encoding="utf-8").startswith("run_id=r1\n")
+    assert not os.path.samefile(report, obj)
+    assert obj.read_bytes() == b"# report\n"
+    assert store.fsck() == []
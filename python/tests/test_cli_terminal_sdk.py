@@ -251,6 +251,84 @@ def test_verify_json_mocked_requests(tmp_path: Path, monkeypatch: pytest.MonkeyP
     assert code == cli_exit.EX_OK
 
 
+def test_verify_bulk_calls_verify_log_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    root = tmp_path
+    for d in ("audit", "evidence", "reports"):
+        (root / "docs" / d).mkdir(parents=True)
+    ids = [f"run-{i}" for i in range(5)]
+    for rid in ids:
+        evidence = {
+            "policy_version": "v0.4_human_approval",
+            "events": [{"event_id": "e1", "event_type": "run_started", "run_id": rid, "payload": {}}],
+        }
+        (root / "docs" / "audit" / f"{rid}.json").write_text(json.dumps({"bundle_sha256": "abc"}), encoding="utf-8")
+        (root / "docs" / "evidence" / f"{rid}.json").write_text(json.dumps(evidence), encoding="utf-8")
+        if rid != "run-3":
+            (root / "docs" / "reports" / f"{rid}.md").write_text("# report", encoding="utf-8")
+    ids_file = root / "ids.txt"
+    ids_file.write_text("\n".join(ids) + "\n", encoding="utf-8")
+
+    import aigov_py.verify as verify_mod
+
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = {"ok": True}
+    monkeypatch.setattr(verify_mod, "repo_root", lambda: str(root))
+    with patch("aigov_py.verify.requests.get", return_value=mock_resp) as get:
+        code = main(
+            ["--audit-base-url", "http://127.0.0.1:9", "verify", "--run-ids-file", str(ids_file), "--workers", "3"]
+        )
+
+    assert code == cli_exit.EX_INVALID
+    assert get.call_count == 1
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["governance_chain"]["ok"] is True
+    assert [r["run_id"] for r in doc["runs"]] == ids
+    assert (doc["valid"], doc["invalid"]) == (4, ["run-3"])
+    failed = [c["id"] for c in doc["runs"][3]["checks"] if not c["ok"]]
+    assert failed == ["report_file"]
+
+
+def test_verify_bulk_non_object_verify_log_body_fails_the_chain_check(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    root = tmp_path
+    for d in ("audit", "evidence", "reports"):
+        (root / "docs" / d).mkdir(parents=True)
+    for rid, log_path in (("ledger", "audit_log.jsonl"), ("local", None)):
+        evidence = {
+            "policy_version": "v0.4_human_approval",
+            "log_path": log_path,
+            "events": [{"event_id": "e1", "event_type": "run_started", "run_id": rid, "payload": {}}],
+        }
+        (root / "docs" / "audit" / f"{rid}.json").write_text(json.dumps({"bundle_sha256": "abc"}), encoding="utf-8")
+        (root / "docs" / "evidence" / f"{rid}.json").write_text(json.dumps(evidence), encoding="utf-8")
+        (root / "docs" / "reports" / f"{rid}.md").write_text("# report", encoding="utf-8")
+    ids_file = root / "ids.txt"
+    ids_file.write_text("ledger\nlocal\n", encoding="utf-8")
+
+    import aigov_py.verify as verify_mod
+
+    mock_resp = MagicMock()
+    mock_resp.json.return_value = ["not", "an", "object"]
+    monkeypatch.setattr(verify_mod, "repo_root", lambda: str(root))
+    with patch("aigov_py.verify.requests.get", return_value=mock_resp):
+        code = main(["--audit-base-url", "http://127.0.0.1:9", "verify", "--run-ids-file", str(ids_file)])
+
+    assert code == cli_exit.EX_INVALID
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["governance_chain"] == {
+        "ok": False,
+        "detail": None,
+        "error": "verify-log returned list, expected an object",
+    }
+    assert (doc["valid"], doc["invalid"]) == (1, ["ledger"])
+    chain = {r["run_id"]: next(c for c in r["checks"] if c["id"] == "governance_chain") for r in doc["runs"]}
+    assert chain["ledger"]["ok"] is False
+    assert chain["local"].get("level") == "warn"
+
+
 def test_unknown_subcommand_exits_usage() -> None:
     code = main(["not-a-valid-subcommand"])
     assert code == cli_exit.EX_USAGE
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aigov_py import dataset_fingerprint
+from aigov_py.cli import main
+from aigov_py.dataset_fingerprint import data_registered_fields, fingerprint_dataset, row_hashes
+
+
+def _rows(n: int) -> list[str]:
+    return [f"{i},{i * 3.5},name{i}" for i in range(n)]
+
+
+def test_row_hashes_do_not_depend_on_batching() -> None:
+    rows = [b"abc", b"", b"x" * 3000, b"hello,world", b"abcd"]
+    batched = row_hashes(np.frombuffer(b"".join(rows), dtype=np.uint8), np.array([len(r) for r in rows]))
+    for i, r in enumerate(rows):
+        single = row_hashes(np.frombuffer(r, dtype=np.uint8), np.array([len(r)]))
+        assert (single[0] == batched[i]).all()
+    # fixed-width fast path agrees with the variable-width path
+    fixed = row_hashes(np.frombuffer(b"abcdwxyz", dtype=np.uint8), np.array([4, 4]))
+    assert (fixed[0] == batched[4]).all()
+
+
+def test_csv_ordered_and_unordered_modes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dataset_fingerprint, "CHUNK_BYTES", 4096)
+    rows = _rows(5000)
+    shuffled = rows[:]
+    random.Random(7).shuffle(shuffled)
+    a = tmp_path / "a.csv"
+    b = tmp_path / "b.csv"
+    a.write_text("x,y,z\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    # CRLF, blank line and no trailing newline must not matter either
+    b.write_text("x,y,z\r\n" + "\r\n".join(shuffled[:10]) + "\r\n\r\n" + "\r\n".join(shuffled[10:]), encoding="utf-8")
+
+    ua = fingerprint_dataset(a, order_insensitive=True, max_workers=3)
+    ub = fingerprint_dataset(b, order_insensitive=True, max_workers=1)
+    assert ua["dataset_fingerprint"] == ub["dataset_fingerprint"]
+    assert ua["n_rows"] == 5000 and ua["n_features"] == 3 and ua["columns"] == ["x", "y", "z"]
+
+    oa = fingerprint_dataset(a)
+    assert oa["dataset_fingerprint"] != fingerprint_dataset(b)["dataset_fingerprint"]
+    assert oa["dataset_fingerprint"] != ua["dataset_fingerprint"]
+
+    # a duplicated row is visible in the unordered fingerprint
+    b.write_text("x,y,z\n" + "\n".join(rows + rows[:1]) + "\n", encoding="utf-8")
+    assert fingerprint_dataset(b, order_insensitive=True)["dataset_fingerprint"] != ua["dataset_fingerprint"]
+
+
+def test_npy_fingerprint_and_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    arr = np.arange(600, dtype=np.float64).reshape(200, 3)
+    np.save(tmp_path / "x.npy", arr)
+    np.save(tmp_path / "y.npy", np.asfortranarray(arr[::-1]))
+    fx = fingerprint_dataset(tmp_path / "x.npy", order_insensitive=True)
+    fy = fingerprint_dataset(tmp_path / "y.npy", order_insensitive=True)
+    assert fx["dataset_fingerprint"] == fy["dataset_fingerprint"]
+    assert data_registered_fields(fx) == {
+        "dataset_fingerprint": fx["dataset_fingerprint"],
+        "dataset_fingerprint_mode": "unordered",
+        "n_rows": 200,
+        "n_features": 3,
+    }
+
+    assert main(["--compact-json", "dataset", "fingerprint", str(tmp_path / "x.npy"), "--unordered"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["data_registered"]["dataset_fingerprint"] == fx["dataset_fingerprint"]
+
+    with pytest.raises(ValueError):
+        fingerprint_dataset(tmp_path / "x.txt")
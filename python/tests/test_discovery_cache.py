@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from aigov_py import discovery_scan
+from aigov_py.discovery_cache import default_cache_path
+from aigov_py.discovery_scan import scan_repo
+
+
+def _seed(root: Path) -> None:
+    (root / "requirements.txt").write_text("openai==1.0.0\n", encoding="utf-8")
+    (root / "app.py").write_text("from openai import OpenAI\n", encoding="utf-8")
+    (root / "users.csv").write_text("id,email\n1,a@b.c\n", encoding="utf-8")
+    (root / "notes.md").write_text("nothing\n", encoding="utf-8")
+
+
+def _count_scans(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    scanned: list[str] = []
+    real = discovery_scan.scan_file
+
+    def spy(path: Path, rel: str):  # type: ignore[no-untyped-def]
+        scanned.append(rel)
+        return real(path, rel)
+
+    monkeypatch.setattr(discovery_scan, "scan_file", spy)
+    return scanned
+
+
+def test_cached_rescan_matches_full_scan_and_reads_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed(tmp_path)
+    cache = default_cache_path(tmp_path)
+    full = scan_repo(tmp_path, include_history=False)
+    assert scan_repo(tmp_path, include_history=False, cache_path=cache) == full
+    assert cache.is_file()
+
+    scanned = _count_scans(monkeypatch)
+    assert scan_repo(tmp_path, include_history=False, cache_path=cache) == full
+    assert scanned == []
+
+    (tmp_path / "bot.py").write_text("import anthropic\n", encoding="utf-8")
+    (tmp_path / "notes.md").unlink()
+    out = scan_repo(tmp_path, include_history=False, cache_path=cache)
+    assert scanned == ["bot.py"]
+    assert out == scan_repo(tmp_path, include_history=False)
+    assert "notes.md" not in json.loads(cache.read_text(encoding="utf-8"))["files"]
+
+
+def test_touched_but_identical_file_is_served_by_content_hash(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed(tmp_path)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+    st = (tmp_path / "app.py").stat()
+    os.utime(tmp_path / "app.py", ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    scanned = _count_scans(monkeypatch)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+    assert scanned == []
+
+
+def test_ruleset_change_invalidates_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _seed(tmp_path)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+
+    monkeypatch.setattr(discovery_scan, "ruleset_fingerprint", lambda: "aigov.discovery_rules.test")
+    scanned = _count_scans(monkeypatch)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+    assert sorted(scanned) == ["app.py", "notes.md", "requirements.txt", "users.csv"]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_changed_since_trusts_cache_for_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _seed(tmp_path)
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed"], cwd=tmp_path, check=True)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+
+    (tmp_path / "app.py").write_text("import anthropic\n", encoding="utf-8")
+    (tmp_path / "new.py").write_text("import transformers\n", encoding="utf-8")
+    scanned = _count_scans(monkeypatch)
+    out = scan_repo(tmp_path, include_history=False, cache_path=cache, changed_since="HEAD")
+    assert sorted(scanned) == ["app.py", "new.py"]
+    assert out == scan_repo(tmp_path, include_history=False)
+
+    with pytest.raises(ValueError):
+        scan_repo(tmp_path, include_history=False, cache_path=cache, changed_since="no-such-ref")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_changed_since_still_checks_gitignored_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _seed(tmp_path)
+    (tmp_path / ".gitignore").write_text("models/\n", encoding="utf-8")
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "loader.py").write_text("print('hi')\n", encoding="utf-8")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed"], cwd=tmp_path, check=True)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+
+    (tmp_path / "models" / "loader.py").write_text("import anthropic\n", encoding="utf-8")
+    scanned = _count_scans(monkeypatch)
+    out = scan_repo(tmp_path, include_history=False, cache_path=cache, changed_since="HEAD")
+    assert scanned == ["models/loader.py"]
+    assert out == scan_repo(tmp_path, include_history=False)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_changed_since_does_not_trust_entries_from_another_commit(tmp_path: Path) -> None:
+    _seed(tmp_path)
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed"], cwd=tmp_path, check=True)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+
+    (tmp_path / "requirements.txt").write_text("requests==2.0\n", encoding="utf-8")
+    (tmp_path / "app.py").write_text("print('no llm')\n", encoding="utf-8")
+    subprocess.run([*git, "commit", "-q", "-am", "drop llm"], cwd=tmp_path, check=True)
+    out = scan_repo(tmp_path, include_history=False, cache_path=cache, changed_since="HEAD")
+    assert out == scan_repo(tmp_path, include_history=False)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_committed_cache_is_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _seed(tmp_path)
+    cache = default_cache_path(tmp_path)
+    scan_repo(tmp_path, include_history=False, cache_path=cache)
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "seed with cache"], cwd=tmp_path, check=True)
+
+    scanned = _count_scans(monkeypatch)
+    scan_repo(tmp_path, include_history=False, cache_path=cache, changed_since="HEAD")
+    assert sorted(scanned) == ["app.py", "notes.md", "requirements.txt", "users.csv"]
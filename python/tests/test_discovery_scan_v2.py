@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
 from pathlib import Path
 
-from aigov_py.discovery_scan import scan_repo
+import pytest
+
+from aigov_py import discovery_scan
+from aigov_py.cli import main
+from aigov_py.discovery_scan import _git_change_summary, scan_repo
 
 
 def test_scan_repo_v2_emits_required_fields(tmp_path: Path) -> None:
@@ -34,3 +40,93 @@ def test_findings_are_json_serializable(tmp_path: Path) -> None:
     out = scan_repo(tmp_path, include_history=False)
     json.dumps(out)  # must not raise
 
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=str(root),
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_batched_change_summary_matches_per_file_lookup(tmp_path: Path) -> None:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "svc").mkdir()
+    (tmp_path / "svc" / "a.py").write_text("import openai\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("anthropic\n", encoding="utf-8")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "first | with pipe")
+    (tmp_path / "svc" / "a.py").write_text("import openai\nOpenAI()\n", encoding="utf-8")
+    _git(tmp_path, "commit", "-q", "-am", "second")
+    (tmp_path / "untracked.onnx").write_bytes(b"\x00")
+
+    out = scan_repo(tmp_path / "svc", include_history=True)
+    assert out["findings"]
+    for f in out["findings"]:
+        assert f["change_summary"] == _git_change_summary(tmp_path / "svc", f["file_path"])
+
+    out = scan_repo(tmp_path, include_history=True)
+    by_path = {f["file_path"]: f["change_summary"] for f in out["findings"]}
+    assert by_path["untracked.onnx"] == {"commits": 0}
+    assert by_path["requirements.txt"]["last_commit"]["subject"] == "first | with pipe"
+    assert by_path[str(Path("svc") / "a.py")]["last_commit"]["subject"] == "second"
+    for rel, summary in by_path.items():
+        assert summary == _git_change_summary(tmp_path, rel)
+
+
+def test_large_text_files_are_scanned_in_windows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(discovery_scan, "SCAN_WINDOW_SIZE", 4096)
+    filler = "# generated client\n" * 60_000
+    assert len(filler) > discovery_scan.MAX_FILE_SIZE
+    # Signature straddles a window boundary.
+    head = filler[: 8192 + 4096 * 3 - 6]
+    (tmp_path / "client.py").write_text(head + "import anthropic\n" + filler, encoding="utf-8")
+    (tmp_path / "blob.dat").write_bytes(b"\x00" * 16 + b"import anthropic\n" * 70_000)
+
+    out = scan_repo(tmp_path, include_history=False)
+    assert out["llm_used"] is True
+    assert [f["file_path"] for f in out["findings"]] == ["client.py"]
+
+
+def test_sharded_scans_merge_into_full_scan(tmp_path: Path) -> None:
+    for i in range(12):
+        d = tmp_path / f"pkg{i % 3}"
+        d.mkdir(exist_ok=True)
+        (d / f"m{i}.py").write_text("import anthropic\n" if i % 2 else "useState(0)\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("openai\ntransformers\n", encoding="utf-8")
+    (tmp_path / "users.csv").write_text("email\n", encoding="utf-8")
+    (tmp_path / "model.safetensors").write_bytes(b"\x00")
+
+    full = scan_repo(tmp_path, include_history=False)
+    shards = [scan_repo(tmp_path, include_history=False, shard=(i, 3)) for i in (1, 2, 3)]
+    assert sum(len(s["findings"]) for s in shards) == len(full["findings"])
+    assert discovery_scan.merge_scans(list(reversed(shards))) == full
+
+    with pytest.raises(ValueError, match="missing shard"):
+        discovery_scan.merge_scans(shards[:2])
+    with pytest.raises(ValueError, match="more than once"):
+        discovery_scan.merge_scans([shards[0], *shards])
+
+
+def test_ndjson_stream_matches_scan_repo(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (tmp_path / "app.py").write_text("import openai\nuseState(0)\n", encoding="utf-8")
+    (tmp_path / "requirements.txt").write_text("transformers\n", encoding="utf-8")
+    (tmp_path / "model.onnx").write_bytes(b"")
+
+    full = scan_repo(tmp_path, include_history=False)
+    records = list(discovery_scan.iter_scan(tmp_path, include_history=False))
+    assert [r.pop("record") for r in records] == ["finding"] * len(full["findings"]) + ["summary"]
+    summary = records.pop()
+    assert records == full["findings"]
+    assert summary.pop("findings_count") == len(full["findings"])
+    assert summary == {k: v for k, v in full.items() if k != "findings"}
+
+    code = main(["discovery", "scan", "--path", str(tmp_path), "--no-history", "--no-cache", "--format", "ndjson"])
+    assert code == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["record"] for r in lines[:-1]] == ["finding"] * len(full["findings"])
+    assert lines[-1]["record"] == "summary"
+    assert lines[-1]["llm_used"] is True
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from aigov_py.discovery_scan import DETECTOR_RULES
+from aigov_py.discovery_signatures import SignatureMatcher, SignatureRule
+
+
+def test_matcher_reports_overlapping_and_prefix_literals() -> None:
+    m = SignatureMatcher(
+        [
+            SignatureRule("hub", ("from huggingface_hub",)),
+            SignatureRule("hf", ("from huggingface",)),
+            SignatureRule("django", ("from django",)),
+            SignatureRule("urls", ("django.urls",)),
+        ]
+    )
+    assert m.match("from huggingface_hub import x") == {"hub", "hf"}
+    assert m.match("from django.urls import path") == {"django", "urls"}
+    assert m.match("nothing here") == set()
+
+
+def test_matcher_case_sensitivity_follows_rule() -> None:
+    m = SignatureMatcher(
+        [
+            SignatureRule("exact", ("AutoModel",), case_sensitive=True),
+            SignatureRule("folded", ("Import Anthropic",)),
+        ]
+    )
+    assert m.match("automodel IMPORT ANTHROPIC") == {"folded"}
+    assert m.match("x = AutoModel.from_pretrained()") == {"exact"}
+
+
+def test_detector_rules_cover_code_signatures() -> None:
+    m = SignatureMatcher(DETECTOR_RULES)
+    text = "from openai import OpenAI\nimport sentence_transformers\nuseState(0)\n"
+    assert m.match(text) == {
+        "openai_sdk",
+        "ext_dep:openai",
+        "ext_dep:sentence-transformers",
+        "user_facing",
+    }
+
+
+def test_match_chunks_finds_literals_across_chunk_boundaries() -> None:
+    m = SignatureMatcher(DETECTOR_RULES)
+    text = "x" * 50 + "from openai import OpenAI\n" + "y" * 7 + "useEffect(" + "z" * 3
+    for size in (1, 2, 5, 13):
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        assert m.match_chunks(chunks) == m.match(text)
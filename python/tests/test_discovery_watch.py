@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from aigov_py.discovery_scan import scan_repo
+from aigov_py.discovery_watch import iter_watch
+
+
+def _flags(doc: dict) -> dict:
+    return {k: v for k, v in doc.items() if k not in ("schema_version", "root", "root_relative", "findings")}
+
+
+@pytest.mark.parametrize(
+    "poll",
+    [
+        True,
+        pytest.param(False, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")),
+    ],
+)
+def test_watch_reports_flag_changes_matching_scan_repo(tmp_path: Path, poll: bool) -> None:
+    (tmp_path / "app.py").write_text("useState(0)\n", encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+
+    stream = iter_watch(tmp_path, poll=poll, interval=0.01, timeout=5)
+    first = next(stream)
+    assert first["record"] == "summary"
+    assert first["llm_used"] is False
+    assert first["user_facing"] is True
+
+    (tmp_path / "node_modules" / "x.py").write_text("import openai\n", encoding="utf-8")
+    (tmp_path / "svc").mkdir()
+    (tmp_path / "svc" / "llm.py").write_text("import anthropic\n", encoding="utf-8")
+    change = next(stream)
+    assert change["record"] == "change"
+    assert change["changes"]["llm_used"] == {"from": False, "to": True}
+    assert "svc/llm.py" in [Path(f).as_posix() for f in change["files"]]
+    full = scan_repo(tmp_path, include_history=False)
+    assert change["summary"] == {**_flags(full), "findings_count": len(full["findings"])}
+
+    (tmp_path / "svc" / "llm.py").unlink()
+    change = next(stream)
+    assert change["changes"]["llm_used"] == {"from": True, "to": False}
+    stream.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import hashlib
 import json
+from dataclasses import fields as dataclass_fields
 from pathlib import Path
 
 from aigov_py.experiments import aggregate as agg_mod
@@ -13,7 +14,13 @@ from aigov_py.experiments import real_world_ci_runner as rwci_runner_mod
 from aigov_py.experiments import scenario_fields as sf_mod
 from aigov_py.experiments.gate_model import (
     FAILURE_TAXONOMY,
+    GATE_INPUT_BITS,
+    GateAblation,
+    compiled_gate_table,
+    decision_gate_verdict,
     decision_gate_verdict_from_fields,
+    gate_index_from_fields,
+    gate_inputs_from_index,
     expected_verdict_from_rubric,
     rubric_scenarios,
 )
@@ -47,6 +54,20 @@ def test_scenario_constructors_satisfy_rubric() -> None:
         assert got == str(row["expected_verdict"]), name
 
 
+def test_compiled_gate_matches_branchy_gate_for_every_input() -> None:
+    skips = [f.name for f in dataclass_fields(GateAblation)]
+    ablations = {GateAblation(), GateAblation(**{k: True for k in skips})}
+    ablations |= {GateAblation(**{k: True}) for k in skips}
+    ablations |= set(cfi_mod._ablation_presets().values())
+    inputs = [gate_inputs_from_index(i) for i in range(1 << len(GATE_INPUT_BITS))]
+    assert [gate_index_from_fields(x) for x in inputs] == list(range(len(inputs)))
+    for ablation in ablations:
+        for x in inputs:
+            want = decision_gate_verdict(**x, ablation=ablation)
+            assert decision_gate_verdict_from_fields(x, ablation=ablation) == want, (ablation, x)
+    assert set(compiled_gate_table()) == {0, 1, 2}
+
+
 def test_cfi_csv_json_structure(tmp_path: Path) -> None:
     paths = cfi_mod.write_outputs(tmp_path)
     assert "csv" in paths and "json" in paths
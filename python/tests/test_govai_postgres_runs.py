@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict
+
+import pytest
+
+from aigov_py import govai_postgres_runs
+from aigov_py.govai_postgres_runs import ConnectionPool, _dedupe_last, upsert_run_rows
+
+_TEST_DB_URL = os.environ.get("GOVAI_TEST_DATABASE_URL", "").strip()
+
+
+def _row(i: int, status: str = "valid") -> Dict[str, Any]:
+    return {
+        "id": f"run-{i}",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "mode": "ci",
+        "status": status,
+        "policy_version": "v1",
+        "bundle_sha256": f"{i:064x}",
+        "evidence_sha256": None,
+        "report_sha256": None,
+        "evidence_source": "ci_fallback",
+        "closed_at": "2026-01-01T00:00:01+00:00",
+        "environment": None,
+    }
+
+
+def test_dedupe_keeps_the_last_row_per_id() -> None:
+    rows = [_row(1), _row(2), _row(1, status="invalid")]
+    assert [(r["id"], r["status"]) for r in _dedupe_last(rows)] == [("run-2", "valid"), ("run-1", "invalid")]
+
+
+@pytest.mark.skipif(not _TEST_DB_URL, reason="set GOVAI_TEST_DATABASE_URL to a disposable Postgres")
+def test_upsert_run_rows_against_postgres(monkeypatch: pytest.MonkeyPatch) -> None:
+    psycopg = pytest.importorskip("psycopg")
+    monkeypatch.setattr(govai_postgres_runs, "COPY_MIN_ROWS", 60)
+    with psycopg.connect(_TEST_DB_URL, autocommit=True) as conn:
+        conn.execute("create schema if not exists console")
+        conn.execute("drop table if exists console.runs")
+        conn.execute(
+            """
+            create table console.runs (
+              id text primary key, created_at timestamptz not null, mode text, status text,
+              policy_version text, bundle_sha256 text, evidence_sha256 text, report_sha256 text,
+              evidence_source text, closed_at timestamptz, environment text not null default 'dev'
+            )
+            """
+        )
+
+    pool = ConnectionPool(_TEST_DB_URL)
+    try:
+        # 3 batches: two via COPY + merge, the tail via executemany; run-5 is updated twice.
+        rows = [_row(i) for i in range(250)] + [_row(5, status="invalid")]
+        assert upsert_run_rows(rows, batch_size=100, pool=pool) == 251
+        assert upsert_run_rows([_row(7, status="pending")], pool=pool) == 1
+    finally:
+        pool.close()
+
+    with psycopg.connect(_TEST_DB_URL) as conn:
+        assert conn.execute("select count(*) from console.runs").fetchone()[0] == 250
+        statuses = dict(conn.execute("select id, status from console.runs where id in ('run-5', 'run-7')").fetchall())
+        assert statuses == {"run-5": "invalid", "run-7": "pending"}
+        assert conn.execute("select distinct environment from console.runs").fetchall() == [("dev",)]
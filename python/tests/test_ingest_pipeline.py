@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from aigov_py.ingest_pipeline import IngestState, run_ingest_pipeline
+from aigov_py.storage_upload import LocalDirectoryBackend
+
+
+def _seed(root: Path, run_id: str, *, pack: bool = True) -> None:
+    for sub, name, body in (
+        ("audit", f"{run_id}.json", json.dumps({"bundle_sha256": "b" * 64, "policy_version": "v1"})),
+        ("evidence", f"{run_id}.json", json.dumps({"run_id": run_id})),
+        ("reports", f"{run_id}.md", f"# {run_id}\n"),
+        ("packs", f"{run_id}.zip", f"zip {run_id}"),
+    ):
+        if sub == "packs" and not pack:
+            continue
+        p = root / "docs" / sub / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(body, encoding="utf-8")
+
+
+def test_pipeline_batches_uploads_and_resumes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AIGOV_MODE", "ci")
+    ids = [f"r{i:02d}" for i in range(12)]
+    for rid in ids:
+        _seed(tmp_path, rid, pack=rid != "r05")
+    batches: List[List[Dict[str, Any]]] = []
+    backend = LocalDirectoryBackend(tmp_path / "remote")
+    kwargs: Dict[str, Any] = dict(
+        root=tmp_path,
+        upsert=batches.append,
+        backend=backend,
+        upload=True,
+        hash_workers=3,
+        upload_workers=2,
+        batch_size=5,
+        queue_size=2,
+        progress_out=io.StringIO(),
+    )
+
+    first = run_ingest_pipeline(ids + ["missing"], **kwargs)
+    assert (first["done"], first["failed"], first["skipped"]) == (11, 2, 0)
+    assert {(f["run_id"], f["stage"]) for f in first["failures"]} == {("missing", "hash"), ("r05", "upload")}
+    assert sorted(r["id"] for b in batches for r in b) == ids
+    assert all(len(b) <= 5 for b in batches)
+    assert (tmp_path / "remote" / "evidence" / "r07.json").exists()
+    assert set(IngestState(tmp_path / ".govai" / "ingest-state.jsonl").done) == set(ids) - {"r05"}
+
+    # Resume after fixing the broken run: only r05 (and the still-missing run) are retried.
+    (tmp_path / "docs" / "packs" / "r05.zip").write_text("zip r05", encoding="utf-8")
+    batches.clear()
+    second = run_ingest_pipeline(ids + ["missing"], **kwargs)
+    assert (second["done"], second["failed"], second["skipped"]) == (1, 1, 11)
+    assert [r["id"] for b in batches for r in b] == ["r05"]
+    assert "ingest: 13/13 (1 done, 11 unchanged, 1 failed)" in kwargs["progress_out"].getvalue()
+
+
+def test_upsert_failure_marks_the_batch_failed(tmp_path: Path) -> None:
+    for rid in ("a", "b"):
+        _seed(tmp_path, rid)
+
+    def boom(rows: List[Dict[str, Any]]) -> None:
+        raise RuntimeError("db down")
+
+    out = run_ingest_pipeline(["a", "b"], root=tmp_path, upsert=boom, upload=False, progress_out=io.StringIO())
+    assert out["failed"] == 2 and out["done"] == 0
+    assert {f["stage"] for f in out["failures"]} == {"upsert"}
+    assert IngestState(tmp_path / ".govai" / "ingest-state.jsonl").done == {}
+
+
+def test_reexported_runs_are_ingested_again(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AIGOV_MODE", "ci")
+    for rid in ("a", "b", "c"):
+        _seed(tmp_path, rid)
+    batches: List[List[Dict[str, Any]]] = []
+    kwargs: Dict[str, Any] = dict(root=tmp_path, upsert=batches.append, upload=False, progress_out=io.StringIO())
+    assert run_ingest_pipeline(["a", "b", "c"], **kwargs)["done"] == 3
+
+    (tmp_path / "docs" / "evidence" / "b.json").write_text(json.dumps({"run_id": "b", "v": 2}), encoding="utf-8")
+    pack = tmp_path / "docs" / "packs" / "c.zip"
+    pack.write_text("zip c, re-exported", encoding="utf-8")
+    batches.clear()
+    again = run_ingest_pipeline(["a", "b", "c"], **kwargs)
+    assert (again["done"], again["skipped"]) == (2, 1)
+    assert sorted(r["id"] for b in batches for r in b) == ["b", "c"]
+
+    batches.clear()
+    assert run_ingest_pipeline(["a", "b", "c"], **kwargs)["skipped"] == 3
+    assert run_ingest_pipeline(["a", "b", "c"], restart=True, **kwargs)["done"] == 3
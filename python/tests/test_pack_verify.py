@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from aigov_py import cli_exit
+from aigov_py.cli import main
+from aigov_py.evidence_pack import build_evidence_pack
+from aigov_py.pack_verify import verify_packs
+
+
+def _seed_packs(root: Path, run_ids: list[str]) -> Path:
+    for d in ("evidence", "reports", "audit"):
+        (root / "docs" / d).mkdir(parents=True, exist_ok=True)
+    for rid in run_ids:
+        evidence = {"run_id": rid, "policy_version": "v1", "events": []}
+        (root / "docs" / "evidence" / f"{rid}.json").write_text(json.dumps(evidence), encoding="utf-8")
+        (root / "docs" / "reports" / f"{rid}.md").write_text(f"# report {rid}\n", encoding="utf-8")
+        (root / "docs" / "audit" / f"{rid}.json").write_text(json.dumps({"run_id": rid}), encoding="utf-8")
+        build_evidence_pack(rid, root)
+    return root / "docs" / "packs"
+
+
+def test_verify_packs_directory_of_zips_and_staging_dirs(tmp_path: Path) -> None:
+    packs = _seed_packs(tmp_path, ["r1", "r2", "r3"])
+    with zipfile.ZipFile(packs / "audit-only.zip", "w") as zf:
+        zf.writestr("r9.json", "{}")
+
+    clean = verify_packs(packs, max_workers=4)
+    assert clean["ok"] and clean["packs"] == 6 and clean["files"] == 30
+    assert clean["skipped"] == [str(packs / "audit-only.zip")]
+
+    (packs / "r1" / "report.md").write_text("# tampered\n", encoding="utf-8")
+    (packs / "r2" / "extra.txt").write_text("x", encoding="utf-8")
+    src = packs / "r3.zip"
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(packs / "r3.tmp", "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info)
+            zout.writestr(info, data + b"\n" if info.filename == "bundle.json" else data)
+    (packs / "r3.tmp").replace(src)
+
+    out = verify_packs(packs, max_workers=4)
+    assert not out["ok"]
+    assert out["failed"] == [str(packs / "r1"), str(packs / "r2"), str(packs / "r3.zip")]
+    by_path = {r["path"]: r for r in out["results"]}
+    bad_r1 = [f for f in by_path[str(packs / "r1")]["files"] if not f["ok"]]
+    assert [(f["name"], f["error"]) for f in bad_r1] == [("report.md", "sha256 mismatch, byte count mismatch")]
+    assert by_path[str(packs / "r2")]["unlisted"] == ["extra.txt"]
+    bad_r3 = [f["name"] for f in by_path[str(packs / "r3.zip")]["files"] if not f["ok"]]
+    assert bad_r3 == ["bundle.json"]
+
+
+def test_pack_verify_cli_single_zip(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    packs = _seed_packs(tmp_path, ["r1"])
+    assert main(["pack", "verify", str(packs / "r1.zip")]) == cli_exit.EX_OK
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["schema_version"] == "aigov.pack_verify.v1" and doc["packs"] == 1
+    assert main(["pack", "verify", str(tmp_path / "missing")]) == cli_exit.EX_USAGE
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from aigov_py import export_bundle as export_bundle_mod
+from aigov_py.evidence_pack import build_evidence_pack
+from aigov_py.export_bundle import export_bundle
+from aigov_py.pack_writer import PackWriter
+
+
+def _sha(b: bytes) -> str:
+    return hashlib.sha256(b).hexdigest()
+
+
+def test_pack_writer_hashes_entries_and_archive_in_one_pass(tmp_path: Path) -> None:
+    src = tmp_path / "big.bin"
+    src.write_bytes(bytes(range(256)) * 20_000)
+    with PackWriter(tmp_path / "out.zip") as pack:
+        e = pack.add_file("data/big.bin", src, copy_to=tmp_path / "copy.bin")
+        pack.add_bytes("note.txt", b"hi\n")
+    digest = pack.close()
+
+    assert e == {"sha256": _sha(src.read_bytes()), "bytes": src.stat().st_size}
+    assert (tmp_path / "copy.bin").read_bytes() == src.read_bytes()
+    raw = (tmp_path / "out.zip").read_bytes()
+    assert digest == {"sha256": _sha(raw), "bytes": len(raw)}
+    with zipfile.ZipFile(tmp_path / "out.zip") as z:
+        assert z.testzip() is None
+        assert z.read("data/big.bin") == src.read_bytes()
+        assert z.read("note.txt") == b"hi\n"
+    assert not (tmp_path / "out.zip.tmp").exists()
+
+
+def test_pack_writer_failure_leaves_no_partial_archive(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        with PackWriter(tmp_path / "out.zip") as pack:
+            pack.add_file("missing", tmp_path / "missing")
+    assert list(tmp_path.iterdir()) == []
+
+
+def _seed_run(root: Path, run_id: str) -> None:
+    (root / "docs" / "evidence").mkdir(parents=True)
+    (root / "docs" / "reports").mkdir(parents=True)
+    evidence = {"run_id": run_id, "policy_version": "v1", "events": []}
+    (root / "docs" / "evidence" / f"{run_id}.json").write_text(json.dumps(evidence), encoding="utf-8")
+    (root / "docs" / "reports" / f"{run_id}.md").write_text("# report\n", encoding="utf-8")
+
+
+def test_export_bundle_then_evidence_pack(tmp_path: Path) -> None:
+    run_id = "r1"
+    _seed_run(tmp_path, run_id)
+    out = export_bundle(run_id, root=tmp_path)
+
+    evidence_raw = (tmp_path / "docs" / "evidence" / f"{run_id}.json").read_bytes()
+    assert out["hashes"] == {"evidence_sha256": _sha(evidence_raw), "report_sha256": _sha(b"# report\n")}
+    pack_path = tmp_path / "docs" / "packs" / f"{run_id}.zip"
+    assert out["pack_sha256"] == _sha(pack_path.read_bytes())
+    with zipfile.ZipFile(pack_path) as z:
+        assert z.namelist() == [f"evidence/{run_id}.json", f"reports/{run_id}.md", f"audit/{run_id}.json"]
+        assert z.read(f"audit/{run_id}.json") == (tmp_path / "docs" / "audit" / f"{run_id}.json").read_bytes()
+
+    res = build_evidence_pack(run_id, tmp_path)
+    assert res["sha256"] == _sha(pack_path.read_bytes())
+    staging = tmp_path / "docs" / "packs" / run_id
+    for f in res["manifest"]["files"]:
+        assert f["sha256"] == _sha((staging / f["name"]).read_bytes())
+    with zipfile.ZipFile(pack_path) as z:
+        assert json.loads(z.read("manifest.json")) == res["manifest"]
+
+
+def test_packs_are_byte_identical_regardless_of_source_mtimes(tmp_path: Path) -> None:
+    src = tmp_path / "in.txt"
+    src.write_text("same content\n", encoding="utf-8")
+    with PackWriter(tmp_path / "a.zip") as pack:
+        pack.add_file("in.txt", src)
+    os.utime(src, (1_000_000_000, 1_000_000_000))
+    src.chmod(0o600)
+    with PackWriter(tmp_path / "b.zip") as pack:
+        pack.add_file("in.txt", src)
+    assert (tmp_path / "a.zip").read_bytes() == (tmp_path / "b.zip").read_bytes()
+
+
+def test_export_bundle_reuses_unchanged_pack(tmp_path: Path) -> None:
+    run_id = "r2"
+    _seed_run(tmp_path, run_id)
+    first = export_bundle(run_id, root=tmp_path)
+    assert first["pack_reused"] is False
+    pack_path = tmp_path / "docs" / "packs" / f"{run_id}.zip"
+    audit_path = tmp_path / "docs" / "audit" / f"{run_id}.json"
+    pack_bytes = pack_path.read_bytes()
+    audit_bytes = audit_path.read_bytes()
+    pack_mtime = pack_path.stat().st_mtime_ns
+
+    again = export_bundle(run_id, root=tmp_path)
+    assert again["pack_reused"] is True
+    assert again["pack_sha256"] == first["pack_sha256"]
+    assert pack_path.stat().st_mtime_ns == pack_mtime
+    assert audit_path.read_bytes() == audit_bytes
+
+    # A lost pack is rebuilt byte for byte from the unchanged inputs.
+    pack_path.unlink()
+    rebuilt = export_bundle(run_id, root=tmp_path)
+    assert rebuilt["pack_reused"] is False
+    assert pack_path.read_bytes() == pack_bytes
+
+    (tmp_path / "docs" / "reports" / f"{run_id}.md").write_text("# report v2\n", encoding="utf-8")
+    changed = export_bundle(run_id, root=tmp_path)
+    assert changed["pack_reused"] is False
+    assert changed["hashes"]["report_sha256"] == _sha(b"# report v2\n")
+    assert changed["pack_sha256"] == _sha(pack_path.read_bytes()) != first["pack_sha256"]
+
+    assert build_evidence_pack(run_id, tmp_path)["reused"] is False
+    assert build_evidence_pack(run_id, tmp_path)["reused"] is True
+
+
+def test_bulk_export_writes_index_and_reports_failures(tmp_path: Path) -> None:
+    _seed_run(tmp_path, "a1")
+    for rid in ("a2", "a3"):
+        (tmp_path / "docs" / "evidence" / f"{rid}.json").write_text(json.dumps({"run_id": rid}), encoding="utf-8")
+        (tmp_path / "docs" / "reports" / f"{rid}.md").write_text(f"# {rid}\n", encoding="utf-8")
+    (tmp_path / "docs" / "evidence" / "broken.json").write_text("{}", encoding="utf-8")  # no report
+
+    ids = export_bundle_mod.list_run_ids(tmp_path)
+    assert ids == ["a1", "a2", "a3", "broken"]
+    summary = export_bundle_mod.export_bundles(ids, root=tmp_path, max_workers=2, max_in_flight_bytes=1)
+    assert (summary["exported"], summary["failed"]) == (3, 1)
+    assert summary["errors"][0]["run_id"] == "broken"
+    assert "Missing report file" in summary["errors"][0]["error"]
+
+    index = json.loads((tmp_path / "docs" / "packs" / "index.json").read_text(encoding="utf-8"))
+    assert [p["run_id"] for p in index["packs"]] == ["a1", "a2", "a3"]
+    for p in index["packs"]:
+        assert p["pack_sha256"] == _sha((tmp_path / p["pack"]).read_bytes())
+        audit = json.loads((tmp_path / "docs" / "audit" / f"{p['run_id']}.json").read_text(encoding="utf-8"))
+        assert p["bundle_sha256"] == audit["bundle_sha256"]
+
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("a2\n# comment\n\na2\na3\n", encoding="utf-8")
+    again = export_bundle_mod.export_bundles(
+        export_bundle_mod.read_run_ids_file(ids_file), root=tmp_path, max_workers=1
+    )
+    assert (again["exported"], again["reused"], again["failed"]) == (2, 2, 0)
+
+
+def test_evidence_pack_aborts_when_an_input_changes_between_reads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from aigov_py import evidence_pack
+
+    run_id = "r3"
+    _seed_run(tmp_path, run_id)
+    export_bundle(run_id, root=tmp_path)
+    pack_path = tmp_path / "docs" / "packs" / f"{run_id}.zip"
+    pack_bytes = pack_path.read_bytes()
+    report_path = tmp_path / "docs" / "reports" / f"{run_id}.md"
+    real = evidence_pack.sha256_path
+
+    def first_read_then_edit(path: Path) -> str:
+        digest = real(path)
+        if path == report_path:
+            path.write_text("# edited after hashing\n", encoding="utf-8")
+        return digest
+
+    monkeypatch.setattr(evidence_pack, "sha256_path", first_read_then_edit)
+    with pytest.raises(SystemExit, match="report.md changed"):
+        build_evidence_pack(run_id, tmp_path)
+    assert pack_path.read_bytes() == pack_bytes
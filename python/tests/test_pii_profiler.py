@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from aigov_py import pii_profiler
+from aigov_py.cli import main
+from aigov_py.pii_profiler import classify_values, profile_file, profile_paths
+
+
+def test_classify_values_shapes() -> None:
+    values = [
+        "alice@example.com",
+        "a@b",
+        "+420 777 123 456",
+        "(555) 123-4567",
+        "123456789",
+        "078-05-1120",
+        "855315/1234",
+        "12.5",
+    ]
+    got = classify_values(values)
+    flagged = {v: sorted(k for k, hits in got.items() if hits[i]) for i, v in enumerate(values)}
+    assert flagged == {
+        "alice@example.com": ["email"],
+        "a@b": [],
+        "+420 777 123 456": ["phone"],
+        "(555) 123-4567": ["phone"],
+        "123456789": [],
+        "078-05-1120": ["us_ssn"],
+        "855315/1234": ["national_id"],
+        "12.5": [],
+    }
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    lines = ["c1,c2,score"]
+    lines += [f"user{i}@corp.example,+1 555 010 {i % 10000:04d},{i / 7:.3f}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_profile_file_reports_columns_with_cryptic_names(tmp_path: Path) -> None:
+    p = tmp_path / "t.csv"
+    _write_csv(p, 500)
+    out = profile_file(p, "t.csv", sample_rows=100)
+    assert out["pii_possible"] is True
+    assert out["rows_sampled"] == 100
+    by_name = {c["name"]: c for c in out["columns"]}
+    assert by_name["c1"]["pii_types"] == ["email"]
+    assert by_name["c2"]["pii_types"] == ["phone"]
+    assert by_name["score"]["pii_possible"] is False
+
+
+def test_large_csv_is_sampled_across_the_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pii_profiler, "_HEAD_SAMPLE_BYTES", 1024)
+    p = tmp_path / "big.csv"
+    # Emails only appear in the second half of the file.
+    lines = ["k,v"] + [f"{i},n/a" for i in range(5000)] + [f"{i},x{i}@corp.example" for i in range(5000)]
+    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out = profile_file(p, "big.csv", sample_rows=400)
+    assert out["rows_sampled"] <= 400
+    assert out["columns"][1]["matches"]["email"] > 0
+
+
+def test_profile_paths_parallel_and_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for i in range(3):
+        _write_csv(tmp_path / f"d{i}.csv", 50)
+    (tmp_path / "notes.txt").write_text("x@y.example\n", encoding="utf-8")
+    files = profile_paths(tmp_path, max_workers=2)
+    assert [f["file_path"] for f in files] == ["d0.csv", "d1.csv", "d2.csv"]
+    assert all(f["pii_possible"] for f in files)
+
+    assert main(["--compact-json", "discovery", "pii", "--path", str(tmp_path), "--workers", "1"]) == 0
+    doc = json.loads(capsys.readouterr().out)
+    assert len(doc["pii_profile"]["files"]) == 3
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from aigov_py import cli_exit, policy_loader
+from aigov_py.cli import main
+from aigov_py.policy_batch_eval import EvidenceCodebook, evaluate_runs, failing_requirements, requirement_masks
+from aigov_py.policy_loader import PolicyIdentity, PolicyModule, PolicyRequirement
+
+
+def _policy(n_codes: int, n_reqs: int, rng: random.Random) -> PolicyModule:
+    codes = [f"ev_{i:03d}" for i in range(n_codes)]
+    reqs = tuple(
+        PolicyRequirement(code=f"R{j}", required_evidence=tuple(rng.sample(codes, rng.randint(1, 4))))
+        for j in range(n_reqs)
+    )
+    return PolicyModule(policy=PolicyIdentity(id="p", name="P", version="1"), requirements=reqs)
+
+
+def test_bitset_evaluation_matches_per_run_set_checks() -> None:
+    rng = random.Random(7)
+    policy = _policy(150, 40, rng)
+    codes = sorted({c for r in policy.requirements for c in r.required_evidence}) + ["not_in_policy"]
+    run_ids = [f"run-{i}" for i in range(500)]
+    evidence = [set(rng.sample(codes, rng.randint(0, len(codes)))) for _ in run_ids]
+
+    result = evaluate_runs(policy, run_ids, evidence)
+    assert result.codebook.words >= 2
+
+    for i, req in enumerate(policy.requirements):
+        expected = [rid for rid, ev in zip(run_ids, evidence) if not set(req.required_evidence) <= ev]
+        assert result.affected_runs(i) == expected
+        assert result.failure_counts()[i] == len(expected)
+    required = {c for r in policy.requirements for c in r.required_evidence}
+    assert result.missing_evidence(3) == sorted(required - evidence[3])
+    assert result.summary()["blocked"] == sum(1 for ev in evidence if not required <= ev)
+
+    # A budget of a few rows per step gives the same answer as one step.
+    masks = requirement_masks(policy, result.codebook)
+    tiny = failing_requirements(result.present, masks, chunk_bytes=masks.nbytes * 3)
+    assert (tiny == result.failing).all()
+
+
+def test_requirements_sharing_a_code_are_reported_separately() -> None:
+    reqs = (
+        PolicyRequirement(code="R1", required_evidence=("a",)),
+        PolicyRequirement(code="R1", required_evidence=("b",)),
+    )
+    policy = PolicyModule(policy=PolicyIdentity(id="p", name="P", version="1"), requirements=reqs)
+    result = evaluate_runs(policy, ["x", "y"], [{"a"}, {"b"}])
+    assert result.failure_counts() == [1, 1]
+    assert [(r["code"], r["required_evidence"], r["runs"]) for r in result.summary()["requirements"]] == [
+        ("R1", ["a"], ["y"]),
+        ("R1", ["b"], ["x"]),
+    ]
+
+
+def test_codebook_round_trips_high_bits() -> None:
+    book = EvidenceCodebook(f"c{i:03d}" for i in range(130))
+    assert book.decode(book.mask(["c000", "c063", "c064", "c129"])) == ["c000", "c063", "c064", "c129"]
+
+
+def test_cli_policy_evaluate_reports_blocked_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("GOVAI_POLICY_CACHE_DIR", str(tmp_path / "policy-cache"))
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+    policy = tmp_path / "p.yaml"
+    policy.write_text(
+        "policy: {id: p, name: P, version: '1'}\n"
+        "requirements:\n"
+        "  - {code: EVAL, required_evidence: [evaluation_reported]}\n"
+        "  - {code: HUMAN, required_evidence: [human_approved, risk_reviewed]}\n",
+        encoding="utf-8",
+    )
+    evidence_dir = tmp_path / "docs" / "evidence"
+    evidence_dir.mkdir(parents=True)
+    runs = {
+        "a": ["evaluation_reported", "human_approved", "risk_reviewed"],
+        "b": ["evaluation_reported", "human_approved"],
+        "c": [],
+    }
+    for rid, types in runs.items():
+        bundle = {"events": [{"event_id": f"{rid}{i}", "event_type": t} for i, t in enumerate(types)]}
+        (evidence_dir / f"{rid}.json").write_text(json.dumps(bundle), encoding="utf-8")
+
+    code = main(["policy", "evaluate", "--path", str(policy), "--all", "--root", str(tmp_path)])
+    assert code == cli_exit.EX_OK
+    doc = json.loads(capsys.readouterr().out)
+    assert (doc["runs"], doc["blocked"], doc["blocked_runs"]) == (3, 2, ["b", "c"])
+    assert {r["code"]: (r["failing"], r["runs"]) for r in doc["requirements"]} == {
+        "EVAL": (1, ["c"]),
+        "HUMAN": (2, ["b", "c"]),
+    }
+    assert main(["policy", "evaluate", "--path", str(policy)]) == cli_exit.EX_USAGE
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aigov_py import cli_exit, policy_loader
+from aigov_py.cli import main
+from aigov_py.policy_impact import build_ledger_index, default_ledger_index_path, policy_impact
+
+_LINK = {
+    "assessment_id": "a1",
+    "risk_id": "r1",
+    "dataset_governance_commitment": "c1",
+    "ai_system_id": "s1",
+    "dataset_id": "d1",
+    "model_version_id": "m1",
+}
+
+
+def _records(run_id: str, *, risk_review: bool = True, passed: bool = True) -> list[dict[str, Any]]:
+    events: list[tuple[str, dict[str, Any]]] = [
+        ("data_registered", dict(_LINK)),
+        ("model_trained", dict(_LINK)),
+        ("evaluation_reported", {**_LINK, "passed": passed}),
+    ]
+    if risk_review:
+        events.append(("risk_reviewed", {**_LINK, "decision": "approve"}))
+    events.append(("human_approved", {**_LINK, "decision": "approve", "approver": "compliance_officer"}))
+    approval_id = f"{run_id}-{len(events) - 1}"
+    events.append(
+        (
+            "model_promoted",
+            {**_LINK, "artifact_path": "m.bin", "promotion_reason": "ok", "approved_human_event_id": approval_id},
+        )
+    )
+    return [
+        {"event_id": f"{run_id}-{i}", "event_type": t, "run_id": run_id, "payload": p}
+        for i, (t, p) in enumerate(events)
+    ]
+
+
+def _append(ledger: Path, events: list[dict[str, Any]]) -> None:
+    with ledger.open("a", encoding="utf-8") as f:
+        for ev in events:
+            f.write(json.dumps({"prev_hash": "x", "record_hash": ev["event_id"], "event_json": json.dumps(ev)}) + "\n")
+
+
+def _policies(tmp_path: Path) -> tuple[Path, Path]:
+    gates = (
+        "require_approval",
+        "block_if_missing_evidence",
+        "require_passed_evaluation_for_promotion",
+        "require_risk_review_for_approval",
+        "require_risk_review_for_promotion",
+        "enforce_approver_allowlist",
+    )
+    off = {k: False for k in gates}
+    old = tmp_path / "policy.dev.json"
+    old.write_text(json.dumps(off), encoding="utf-8")
+    new = tmp_path / "policy.prod.json"
+    # Missing keys take the server defaults (all gates on).
+    new.write_text(json.dumps({"block_if_missing_evidence": True}), encoding="utf-8")
+    return old, new
+
+
+def test_policy_impact_reports_runs_that_become_blocked(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AIGOV_APPROVER_ALLOWLIST", raising=False)
+    old, new = _policies(tmp_path)
+    ledger = tmp_path / "audit_log.jsonl"
+    _append(ledger, _records("ok") + _records("no-review", risk_review=False) + _records("failed-eval", passed=False))
+
+    out = policy_impact(old, new, ledger)
+    assert (out["runs"], out["changed"], out["transitions"]) == (3, 2, {"VALID->BLOCKED": 2})
+    reasons = {c["run_id"]: c["new"]["reasons"] for c in out["changes"]}
+    assert reasons == {
+        "failed-eval": ["missing_passed_evaluation_for_promotion"],
+        "no-review": ["missing_risk_review_for_approval", "missing_risk_review_for_promotion"],
+    }
+
+
+def test_approver_is_trimmed_like_the_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AIGOV_APPROVER_ALLOWLIST", raising=False)
+    old, new = _policies(tmp_path)
+    ledger = tmp_path / "audit_log.jsonl"
+    events = _records("padded")
+    for ev in events:
+        if ev["event_type"] == "human_approved":
+            ev["payload"]["approver"] = " compliance_officer "
+    _append(ledger, events)
+
+    assert policy_impact(old, new, ledger)["changed"] == 0
+
+
+def test_default_ledger_index_is_per_ledger_in_the_user_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOVAI_LEDGER_INDEX_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    a = default_ledger_index_path(tmp_path / "a.jsonl")
+    assert a.parent == tmp_path / "cache" / "govai" / "ledger-index"
+    assert a != default_ledger_index_path(tmp_path / "b.jsonl")
+    monkeypatch.setenv("GOVAI_LEDGER_INDEX_DIR", str(tmp_path / "idx"))
+    assert default_ledger_index_path(tmp_path / "a.jsonl").parent == tmp_path / "idx"
+
+
+def test_ledger_index_is_resumed_after_appends(tmp_path: Path) -> None:
+    ledger = tmp_path / "audit_log.jsonl"
+    index_path = tmp_path / "index.json"
+    _append(ledger, [e for i in range(20) for e in _records(f"run-{i}")])
+    first, stats = build_ledger_index(ledger, index_path=index_path, max_workers=2, chunk_bytes=1500)
+    assert stats["reused_runs"] == 0 and len(first.runs) == 20
+
+    size = ledger.stat().st_size
+    _append(ledger, _records("run-20") + _records("run-3", risk_review=False))
+    again, stats = build_ledger_index(ledger, index_path=index_path, max_workers=2, chunk_bytes=1500)
+    assert stats == {"scanned_bytes": ledger.stat().st_size - size, "reused_runs": 20}
+
+    full, _ = build_ledger_index(ledger, max_workers=1)
+    assert again.runs == full.runs and len(full.runs) == 21
+
+
+def test_cli_policy_impact_against_policy_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("GOVAI_POLICY_CACHE_DIR", str(tmp_path / "policy-cache"))
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+    old, _ = _policies(tmp_path)
+    module = tmp_path / "module.yaml"
+    module.write_text(
+        "policy: {id: p, name: P, version: '1'}\n"
+        "requirements:\n"
+        "  - {code: RISK, required_evidence: [risk_reviewed]}\n",
+        encoding="utf-8",
+    )
+    ledger = tmp_path / "audit_log.jsonl"
+    _append(ledger, _records("ok") + _records("no-review", risk_review=False))
+
+    argv = ["policy", "impact", "--old", str(old), "--new", str(module), "--ledger", str(ledger)]
+    code = main([*argv, "--index", str(tmp_path / "idx.json")])
+    assert code == cli_exit.EX_OK
+    doc = json.loads(capsys.readouterr().out)
+    assert doc["new_policy"]["id"] == "p"
+    assert [(c["run_id"], c["new"]["reasons"]) for c in doc["changes"]] == [("no-review", ["RISK"])]
+    assert main([*argv[:-1], str(tmp_path / "missing.jsonl"), "--no-index"]) == cli_exit.EX_USAGE
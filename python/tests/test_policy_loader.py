@@ -5,11 +5,17 @@ from pathlib import Path
 
 import pytest
 
-from aigov_py import cli_exit
+from aigov_py import cli_exit, policy_loader
 from aigov_py.cli import main
 from aigov_py.policy_loader import load_policy_module, policy_identity, required_evidence_from_policy
 
 
+@pytest.fixture(autouse=True)
+def _isolated_policy_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GOVAI_POLICY_CACHE_DIR", str(tmp_path / "policy-cache"))
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -127,3 +133,56 @@ def test_cli_policy_compile_json_prints_valid_json(capsys: pytest.CaptureFixture
     assert obj["policy"]["version"] == "2026-05-01"
     assert isinstance(obj["required_evidence"], list)
     assert obj["required_evidence"] == sorted(obj["required_evidence"])
+
+
+def test_compiled_policy_cache_skips_yaml_until_file_or_loader_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = _repo_root() / "docs" / "policies" / "ai-act-high-risk.example.yaml"
+    y = tmp_path / "p.yaml"
+    y.write_bytes(src.read_bytes())
+    cache = tmp_path / "cache"
+    parsed = load_policy_module(y, cache_dir=cache)
+    assert len(list(cache.glob("*.json"))) == 1
+
+    def no_yaml(*_a: object, **_k: object) -> None:
+        raise AssertionError("YAML parsed despite a cached module")
+
+    monkeypatch.setattr(policy_loader.yaml, "load", no_yaml)
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+    assert load_policy_module(y, cache_dir=cache) == parsed
+
+    monkeypatch.undo()
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+    monkeypatch.setattr(policy_loader, "POLICY_LOADER_VERSION", "aigov.policy_loader.test")
+    calls: list[int] = []
+    real_load = policy_loader.yaml.load
+    monkeypatch.setattr(policy_loader.yaml, "load", lambda *a, **k: calls.append(1) or real_load(*a, **k))
+    assert load_policy_module(y, cache_dir=cache) == parsed
+    y.write_text(src.read_text(encoding="utf-8").replace("0.1.0", "0.2.0"), encoding="utf-8")
+    assert policy_identity(load_policy_module(y, cache_dir=cache))["version"] == "0.2.0"
+    assert len(calls) == 2
+
+
+def test_invalid_cache_entry_is_reparsed_and_default_cache_is_per_user(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    y = tmp_path / "p.yaml"
+    y.write_text(
+        "policy: {id: p, name: P, version: '1'}\n"
+        "requirements:\n"
+        "  - {code: EVAL, required_evidence: [evaluation_reported]}\n",
+        encoding="utf-8",
+    )
+    cache = tmp_path / "cache"
+    parsed = load_policy_module(y, cache_dir=cache)
+    [entry] = cache.glob("*.json")
+    doc = json.loads(entry.read_text(encoding="utf-8"))
+    doc["module"]["requirements"] = []
+    entry.write_text(json.dumps(doc), encoding="utf-8")
+    monkeypatch.setattr(policy_loader, "_MEMO", {})
+    assert load_policy_module(y, cache_dir=cache) == parsed
+
+    monkeypatch.delenv("GOVAI_POLICY_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert policy_loader.default_policy_cache_dir() == tmp_path / "xdg" / "govai" / "policy-cache"
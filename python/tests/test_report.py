@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+from aigov_py.report import EventIndex, _events, embedded_bundle_sha256, render_report, render_reports
+
+
+def _event(i: int, event_type: str, **payload: Any) -> Dict[str, Any]:
+    return {
+        "event_id": f"e{i}",
+        "event_type": event_type,
+        "ts_utc": f"2026-01-01T00:00:{i:02d}Z",
+        "actor": "ci",
+        "system": "aigov",
+        "run_id": "r",
+        "payload": payload,
+    }
+
+
+def _bundle(rid: str, sha: str) -> Dict[str, Any]:
+    return {
+        "run_id": rid,
+        "bundle_sha256": sha,
+        "policy_version": "v0.4_human_approval",
+        "events": [
+            _event(1, "run_started"),
+            _event(2, "evaluation_reported", metric="accuracy", value=0.9, threshold=0.8, passed=True),
+            _event(3, "human_approved", scope="model_promoted", decision="approve", approver="alice"),
+            _event(4, "human_approved", scope="model_promoted", decision="reject", approver="bob"),
+        ],
+    }
+
+
+def test_event_index_keeps_last_event_per_type_and_scope() -> None:
+    bundle = _bundle("r", "x")
+    bundle["events"].append(_event(5, "human_approved", scope="deploy", decision="approve", approver="carol"))
+    index = EventIndex(_events(bundle))
+    assert index.last("human_approved").event_id == "e5"
+    assert index.last_in_scope("human_approved", "model_promoted").payload["approver"] == "bob"
+    assert index.scopes("human_approved") == ["deploy", "model_promoted"]
+    assert index.last("model_promoted") is None
+
+
+def test_report_shows_the_promotion_approval_not_a_later_other_scope_one() -> None:
+    bundle = _bundle("r", "x")
+    bundle["events"].append(_event(5, "human_approved", scope="deploy", decision="approve", approver="carol"))
+    md = render_report("r", bundle, "x")
+    assert "| `model_promoted` | `reject` | `bob` |" in md
+    assert "carol" not in md
+
+
+def test_render_reports_skips_reports_with_current_bundle_sha(tmp_path: Path) -> None:
+    evidence = tmp_path / "docs" / "evidence"
+    evidence.mkdir(parents=True)
+    ids = [f"run-{i}" for i in range(4)]
+    for i, rid in enumerate(ids):
+        (evidence / f"{rid}.json").write_text(json.dumps(_bundle(rid, f"{i:064x}")), encoding="utf-8")
+    (evidence / "run-9.json").write_text("{not json", encoding="utf-8")
+
+    first = render_reports(ids + ["run-9"], root=tmp_path, max_workers=2)
+    assert (first["rendered"], first["skipped"], first["failed"]) == (4, 0, 1)
+    assert [e["run_id"] for e in first["errors"]] == ["run-9"]
+    report = tmp_path / "docs" / "reports" / "run-0.md"
+    assert embedded_bundle_sha256(report) == f"{0:064x}"
+    assert "| `model_promoted` | `reject` | `bob` |" in report.read_text(encoding="utf-8")
+
+    (evidence / "run-1.json").write_text(json.dumps(_bundle("run-1", "f" * 64)), encoding="utf-8")
+    again = render_reports(ids, root=tmp_path, max_workers=2)
+    assert (again["rendered"], again["skipped"]) == (1, 3)
+    assert embedded_bundle_sha256(tmp_path / "docs" / "reports" / "run-1.md") == "f" * 64
+
+    forced = render_reports(ids, root=tmp_path, max_workers=1, force=True)
+    assert (forced["rendered"], forced["skipped"]) == (4, 0)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from aigov_py.runs_parity import Keyset, bucket_key_fn, compare_runs, parse_ts, prefix_bounds
+
+
+class _ListSource:
+    """In-memory RunsSource; counts rows handed out to check what gets re-read."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        dated = [r for r in rows if r["created_at"] is not None]
+        self.rows = sorted(dated, key=lambda r: (parse_ts(r["created_at"]), r["id"]))
+        self.nulls = sorted((r for r in rows if r["created_at"] is None), key=lambda r: r["id"])
+        self.bucket_reads: List[str] = []
+
+    def page(self, after: Optional[Keyset], limit: int) -> List[Dict[str, Any]]:
+        if after is None:
+            return self.rows[:limit]
+        key = (parse_ts(after[0]), after[1])
+        return [r for r in self.rows if (parse_ts(r["created_at"]), r["id"]) > key][:limit]
+
+    def null_page(self, after_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        return [r for r in self.nulls if after_id is None or r["id"] > after_id][:limit]
+
+    def bucket_rows(self, mode: str, bucket: str, limit: int) -> Iterator[Dict[str, Any]]:
+        self.bucket_reads.append(bucket)
+        if mode == "prefix":
+            # Same id range as the database sources, so it includes longer ids too.
+            lo, hi = prefix_bounds(bucket)
+            yield from (r for r in self.rows + self.nulls if r["id"] >= lo and (hi is None or r["id"] < hi))
+            return
+        key = bucket_key_fn(mode)
+        yield from (r for r in self.rows + self.nulls if key(r) == bucket)
+
+
+def _rows(n: int) -> List[Dict[str, Any]]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": f"{i:04x}",
+            "created_at": (start + timedelta(hours=7 * i)).isoformat(),
+            "status": "valid",
+            "bundle_sha256": f"b{i}",
+            "environment": "dev",
+        }
+        for i in range(n)
+    ]
+
+
+def test_identical_tables_read_no_bucket_twice() -> None:
+    src = _ListSource(_rows(300))
+    # Same rows, target returns datetimes (psycopg) instead of strings (PostgREST).
+    tgt = _ListSource([{**r, "created_at": parse_ts(r["created_at"])} for r in _rows(300)])
+    report = compare_runs(src, tgt, page_size=17)
+    assert report.ok and report.source_rows == report.target_rows == 300
+    assert src.bucket_reads == [] and tgt.bucket_reads == []
+
+
+@pytest.mark.parametrize("bucket", ["day", "prefix"])
+def test_only_mismatching_buckets_are_diffed(bucket: str) -> None:
+    rows = _rows(300)
+    target = [dict(r) for r in rows if r["id"] != "0010"]
+    target[50]["status"] = "invalid"
+    target.append({**rows[0], "id": "ffff"})
+    src, tgt = _ListSource(rows), _ListSource(target)
+
+    report = compare_runs(src, tgt, bucket=bucket, prefix_len=3, page_size=32)
+    assert not report.ok
+    assert report.missing_in_target == ["0010"]
+    assert report.extra_in_target == ["ffff"]
+    assert report.field_mismatch == {target[50]["id"]: ["status"]}
+    assert len(report.mismatched_buckets) <= 3 < report.buckets
+    assert sorted(src.bucket_reads) == report.mismatched_buckets
+
+
+def test_rows_without_created_at_are_compared() -> None:
+    rows = _rows(40) + [{"id": f"n{i:03d}", "created_at": None, "status": "valid"} for i in range(25)]
+    target = [dict(r) for r in rows if r["id"] != "n007"]
+    target[-1]["status"] = "invalid"
+    src, tgt = _ListSource(rows), _ListSource(target)
+
+    report = compare_runs(src, tgt, page_size=10)
+    assert (report.source_rows, report.target_rows) == (65, 64)
+    assert report.mismatched_buckets == ["none"]
+    assert report.missing_in_target == ["n007"]
+    assert report.field_mismatch == {"n024": ["status"]}
+
+
+def test_short_id_bucket_does_not_claim_longer_ids() -> None:
+    rows = [{"id": i, "created_at": "2026-01-01T00:00:00+00:00", "status": "valid"} for i in ("a", "ab1", "ab2")]
+    target = [{**rows[0], "status": "invalid"}, rows[2]]
+    report = compare_runs(_ListSource(rows), _ListSource(target), bucket="prefix", prefix_len=2)
+    assert report.missing_in_target == ["ab1"]
+    assert report.field_mismatch == {"a": ["status"]}
+    assert report.extra_in_target == []
+
+
+def test_prefix_bounds() -> None:
+    assert prefix_bounds("0a") == ("0a", "0b")
+    assert prefix_bounds("f") == ("f", "g")
+    assert prefix_bounds("a\U0010ffff") == ("a\U0010ffff", "b")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any
+
+from aigov_py.storage_upload import (
+    LocalDirectoryBackend,
+    SupabaseStorageBackend,
+    UploadManifest,
+    run_upload_items,
+    upload_artifacts,
+    upload_artifacts_for_run,
+    upload_file_path,
+)
+
+
+def _run_files(root: Path, run_id: str) -> dict[str, Path]:
+    paths = {
+        "pack_zip": root / "packs" / f"{run_id}.zip",
+        "audit_json": root / "audit" / f"{run_id}.json",
+        "evidence_json": root / "evidence" / f"{run_id}.json",
+    }
+    for name, p in paths.items():
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(f"{run_id}:{name}".encode("utf-8"))
+    return paths
+
+
+def test_uploads_skip_unchanged_objects(tmp_path: Path) -> None:
+    backend = LocalDirectoryBackend(tmp_path / "remote")
+    manifest_path = tmp_path / "manifest.json"
+    items = []
+    for rid in ("r1", "r2", "r3"):
+        items += run_upload_items(rid, **_run_files(tmp_path / "docs", rid))
+
+    first = upload_artifacts(backend, items, manifest=UploadManifest(manifest_path), max_workers=3)
+    assert [r.object_name for r in first] == [it.object_name for it in items]
+    assert all(r.ok and not r.skipped for r in first)
+    assert (tmp_path / "remote" / "packs" / "r2.zip").read_bytes() == b"r2:pack_zip"
+
+    (tmp_path / "docs" / "audit" / "r2.json").write_bytes(b"changed")
+    second = upload_artifacts(backend, items, manifest=UploadManifest(manifest_path), max_workers=3)
+    uploaded = [(r.bucket, r.object_name) for r in second if not r.skipped]
+    assert uploaded == [("audit", "r2.json")]
+    assert (tmp_path / "remote" / "audit" / "r2.json").read_bytes() == b"changed"
+
+    # Without a local manifest, the backend's remote hashes still avoid re-uploads.
+    third = upload_artifacts(backend, items, manifest=UploadManifest(tmp_path / "fresh.json"))
+    assert all(r.skipped for r in third)
+    assert (tmp_path / "fresh.json").exists()
+
+
+def test_manifest_hit_for_a_deleted_object_uploads_again_and_force_uploads_all(tmp_path: Path) -> None:
+    backend = LocalDirectoryBackend(tmp_path / "remote")
+    manifest = UploadManifest(tmp_path / "manifest.json")
+    items = run_upload_items("r1", **_run_files(tmp_path / "docs", "r1"))
+    upload_artifacts(backend, items, manifest=manifest)
+
+    # Bucket reset: the object and its sidecar are gone, the manifest still lists them.
+    (tmp_path / "remote" / "packs" / "r1.zip").unlink()
+    (tmp_path / "remote" / "packs" / "r1.zip.sha256").unlink()
+    again = upload_artifacts(backend, items, manifest=manifest)
+    assert [r.object_name for r in again if not r.skipped] == ["r1.zip"]
+    assert (tmp_path / "remote" / "packs" / "r1.zip").read_bytes() == b"r1:pack_zip"
+
+    forced = upload_artifacts(backend, items, manifest=manifest, force=True)
+    assert all(r.ok and not r.skipped for r in forced)
+
+
+def test_missing_file_is_reported_per_object(tmp_path: Path) -> None:
+    paths = _run_files(tmp_path, "r1")
+    paths["evidence_json"].unlink()
+    results = upload_artifacts_for_run(
+        None, run_id="r1", backend=LocalDirectoryBackend(tmp_path / "remote"), **paths
+    )
+    assert [r.ok for r in results] == [True, True, False]
+    assert results[2].message.startswith("file not found")
+
+
+class _FakeBucket:
+    def __init__(self, seen: list[Any]) -> None:
+        self.seen = seen
+
+    def upload(self, name: str, body: Any, file_options: dict[str, str]) -> Any:
+        self.seen.append((name, body))
+        return None
+
+    def list(self, path: Any = None, options: Any = None) -> list[dict[str, Any]]:
+        self.seen.append(("list", path, options))
+        return [{"name": "r1.json"}, {"name": "r10.json"}]
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.seen: list[Any] = []
+        self.storage = self
+
+    def from_(self, bucket: str) -> _FakeBucket:
+        return _FakeBucket(self.seen)
+
+
+def test_supabase_path_upload_streams_a_file_object(tmp_path: Path) -> None:
+    p = tmp_path / "big.zip"
+    p.write_bytes(b"x" * 1024)
+    client = _FakeClient()
+    res = upload_file_path(client, bucket="packs", object_name="big.zip", path=p, content_type="application/zip")
+    assert res.ok
+    assert isinstance(client.seen[0][1], io.BufferedReader)
+
+
+def test_supabase_exists_lists_the_object(tmp_path: Path) -> None:
+    client = _FakeClient()
+    backend = SupabaseStorageBackend(client)
+    assert backend.exists("audit", "r1.json") is True
+    assert backend.exists("audit", "r2.json") is False
+    assert client.seen[0] == ("list", None, {"search": "r1.json"})
@@ -3,6 +3,8 @@
 Backfill Supabase ``public.runs`` (or equivalent exposed table) into GovAI ``console.runs``.
 
 Idempotent: uses ``INSERT ... ON CONFLICT (id) DO UPDATE`` (same as ``aigov_py.govai_postgres_runs``).
+Each page is written in one batch (``upsert_run_rows``: COPY into a temp table + one merge)
+over a pooled connection, so the backfill opens one database connection, not one per row.
 
 Required environment
 ---------------------
@@ -56,7 +58,7 @@ def _truthy(name: str) -> bool:
 
 
 def _normalize_row(row: dict) -> dict:
-    """Ensure keys match ``upsert_run_row_postgres`` expectations; drop extras."""
+    """Ensure keys match ``upsert_run_rows`` expectations; drop extras."""
     out = {}
     for k in (
         "id",
@@ -96,7 +98,7 @@ def main() -> int:
         return 2
 
     try:
-        from aigov_py.govai_postgres_runs import upsert_run_row_postgres
+        from aigov_py.govai_postgres_runs import upsert_run_rows
     except ImportError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2
@@ -117,13 +119,10 @@ def main() -> int:
         rows = getattr(resp, "data", None) or []
         if not rows:
             break
-        for raw in rows:
-            row = _normalize_row(raw if isinstance(raw, dict) else dict(raw))
-            if dry:
-                pass
-            else:
-                upsert_run_row_postgres(row)
-            total += 1
+        batch = [_normalize_row(raw if isinstance(raw, dict) else dict(raw)) for raw in rows]
+        if not dry:
+            upsert_run_rows(batch)
+        total += len(batch)
         print(f"backfill: processed offset={offset} batch={len(rows)} cumulative_rows={total} dry_run={dry}")
         if len(rows) < page_size:
             break
@@ -13,12 +13,18 @@ Required environment
 Optional
 --------
   ``PARITY_LAST_N`` — default ``50``; number of newest rows to compare (by ``created_at`` desc, ``id`` asc).
+  ``PARITY_STREAM`` — if ``1``/``true``/``yes``, run the streaming mode (see below) instead.
+  ``PARITY_BUCKET`` — streaming mode bucket: ``day`` (default; UTC day of ``created_at``) or ``prefix`` (``id`` prefix).
+  ``PARITY_ID_PREFIX_LEN`` — default ``2``; ``id`` prefix length for ``PARITY_BUCKET=prefix``.
+  ``PARITY_PAGE_SIZE`` — default ``1000``; keyset page size for streaming mode.
 
 Assumptions
 -----------
   * Supabase table ``runs`` with columns matching ``console.runs`` (see migration ``0004``).
-  * Staging / canary sized datasets: this script loads **all** rows from both sides into memory.
-    For very large tables, run against a snapshot or extend with sampling (not implemented here).
+  * Default mode: staging / canary sized datasets; it loads **all** rows from both sides into memory.
+  * Streaming mode (``PARITY_STREAM=1``, for large tables): both sides are paged by ``(created_at, id)``
+    keyset and reduced to per-bucket digests (``aigov_py.runs_parity``); only buckets whose digests
+    differ are fetched again and diffed row by row. Memory stays bounded by the bucket count.
 
 Dependencies
 ------------
@@ -40,6 +46,7 @@ _REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_REPO_ROOT / "python"))
 
 from aigov_py.psycopg_database_url import resolve_psycopg_database_url
+from aigov_py import runs_parity
 
 RUN_COLUMNS = (
     "id,created_at,mode,status,policy_version,"
@@ -123,6 +130,59 @@ def _row_sig(r: dict[str, Any]) -> tuple:
     )
 
 
+def _main_stream(sb: Any, psycopg: Any, db_url: str) -> int:
+    bucket = (os.environ.get("PARITY_BUCKET") or "day").strip().lower()
+    if bucket not in runs_parity.BUCKET_MODES:
+        print(f"FAIL: PARITY_BUCKET must be one of {', '.join(runs_parity.BUCKET_MODES)}")
+        return 1
+    page_size = max(1, int(os.environ.get("PARITY_PAGE_SIZE", "1000") or "1000"))
+    prefix_len = max(1, int(os.environ.get("PARITY_ID_PREFIX_LEN", "2") or "2"))
+
+    with psycopg.connect(db_url) as conn:
+        report = runs_parity.compare_runs(
+            runs_parity.SupabaseRunsSource(sb),
+            runs_parity.PostgresRunsSource(conn),
+            bucket=bucket,
+            prefix_len=prefix_len,
+            page_size=page_size,
+        )
+
+    mismatch = sorted(report.field_mismatch)
+    checks = [
+        ("row_count", report.source_rows == report.target_rows, f"source={report.source_rows} target={report.target_rows}"),
+        (
+            f"bucket_digests_{bucket}",
+            report.ok,
+            f"buckets={report.buckets} mismatched={len(report.mismatched_buckets)} sample={report.mismatched_buckets[:5]}",
+        ),
+        (
+            "missing_ids_in_target",
+            not report.missing_in_target,
+            f"missing={len(report.missing_in_target)} sample={report.missing_in_target[:5]}",
+        ),
+        (
+            "extra_ids_in_target",
+            not report.extra_in_target,
+            f"extra={len(report.extra_in_target)} sample={report.extra_in_target[:5]}",
+        ),
+        (
+            "field_mismatch",
+            not mismatch,
+            f"mismatch={len(mismatch)} sample={[(i, report.field_mismatch[i]) for i in mismatch[:5]]}",
+        ),
+    ]
+
+    print("=== console.runs parity check (streaming) ===\n")
+    for name, ok, detail in checks:
+        print(f"[{'PASS' if ok else 'FAIL'}] {name}: {detail}")
+    print()
+    if all(ok for _, ok, _ in checks):
+        print("SUMMARY: PASS (all checks green)")
+        return 0
+    print("SUMMARY: FAIL (see FAIL lines above)")
+    return 1
+
+
 def main() -> int:
     supabase_url = (os.environ.get("SUPABASE_URL") or "").strip()
     supabase_key = (os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or "").strip()
@@ -143,6 +203,9 @@ def main() -> int:
         print(f"FAIL: missing dependency ({e}). pip install supabase 'psycopg[binary]'")
         return 1
 
+    if os.environ.get("PARITY_STREAM", "").strip().lower() in ("1", "true", "yes", "y", "on"):
+        return _main_stream(create_client(supabase_url, supabase_key), psycopg, db_url)
+
     last_n = int(os.environ.get("PARITY_LAST_N", "50") or "50")
     last_n = max(1, min(last_n, 500))
 